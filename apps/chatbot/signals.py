@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+
+from apps.core.conditional import touch_on_commit
+
+
+def _on_chat_log_changed(sender, instance, **kwargs):
+    # 대화 목록 / 기록의 조건부 GET 워터마크 갱신 (비로그인 대화는 조건부 GET 대상 아님)
+    if instance.user_id_id is not None:
+        touch_on_commit("chat_sessions", instance.user_id_id)
+
+
+def connect():
+    post_save.connect(
+        _on_chat_log_changed,
+        sender="chatbot.AiChatLogs",
+        dispatch_uid="chatbot_sessions_watermark",
+    )
+    post_delete.connect(
+        _on_chat_log_changed,
+        sender="chatbot.AiChatLogs",
+        dispatch_uid="chatbot_sessions_watermark",
+    )
@@ -2,32 +2,52 @@ import os
 from functools import lru_cache
 from typing import List
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 
+from apps.core.aio import loop_local
 
-@lru_cache
-def get_openai_client() -> OpenAI:
+
+def _api_key() -> str:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError(
             "OPENAI_API_KEY 환경변수가 설정되어 있지 않습니다. "
             "로컬에서는 .env에, CI에서는 GitHub Secrets에 등록해야 합니다."
         )
-    return OpenAI(api_key=api_key)
+    return api_key
 
 
-def ask_gpt(prompt: str) -> str:
+@lru_cache
+def get_openai_client() -> OpenAI:
+    return OpenAI(api_key=_api_key())
+
+
+@loop_local
+def get_async_openai_client() -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=_api_key())
+
+
+def _build_request(prompt: str) -> dict:
     messages: List[ChatCompletionMessageParam] = [  # type: ignore[assignment]
         {"role": "system", "content": "너는 날씨 기반 패션 코디 추천 봇이야."},
         {"role": "user", "content": prompt},
     ]
+    return {"model": "gpt-4o", "messages": messages, "temperature": 1.0}
 
+
+def ask_gpt(prompt: str) -> str:
     client = get_openai_client()
-    response: ChatCompletion = client.chat.completions.create(
-        model="gpt-4o",
-        messages=messages,
-        temperature=1.0,
+    response: ChatCompletion = client.chat.completions.create(**_build_request(prompt))
+
+    return (response.choices[0].message.content or "").strip()
+
+
+async def aask_gpt(prompt: str) -> str:
+    """ask_gpt 의 async 버전 - 응답을 기다리는 동안 워커가 다른 요청을 처리"""
+    client = get_async_openai_client()
+    response: ChatCompletion = await client.chat.completions.create(
+        **_build_request(prompt)
     )
 
     return (response.choices[0].message.content or "").strip()
@@ -1,17 +1,24 @@
+from adrf import viewsets as async_viewsets
 from django.shortcuts import render
 from django.utils import timezone
 from rest_framework import permissions, status, viewsets
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+from apps.core.views import ConditionalGetMixin, ReplicaReadMixin
+
 from .models import AiChatLogs
 from .serializer import AiChatLogReadSerializer, SessionSummarySerializer
-from .utils import ask_gpt
+from .utils import aask_gpt
 
 
-class AiChatViewSet(viewsets.ViewSet):
+class AiChatViewSet(async_viewsets.ViewSet):
+    """
+    POST /api/chat/send/
+    OpenAI 응답을 기다리는 동안 워커를 점유하지 않도록 async 로 처리 (ASGI 모드)
+    """
 
-    def create(self, request):
+    async def create(self, request):
         user = request.user if request.user.is_authenticated else None
         question = request.data.get("question")
 
@@ -20,9 +27,9 @@ class AiChatViewSet(viewsets.ViewSet):
                 {"error": "AI 대화 실패"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        answer = ask_gpt(question)
+        answer = await aask_gpt(question)
 
-        chat_log = AiChatLogs.objects.create(
+        chat_log = await AiChatLogs.objects.acreate(
             user=user,
             user_question=question,
             ai_answer=answer,
@@ -42,8 +49,11 @@ class ChatPagination(PageNumberPagination):
     max_page_size = 200
 
 
-class SessionViewSet(viewsets.ViewSet):
+class SessionViewSet(ConditionalGetMixin, ReplicaReadMixin, viewsets.ViewSet):
     permission_classes = [permissions.AllowAny]
+    # 로그인 사용자의 대화 목록 / 기록은 새 대화가 없으면 304
+    conditional_user_scopes = ("chat_sessions",)
+    conditional_actions = ("list", "retrieve")
 
     def _base_queryset(self, request):
         qs = AiChatLogs.objects.all()
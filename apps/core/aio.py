@@ -0,0 +1,57 @@
+import asyncio
+import functools
+import inspect
+import threading
+import weakref
+
+
+async def _close_on_shutdown(instance):
+    """
+    루프 종료 직전(asyncio.run / asgiref 의 shutdown_asyncgens 단계)에 마무리되는 async generator
+    - WSGI 에서 요청마다 만들어진 루프가 끝날 때 커넥션 풀을 닫음 (소켓이 GC 까지 남지 않도록)
+    """
+    try:
+        yield
+    finally:
+        close = getattr(instance, "aclose", None) or getattr(instance, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+
+def loop_local(factory):
+    """
+    이벤트 루프별로 한 번만 만드는 객체 (httpx.AsyncClient 등 루프에 묶인 커넥션 풀)
+    - uvicorn 워커: 프로세스당 루프 1개 → 객체 1개를 계속 재사용
+    - WSGI 에서 async 뷰 실행 시 요청마다 루프가 새로 생기므로 닫힌 루프의 풀을 쓰지 않도록 분리
+    - 루프가 종료될 때 객체의 aclose() / close() 호출
+    """
+    instances = weakref.WeakKeyDictionary()
+    closers = weakref.WeakKeyDictionary()
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def get():
+        loop = asyncio.get_running_loop()
+        instance = instances.get(loop)
+        if instance is None:
+            with lock:
+                instance = instances.get(loop)
+                if instance is None:
+                    instance = instances[loop] = factory()
+                    closers[loop] = _start_closer(instance)
+        return instance
+
+    return get
+
+
+def _start_closer(instance):
+    # 첫 yield 까지 실행해 두면 루프의 async generator 목록에 등록되어 종료 시 aclose() 됨
+    # (루프가 약한 참조로만 들고 있으므로 반환값을 루프 수명 동안 보관해야 함)
+    closer = _close_on_shutdown(instance)
+    try:
+        closer.asend(None).send(None)
+    except StopIteration:
+        pass
+    return closer
@@ -0,0 +1,148 @@
+import os
+import zlib
+from datetime import timedelta
+
+from django.apps import apps
+from django.core import serializers
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from .models import ArchivedRow
+
+# soft delete 후 이 기간이 지난 행을 아카이브
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+# 유효 시각이 이 기간보다 오래된 날씨 데이터는 삭제 여부와 무관하게 아카이브
+WEATHER_RETENTION_DAYS = int(os.getenv("WEATHER_RETENTION_DAYS", "180"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+
+
+def _soft_deleted(model, now):
+    return model.all_objects.filter(
+        deleted_at__lt=now - timedelta(days=ARCHIVE_AFTER_DAYS)
+    )
+
+
+def _expired_weather(model, now):
+    Diary = apps.get_model("diary", "Diary")
+    expired = Q(deleted_at__lt=now - timedelta(days=ARCHIVE_AFTER_DAYS)) | Q(
+        valid_time__lt=now - timedelta(days=WEATHER_RETENTION_DAYS)
+    )
+    # 일기가 참조 중인 날씨는 CASCADE 로 일기까지 지워지므로 제외 (삭제된 일기 포함)
+    return model.all_objects.filter(expired).exclude(
+        Exists(Diary.all_objects.filter(weather_data=OuterRef("pk")))
+    )
+
+
+# 모델 → 아카이브 대상 조건 (순서대로 처리 - 일기가 먼저 빠져야 날씨가 대상이 됨)
+ARCHIVE_POLICIES = {
+    "diary.Diary": _soft_deleted,
+    "locations.FavoriteLocation": _soft_deleted,
+    "weather.WeatherData": _expired_weather,
+}
+
+
+def _weather_payloads(rows):
+    # 원본 응답은 다른 행과 공유될 수 있으므로 행마다 blob 에 함께 보관 (복구 시 없을 때만 생성)
+    WeatherPayload = apps.get_model("weather", "WeatherPayload")
+    payloads = WeatherPayload.objects.in_bulk(
+        {row.payload_id for row in rows if row.payload_id}
+    )
+    return {
+        row.pk: [payloads[row.payload_id]] if row.payload_id else [] for row in rows
+    }
+
+
+def _delete_unreferenced_payloads(rows):
+    # 원본 응답이 행 크기의 대부분 - 더 이상 참조하는 날씨가 없으면 함께 삭제 (삭제된 날씨 포함)
+    WeatherData = apps.get_model("weather", "WeatherData")
+    WeatherPayload = apps.get_model("weather", "WeatherPayload")
+    WeatherPayload.objects.filter(
+        digest__in={row.payload_id for row in rows if row.payload_id}
+    ).exclude(Exists(WeatherData.all_objects.filter(payload=OuterRef("pk")))).delete()
+
+
+# 모델 → 행과 함께 보관할 참조 대상 / 원본 행 삭제 후 정리 작업
+ARCHIVE_RELATED = {"weather.WeatherData": _weather_payloads}
+ARCHIVE_CLEANUPS = {"weather.WeatherData": _delete_unreferenced_payloads}
+
+
+def archivable_queryset(model_label, now=None):
+    model = apps.get_model(model_label)
+    return ARCHIVE_POLICIES[model_label](model, now or timezone.now())
+
+
+def archive_batch(model_label, batch_size=ARCHIVE_BATCH_SIZE, now=None):
+    """
+    대상 행을 최대 batch_size 개 아카이브 테이블로 옮김 (한 트랜잭션)
+    반환: 옮긴 행 수 (0 이면 더 이상 대상 없음)
+    """
+    model = apps.get_model(model_label)
+    with transaction.atomic():
+        rows = list(
+            archivable_queryset(model_label, now)
+            .order_by("pk")
+            .select_for_update(skip_locked=True)[:batch_size]
+        )
+        if not rows:
+            return 0
+        related = ARCHIVE_RELATED.get(model_label, lambda rows: {})(rows)
+        ArchivedRow.objects.bulk_create(
+            [
+                ArchivedRow(
+                    model_label=model_label,
+                    object_id=row.pk,
+                    payload=zlib.compress(
+                        serializers.serialize(
+                            "json", [*related.get(row.pk, []), row]
+                        ).encode()
+                    ),
+                    deleted_at=row.deleted_at,
+                )
+                for row in rows
+            ]
+        )
+        model.all_objects.filter(pk__in=[row.pk for row in rows]).hard_delete()
+        if model_label in ARCHIVE_CLEANUPS:
+            ARCHIVE_CLEANUPS[model_label](rows)
+    return len(rows)
+
+
+def _restore_dependencies(instance):
+    # 참조 대상(예: 일기의 날씨)도 아카이브되어 있으면 먼저 복구
+    for field in instance._meta.concrete_fields:
+        if not field.is_relation:
+            continue
+        target_id = getattr(instance, field.attname)
+        related = field.related_model
+        if target_id is None or related._base_manager.filter(pk=target_id).exists():
+            continue
+        restore_rows(related._meta.label, [target_id])
+
+
+def restore_rows(model_label, object_ids):
+    """
+    아카이브된 행을 원래 테이블로 복구 (pk / 생성 시각 등 원래 값 그대로)
+    반환: 복구한 행 수
+    """
+    restored = 0
+    with transaction.atomic():
+        archived = ArchivedRow.objects.select_for_update().filter(
+            model_label=model_label, object_id__in=object_ids
+        )
+        for row in archived:
+            for obj in serializers.deserialize(
+                "json", zlib.decompress(bytes(row.payload))
+            ):
+                instance = obj.object
+                if instance._meta.label != model_label:
+                    # 함께 보관한 참조 대상 - 아직 남아 있으면 기존 행 사용
+                    manager = instance._meta.model._base_manager
+                    if not manager.filter(pk=instance.pk).exists():
+                        obj.save()
+                    continue
+                _restore_dependencies(instance)
+                obj.save()
+            row.delete()
+            restored += 1
+    return restored
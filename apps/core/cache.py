@@ -0,0 +1,255 @@
+import asyncio
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from .metrics import LatencyHistogram
+
+# 조기 만료 강도 (XFetch beta) - 클수록 만료 전에 더 일찍 다시 계산
+CACHE_EARLY_EXPIRY_BETA = float(os.getenv("CACHE_EARLY_EXPIRY_BETA", "1"))
+# 재계산 락 유지 시간 (초) - 계산 중 프로세스가 죽어도 이 시간 뒤에 풀림
+CACHE_LOCK_TIMEOUT = int(os.getenv("CACHE_LOCK_TIMEOUT", "30"))
+# 값이 없고 다른 프로세스가 계산 중일 때 기다리는 최대 시간 (초) - 넘으면 직접 계산
+CACHE_LOCK_WAIT = float(os.getenv("CACHE_LOCK_WAIT", "3"))
+CACHE_LOCK_POLL = 0.05
+
+# 캐시 조회 지연시간 버킷 (초 단위 - 네트워크 왕복 1회 수준)
+CACHE_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class Computed:
+    """get_or_set 으로 저장되는 값 (계산 소요 시간 / 만료 시각을 함께 저장)"""
+
+    value: object
+    delta: float
+    expires_at: float | None
+
+    def should_refresh(self, beta=CACHE_EARLY_EXPIRY_BETA):
+        """
+        XFetch 조기 만료 판정
+        - 만료가 가까울수록, 계산이 오래 걸리는 값일수록 확률적으로 먼저 재계산
+        - 요청마다 난수로 판정하므로 만료 시점에 재계산이 한꺼번에 몰리지 않음
+        """
+        if self.expires_at is None:
+            return False
+        jitter = -self.delta * beta * math.log(1.0 - random.random())
+        return time.time() + jitter >= self.expires_at
+
+
+class CacheNamespace:
+    """
+    앱별 캐시 네임스페이스
+    - 키: "<name>:<key>", version 은 Django 캐시 키 버전으로 전달 (올리면 이전 키 전체 무효화)
+    - 조회마다 hit / miss / 지연시간을 네임스페이스별로 기록
+    - get_or_set 으로 저장한 키는 get_or_set / refresh 로만 다룸 (Computed 로 감싸서 저장)
+    """
+
+    def __init__(self, name, version=1, timeout=DEFAULT_TIMEOUT):
+        self.name = name
+        self.version = version
+        self.timeout = timeout
+        self.latency = LatencyHistogram(CACHE_LATENCY_BUCKETS)
+        self._counts = {"hits": 0, "misses": 0, "early_refreshes": 0, "lock_waits": 0}
+        self._lock = threading.Lock()
+
+    def key(self, key):
+        return f"{self.name}:{key}"
+
+    def _lock_key(self, key):
+        return f"{self.name}:lock:{key}"
+
+    def _timeout(self, timeout):
+        if timeout is not DEFAULT_TIMEOUT:
+            return timeout
+        if self.timeout is not DEFAULT_TIMEOUT:
+            return self.timeout
+        return cache.default_timeout
+
+    def _count(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def _record(self, value, started):
+        self.latency.observe(time.perf_counter() - started)
+        self._count("misses" if value is _MISSING else "hits")
+
+    # 기본 연산
+
+    def get(self, key, default=None):
+        started = time.perf_counter()
+        value = cache.get(self.key(key), _MISSING, version=self.version)
+        self._record(value, started)
+        return default if value is _MISSING else value
+
+    async def aget(self, key, default=None):
+        started = time.perf_counter()
+        value = await cache.aget(self.key(key), _MISSING, version=self.version)
+        self._record(value, started)
+        return default if value is _MISSING else value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        cache.set(
+            self.key(key), value, timeout=self._timeout(timeout), version=self.version
+        )
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT):
+        await cache.aset(
+            self.key(key), value, timeout=self._timeout(timeout), version=self.version
+        )
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT):
+        """키가 없을 때만 저장 - 반환: 저장 여부"""
+        return cache.add(
+            self.key(key), value, timeout=self._timeout(timeout), version=self.version
+        )
+
+    def delete(self, key):
+        cache.delete(self.key(key), version=self.version)
+
+    def bump(self, key):
+        """버전 카운터 증가 (없으면 1) - 반환: 새 값"""
+        cache.add(self.key(key), 0, timeout=None, version=self.version)
+        try:
+            return cache.incr(self.key(key), version=self.version)
+        except ValueError:
+            # add 와 incr 사이에 키가 지워진 경우
+            cache.set(self.key(key), 1, timeout=None, version=self.version)
+            return 1
+
+    # 계산 결과 캐시 (스탬피드 방지)
+
+    def refresh(self, key, compute, timeout=DEFAULT_TIMEOUT):
+        """compute() 결과를 바로 저장 (수집 직후 미리 계산 / 무효화 후 재계산용)"""
+        timeout = self._timeout(timeout)
+        started = time.monotonic()
+        value = compute()
+        self._store(key, value, time.monotonic() - started, timeout)
+        return value
+
+    async def arefresh(self, key, compute, timeout=DEFAULT_TIMEOUT):
+        timeout = self._timeout(timeout)
+        started = time.monotonic()
+        value = await sync_to_async(compute)()
+        await sync_to_async(self._store)(
+            key, value, time.monotonic() - started, timeout
+        )
+        return value
+
+    def _store(self, key, value, delta, timeout):
+        expires_at = None if timeout is None else time.time() + timeout
+        cache.set(
+            self.key(key),
+            Computed(value, delta, expires_at),
+            timeout=timeout,
+            version=self.version,
+        )
+
+    def _fresh(self, entry):
+        if entry is _MISSING:
+            return False
+        if entry.should_refresh():
+            self._count("early_refreshes")
+            return False
+        return True
+
+    def get_or_set(self, key, compute, timeout=DEFAULT_TIMEOUT):
+        """
+        캐시된 compute() 결과
+        - 만료 전에도 XFetch 로 확률적으로 재계산
+        - 재계산은 락을 잡은 프로세스 1곳만 수행, 나머지는 이전 값을 그대로 반환
+        - 이전 값이 없으면 계산이 끝날 때까지 최대 CACHE_LOCK_WAIT 초 대기
+        """
+        started = time.perf_counter()
+        entry = cache.get(self.key(key), _MISSING, version=self.version)
+        self._record(entry, started)
+        if self._fresh(entry):
+            return entry.value
+
+        lock_key = self._lock_key(key)
+        if cache.add(lock_key, 1, timeout=CACHE_LOCK_TIMEOUT, version=self.version):
+            try:
+                return self.refresh(key, compute, timeout)
+            finally:
+                cache.delete(lock_key, version=self.version)
+        if entry is not _MISSING:
+            return entry.value
+
+        self._count("lock_waits")
+        deadline = time.monotonic() + CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(CACHE_LOCK_POLL)
+            entry = cache.get(self.key(key), _MISSING, version=self.version)
+            if entry is not _MISSING:
+                return entry.value
+        return self.refresh(key, compute, timeout)
+
+    async def aget_or_set(self, key, compute, timeout=DEFAULT_TIMEOUT):
+        """get_or_set 의 async 버전 (compute 는 sync 함수, 스레드에서 실행)"""
+        started = time.perf_counter()
+        entry = await cache.aget(self.key(key), _MISSING, version=self.version)
+        self._record(entry, started)
+        if self._fresh(entry):
+            return entry.value
+
+        lock_key = self._lock_key(key)
+        if await cache.aadd(
+            lock_key, 1, timeout=CACHE_LOCK_TIMEOUT, version=self.version
+        ):
+            try:
+                return await self.arefresh(key, compute, timeout)
+            finally:
+                await cache.adelete(lock_key, version=self.version)
+        if entry is not _MISSING:
+            return entry.value
+
+        self._count("lock_waits")
+        deadline = time.monotonic() + CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(CACHE_LOCK_POLL)
+            entry = await cache.aget(self.key(key), _MISSING, version=self.version)
+            if entry is not _MISSING:
+                return entry.value
+        return await self.arefresh(key, compute, timeout)
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts["hits"] + counts["misses"]
+        return {
+            **counts,
+            "hit_ratio": round(counts["hits"] / lookups, 4) if lookups else None,
+            "latency": self.latency.snapshot(),
+        }
+
+
+_namespaces = {}
+_namespaces_lock = threading.Lock()
+
+
+def namespace(name, version=1, timeout=DEFAULT_TIMEOUT):
+    """이름별 CacheNamespace (모듈 전역에서 한 번 만들어 재사용)"""
+    with _namespaces_lock:
+        ns = _namespaces.get(name)
+        if ns is None:
+            ns = _namespaces[name] = CacheNamespace(name, version, timeout)
+        return ns
+
+
+def cache_stats():
+    """네임스페이스별 hit / miss / 지연시간 (현재 워커 프로세스 기준)"""
+    with _namespaces_lock:
+        namespaces = list(_namespaces.values())
+    return {
+        "backend": type(caches["default"]).__name__,
+        "namespaces": {ns.name: ns.stats() for ns in namespaces},
+    }
@@ -0,0 +1,65 @@
+import hashlib
+import os
+import time
+from functools import partial
+
+from django.db import transaction
+from django.utils.http import parse_etags, parse_http_date_safe
+
+from .cache import namespace
+
+# 변경이 없던 워터마크가 캐시에서 사라지는 시간 (초) - 사라지면 다음 조회 시 새로 만들어 한 번 200 응답
+WATERMARK_TIMEOUT = int(os.getenv("CONDITIONAL_WATERMARK_TIMEOUT", str(7 * 86400)))
+
+watermark_cache = namespace("conditional.watermark", timeout=WATERMARK_TIMEOUT)
+
+
+def _key(scope, user_id):
+    return scope if user_id is None else f"{scope}:{user_id}"
+
+
+def touch(scope, user_id=None):
+    """scope 데이터 변경 시 호출 - 이후 조건부 요청은 304 대신 새 응답을 받음"""
+    watermark_cache.set(_key(scope, user_id), time.time())
+
+
+def touch_on_commit(scope, user_id=None):
+    # 커밋 전에 갱신하면 다른 요청이 이전 데이터를 새 워터마크로 캐시할 수 있으므로 커밋 후 갱신
+    transaction.on_commit(partial(touch, scope, user_id))
+
+
+def watermark(scope, user_id=None):
+    """scope 의 마지막 변경 시각 (없으면 지금으로 초기화)"""
+    key = _key(scope, user_id)
+    stamp = watermark_cache.get(key)
+    if stamp is None:
+        stamp = time.time()
+        if not watermark_cache.add(key, stamp):
+            stamp = watermark_cache.get(key, stamp)
+    return stamp
+
+
+def make_etag(*parts):
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request, etag):
+    """If-None-Match 의 태그 목록 / * 중 etag 와 약한 비교로 일치하는 것이 있는지"""
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    return "*" in etags or etag.removeprefix("W/") in {
+        tag.removeprefix("W/") for tag in etags
+    }
+
+
+def is_not_modified(request, etag, last_modified):
+    """
+    If-None-Match 가 있으면 ETag 로만 판단 (약한 비교), 없으면 If-Modified-Since 로 판단
+    Last-Modified 는 초 단위이므로 ETag 를 보내는 클라이언트가 더 정확함
+    """
+    if request.headers.get("If-None-Match"):
+        return etag_matches(request, etag)
+    if_modified_since = parse_http_date_safe(
+        request.headers.get("If-Modified-Since", "")
+    )
+    return if_modified_since is not None and int(last_modified) <= if_modified_since
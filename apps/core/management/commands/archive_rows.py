@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.core.archive import (
+    ARCHIVE_BATCH_SIZE,
+    ARCHIVE_POLICIES,
+    archivable_queryset,
+    archive_batch,
+)
+
+
+class Command(BaseCommand):
+    help = "오래전에 soft delete 된 행 / 보관 기간이 지난 날씨 데이터를 아카이브 테이블로 이동"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model", choices=list(ARCHIVE_POLICIES), help="특정 모델만 처리"
+        )
+        parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+        parser.add_argument(
+            "--max-batches", type=int, default=None, help="모델당 최대 배치 수"
+        )
+        parser.add_argument(
+            "--sleep", type=float, default=0.0, help="배치 사이 대기 시간(초)"
+        )
+        parser.add_argument("--dry-run", action="store_true", help="대상 행 수만 출력")
+
+    def handle(self, *args, **options):
+        labels = [options["model"]] if options["model"] else list(ARCHIVE_POLICIES)
+
+        for label in labels:
+            if options["dry_run"]:
+                count = archivable_queryset(label).count()
+                self.stdout.write(f"{label}: 대상 {count}건")
+                continue
+
+            total = batches = 0
+            while options["max_batches"] is None or batches < options["max_batches"]:
+                moved = archive_batch(label, options["batch_size"])
+                if not moved:
+                    break
+                total += moved
+                batches += 1
+                if options["sleep"]:
+                    time.sleep(options["sleep"])
+            self.stdout.write(self.style.SUCCESS(f"{label}: {total}건 아카이브"))
@@ -0,0 +1,94 @@
+import io
+import itertools
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.chatbot.models import AiChatLogs
+from apps.chatbot.serializer import AiChatLogReadSerializer
+from apps.core.renderers import ORJSONParser, ORJSONRenderer, orjson
+from apps.diary.models import Diary
+from apps.diary.serializers import DiaryDetailSerializer
+from apps.locations.models import FavoriteLocation
+from apps.locations.serializers import FavoriteLocationSerializer
+from apps.weather.models import WeatherAlert, WeatherData
+from apps.weather.serializers import WeatherAlertSerializer, WeatherDataSerializer
+
+# (이름, 직렬화기, 쿼리셋) - 목록 API 에서 실제로 쓰는 조합
+DATASETS = [
+    (
+        "diary",
+        DiaryDetailSerializer,
+        Diary.objects.select_related("weather_data__location"),
+    ),
+    ("chat", AiChatLogReadSerializer, AiChatLogs.objects.all()),
+    ("weather", WeatherDataSerializer, WeatherData.objects.select_related("location")),
+    ("alerts", WeatherAlertSerializer, WeatherAlert.objects.select_related("location")),
+    (
+        "favorites",
+        FavoriteLocationSerializer,
+        FavoriteLocation.objects.select_related("location"),
+    ),
+]
+
+
+def _best(fn, repeat):
+    """repeat 번 실행 중 가장 빠른 시간 (ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+class Command(BaseCommand):
+    help = "목록 API 직렬화기로 1천 건당 직렬화 / JSON 렌더링 / 파싱 시간 측정 (기본 vs orjson)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--objects", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write("orjson 이 설치되어 있지 않음")
+            return
+
+        n, repeat = options["objects"], options["repeat"]
+        scale = 1000 / n
+        self.stdout.write(
+            f"{'':10} {'serialize':>10} {'render':>8} {'orjson':>8} "
+            f"{'parse':>8} {'orjson':>8} {'KB':>7}  (ms / 1천 건)"
+        )
+        for name, serializer_class, queryset in DATASETS:
+            rows = list(queryset[:n])
+            if not rows:
+                self.stdout.write(f"{name:10} 데이터 없음")
+                continue
+            # 행이 부족하면 같은 행을 반복해 n 건을 채움
+            objects = list(itertools.islice(itertools.cycle(rows), n))
+
+            data = serializer_class(objects, many=True).data
+            body = JSONRenderer().render(data)
+            fast_body = ORJSONRenderer().render(data)
+            same = JSONParser().parse(io.BytesIO(body)) == ORJSONParser().parse(
+                io.BytesIO(fast_body)
+            )
+
+            timings = [
+                _best(lambda: serializer_class(objects, many=True).data, repeat),
+                _best(lambda: JSONRenderer().render(data), repeat),
+                _best(lambda: ORJSONRenderer().render(data), repeat),
+                _best(lambda: JSONParser().parse(io.BytesIO(body)), repeat),
+                _best(lambda: ORJSONParser().parse(io.BytesIO(body)), repeat),
+            ]
+            self.stdout.write(
+                f"{name:10} "
+                + " ".join(
+                    f"{t * scale:{w}.2f}" for t, w in zip(timings, (10, 8, 8, 8, 8))
+                )
+                + f" {len(body) * scale / 1024:7.1f}"
+                + ("" if same else "  (출력 불일치)")
+            )
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.archive import restore_rows
+
+
+class Command(BaseCommand):
+    help = "아카이브된 행을 원래 테이블로 복구 (예: restore_archived diary.Diary 12 15)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("model_label")
+        parser.add_argument("object_ids", nargs="+", type=int)
+
+    def handle(self, *args, **options):
+        restored = restore_rows(options["model_label"], options["object_ids"])
+        self.stdout.write(
+            self.style.SUCCESS(f"{options['model_label']}: {restored}건 복구")
+        )
@@ -0,0 +1,91 @@
+import bisect
+import threading
+
+# 지연시간 히스토그램 버킷 경계 (초 단위)
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+class LatencyHistogram:
+    """
+    프로세스 메모리에 누적되는 지연시간 히스토그램
+    - observe() 는 버킷 카운트 증가만 수행 (락 구간 최소화)
+    - snapshot() 으로 관리자 화면 / 로그에 노출
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        idx = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += seconds
+            self._count += 1
+
+    def snapshot(self):
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+
+        buckets = {}
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float("inf"),), counts):
+            cumulative += n
+            label = "+Inf" if bound == float("inf") else f"{bound * 1000:g}ms"
+            buckets[label] = cumulative
+        return {
+            "count": count,
+            "avg_ms": round(total / count * 1000, 2) if count else 0.0,
+            "buckets": buckets,
+        }
+
+
+def database_pool_stats():
+    """
+    DB 커넥션 풀 상태 (현재 워커 프로세스 기준, 풀을 쓰지 않는 DB 는 None)
+    - pool_available == 0 이면서 requests_waiting > 0: 풀 고갈 (요청이 연결을 기다리는 중)
+    - requests_errors: 대기 시간(timeout) 초과로 실패한 요청 수
+    """
+    from django.db import connections
+
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is None:
+            stats[alias] = None
+            continue
+        raw = pool.get_stats()
+        waits = raw.get("requests_queued", 0)
+        stats[alias] = {
+            "min_size": pool.min_size,
+            "max_size": pool.max_size,
+            "pool_size": raw.get("pool_size", 0),
+            "pool_available": raw.get("pool_available", 0),
+            "requests_waiting": raw.get("requests_waiting", 0),
+            "requests_num": raw.get("requests_num", 0),
+            "requests_queued": waits,
+            "requests_errors": raw.get("requests_errors", 0),
+            "avg_wait_ms": (
+                round(raw.get("requests_wait_ms", 0) / waits, 2) if waits else 0.0
+            ),
+            "connections_num": raw.get("connections_num", 0),
+            "connections_errors": raw.get("connections_errors", 0),
+            "exhausted": raw.get("pool_available", 0) == 0
+            and raw.get("requests_waiting", 0) > 0,
+        }
+    return stats
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedRow',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('model_label', models.CharField(max_length=100)),
+                ('object_id', models.BigIntegerField()),
+                ('payload', models.BinaryField()),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'archived_rows',
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('model_label', 'object_id'), name='uq_archived_row'
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,132 @@
+from django.db import models, transaction
+from django.utils import timezone
+
+from .signals import post_bulk_restore, post_bulk_soft_delete
+
+
+def _touch_fields(model):
+    # soft delete / 복구도 수정으로 보고 updated_at 갱신 (증분 집계의 워터마크 기준)
+    if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+        return {"updated_at": timezone.now()}
+    return {}
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    """
+    soft delete 모델용 QuerySet
+    - delete() / restore(): 일괄 soft delete / 복구 (UPDATE 한 번)
+      모델 post_save 대신 post_bulk_soft_delete / post_bulk_restore 전송 (apps/core/signals.py)
+    - hard_delete(): 실제 삭제
+    """
+
+    def alive(self):
+        return self.filter(deleted_at__isnull=True)
+
+    def dead(self):
+        return self.filter(deleted_at__isnull=False)
+
+    def _set_deleted_at(self, queryset, deleted_at, signal):
+        with transaction.atomic(using=self.db):
+            # 바뀔 행을 잠근 뒤 갱신 - 동시에 같은 행을 지워도 signal 의 행 / 개수가 중복되지 않음
+            pks = list(
+                queryset.select_for_update(of=("self",)).values_list("pk", flat=True)
+            )
+            if not pks:
+                return 0
+            changed = self.model._base_manager.using(self.db).filter(pk__in=pks)
+            count = changed.update(deleted_at=deleted_at, **_touch_fields(self.model))
+            signal.send(sender=self.model, queryset=changed, count=count, using=self.db)
+        return count
+
+    def delete(self):
+        return self._set_deleted_at(
+            self.filter(deleted_at__isnull=True), timezone.now(), post_bulk_soft_delete
+        )
+
+    delete.queryset_only = True
+
+    def restore(self):
+        return self._set_deleted_at(
+            self.filter(deleted_at__isnull=False), None, post_bulk_restore
+        )
+
+    restore.queryset_only = True
+
+    def hard_delete(self):
+        return super().delete()
+
+    hard_delete.queryset_only = True
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """기본 manager - 살아있는 행(deleted_at IS NULL)만 조회"""
+
+    def __init__(self, *, alive_only=True):
+        super().__init__()
+        self.alive_only = alive_only
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        return queryset.alive() if self.alive_only else queryset
+
+
+class SoftDeleteModel(models.Model):
+    """
+    Soft Delete 공통 모델
+    - objects: 살아있는 행만 / all_objects: 삭제된 행 포함
+    - FK 정방향 참조(diary.weather_data 등)는 Django 기본 _base_manager 를 쓰므로 삭제된 행도 조회됨
+    """
+
+    deleted_at = models.DateTimeField(blank=True, null=True)  # 삭제 시각 (Soft Delete)
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteManager(alive_only=False)
+
+    class Meta:
+        abstract = True  # DB 테이블 생성 안 함
+
+    @property
+    def is_deleted(self):
+        return self.deleted_at is not None
+
+    def _save_deleted_at(self):
+        touched = _touch_fields(type(self))
+        for field, value in touched.items():
+            setattr(self, field, value)
+        self.save(update_fields=["deleted_at", *touched])
+
+    def delete(self, using=None, keep_parents=False):
+        self.deleted_at = timezone.now()  # 실제 삭제 대신 삭제 시각 기록
+        self._save_deleted_at()
+
+    def restore(self):
+        self.deleted_at = None  # 삭제 복구
+        self._save_deleted_at()
+
+    def hard_delete(self, using=None, keep_parents=False):
+        return super().delete(using=using, keep_parents=keep_parents)
+
+
+class ArchivedRow(models.Model):
+    """
+    아카이브된 행 (apps/core/archive.py)
+    - 오래전에 soft delete 된 행 / 보관 기간이 지난 날씨 데이터를 원본 테이블에서 옮겨 보관
+    - payload: Django JSON 직렬화 결과를 zlib 압축
+    """
+
+    model_label = models.CharField(max_length=100)  # 예: diary.Diary
+    object_id = models.BigIntegerField()
+    payload = models.BinaryField()
+    deleted_at = models.DateTimeField(blank=True, null=True)  # 원본의 삭제 시각
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "archived_rows"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model_label", "object_id"], name="uq_archived_row"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model_label} #{self.object_id}"
@@ -0,0 +1,53 @@
+try:
+    import orjson
+except ImportError:  # 설치되지 않은 환경에서는 settings 에서 기본 JSONRenderer 사용
+    orjson = None
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# datetime 은 DRF 와 같은 형식(밀리초, "Z")으로 맞추기 위해 DRF 인코더에 맡김
+# Decimal / date / time / timedelta 등 orjson 이 모르는 타입도 DRF 인코더에서 처리
+# (UUID / dict / list / str / int / float 는 orjson 이 직접 처리)
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+)
+
+_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러 (JSONRenderer 와 같은 출력, C 구현으로 인코딩)
+    - ?indent / Accept 의 indent 요청은 2칸 들여쓰기로 처리
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=_encoder.default, option=options)
+
+        # JSONRenderer 와 동일하게 JS 안에 그대로 넣어도 안전하도록 줄 구분 문자 이스케이프
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    """orjson 기반 JSON 파서 (요청 본문은 UTF-8 만 허용 - JSON 표준)"""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
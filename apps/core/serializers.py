@@ -0,0 +1,67 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+class EagerLoadingMixin:
+    """
+    serializer 가 접근하는 관계 경로를 모아 queryset 에 자동 적용 (N+1 방지)
+    - 중첩 serializer 필드 / source="a.b" 형태 필드는 자동 수집
+    - SerializerMethodField 처럼 자동으로 알 수 없는 경로는 직접 선언
+        select_related_fields = ("location",)
+        prefetch_related_fields = ("tags",)
+    """
+
+    select_related_fields: tuple[str, ...] = ()
+    prefetch_related_fields: tuple[str, ...] = ()
+
+    @classmethod
+    def _is_relation(cls, name):
+        model = getattr(getattr(cls, "Meta", None), "model", None)
+        if model is None:
+            return False
+        try:
+            return model._meta.get_field(name).is_relation
+        except FieldDoesNotExist:
+            return False
+
+    @classmethod
+    def get_related_paths(cls, prefix=""):
+        """(select_related 경로, prefetch_related 경로) 반환"""
+        select = [prefix + path for path in cls.select_related_fields]
+        prefetch = [prefix + path for path in cls.prefetch_related_fields]
+
+        for name, field in getattr(cls, "_declared_fields", {}).items():
+            many = isinstance(field, serializers.ListSerializer)
+            child = field.child if many else field
+            source = field.source or name
+            if source == "*":
+                continue
+
+            if isinstance(child, serializers.BaseSerializer):
+                path = prefix + source.replace(".", "__")
+                (prefetch if many else select).append(path)
+                if isinstance(child, EagerLoadingMixin):
+                    nested_select, nested_prefetch = child.get_related_paths(
+                        path + "__"
+                    )
+                    # to-many 아래의 경로는 모두 prefetch 로 처리
+                    if many:
+                        prefetch.extend(nested_select)
+                    else:
+                        select.extend(nested_select)
+                    prefetch.extend(nested_prefetch)
+            elif "." in source:
+                relation = source.split(".", 1)[0]
+                if cls._is_relation(relation):
+                    select.append(prefix + relation)
+
+        return list(dict.fromkeys(select)), list(dict.fromkeys(prefetch))
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        select, prefetch = cls.get_related_paths()
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
@@ -0,0 +1,8 @@
+from django.db.models.signals import ModelSignal
+
+# SoftDeleteQuerySet 의 일괄 soft delete / 복구 후 전송 (UPDATE 한 번이라 모델 post_save 는 발생하지 않음)
+# - sender: 모델 클래스 (post_save 처럼 "app_label.Model" 문자열로 지연 연결 가능)
+# - queryset: 이번에 상태가 바뀐 행만 담은 QuerySet (pk__in)
+# - count: 바뀐 행 수
+post_bulk_soft_delete = ModelSignal(use_caching=True)
+post_bulk_restore = ModelSignal(use_caching=True)
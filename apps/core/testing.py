@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+@contextmanager
+def assert_max_queries(limit, using=DEFAULT_DB_ALIAS):
+    """
+    블록 안에서 실행된 쿼리 수가 limit 을 넘으면 실패 (N+1 회귀 감지용)
+
+        with assert_max_queries(2):
+            self.client.get("/api/diary/1/")
+    """
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+
+    executed = len(context)
+    if executed > limit:
+        queries = "\n".join(
+            f"{i}. {query['sql']}"
+            for i, query in enumerate(context.captured_queries, start=1)
+        )
+        raise AssertionError(
+            f"{executed} queries executed, expected at most {limit}:\n{queries}"
+        )
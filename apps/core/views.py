@@ -0,0 +1,114 @@
+import time
+
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from apps.db_router import REPLICA_STICKY_SECONDS, allow_replica_reads, pin_primary
+
+from .conditional import is_not_modified, make_etag, watermark
+
+
+class EagerLoadingViewMixin:
+    """
+    GenericAPIView 용 - serializer_class 가 EagerLoadingMixin 이면
+    list / retrieve 에서 select_related / prefetch_related 자동 적용
+    (뷰에서 get_queryset 을 재정의해도 적용되도록 filter_queryset 단계에서 처리)
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer_class = self.get_serializer_class()
+        setup = getattr(serializer_class, "setup_eager_loading", None)
+        if setup is not None:
+            queryset = setup(queryset)
+        return queryset
+
+
+class ReplicaReadMixin:
+    """
+    읽기 위주 뷰용 - GET / HEAD / OPTIONS 요청의 조회를 읽기 전용 replica 로 보냄
+    (인증 조회는 primary, 최근 쓰기가 있었던 사용자는 primary 고정 - apps.db_router 참고)
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS:
+            user = request.user
+            allow_replica_reads(user.pk if user.is_authenticated else None)
+
+
+class NotModified(Exception):
+    """ConditionalGetMixin 내부용 - initial() 에서 뷰 실행을 건너뛰고 304 응답"""
+
+
+class ConditionalGetMixin:
+    """
+    목록 / 상세 조회용 조건부 GET (ETag / Last-Modified)
+    - 변경 워터마크(apps.core.conditional)만으로 ETag 를 만들어 If-None-Match / If-Modified-Since 가
+      맞으면 쿼리 / 직렬화 없이 304
+    - conditional_user_scopes: 사용자별 워터마크, conditional_global_scopes: 전체 공통 워터마크
+    - conditional_actions: ViewSet 에서 적용할 action (None 이면 모든 GET)
+    - conditional_period: 시간이 지나면 결과가 바뀌는 목록(최근 N시간 등)은 이 주기(초)마다 ETag 변경
+    """
+
+    conditional_user_scopes = ()
+    conditional_global_scopes = ()
+    conditional_actions = None
+    conditional_period = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        request.conditional = None
+        if request.method not in ("GET", "HEAD"):
+            return
+        if self.conditional_actions is not None:
+            if getattr(self, "action", None) not in self.conditional_actions:
+                return
+        user_id = request.user.pk if request.user.is_authenticated else None
+        if self.conditional_user_scopes and user_id is None:
+            return
+
+        stamps = [watermark(scope, user_id) for scope in self.conditional_user_scopes]
+        stamps += [watermark(scope) for scope in self.conditional_global_scopes]
+        period = (
+            int(time.time() // self.conditional_period)
+            if self.conditional_period
+            else None
+        )
+        etag = make_etag(
+            request.get_full_path(),
+            request.accepted_renderer.format,
+            user_id,
+            stamps,
+            period,
+        )
+        last_modified = max(stamps)
+        request.conditional = (etag, last_modified)
+        if is_not_modified(request, etag, last_modified):
+            raise NotModified()
+        # 방금 바뀐 데이터는 replica 에 아직 없을 수 있으므로 새 ETag 로 이전 데이터를 내보내지 않도록
+        if time.time() - last_modified < REPLICA_STICKY_SECONDS:
+            pin_primary()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        conditional = getattr(request, "conditional", None)
+        if conditional is not None and response.status_code in (
+            status.HTTP_200_OK,
+            status.HTTP_304_NOT_MODIFIED,
+        ):
+            etag, last_modified = conditional
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+            # 사용자별 응답 - 공유 캐시 저장 금지, 매번 재검증
+            response["Cache-Control"] = "private, no-cache"
+            patch_vary_headers(response, ("Authorization",))
+        return response
@@ -0,0 +1,143 @@
+import os
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.utils.functional import SimpleLazyObject, empty
+
+from apps.core.cache import namespace
+
+# 쓰기 직후 이 시간 동안은 같은 사용자의 읽기를 primary 로 보냄 (복제 지연 대비, 초)
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+
+# settings 에서 POSTGRES_REPLICA_HOSTS 로 추가한 replica_N 별칭들
+REPLICA_ALIASES = [alias for alias in settings.DATABASES if alias.startswith("replica")]
+
+# 요청 단위 상태 (sync 뷰는 스레드, async 뷰는 태스크마다 분리)
+# - _replica_allowed: ReplicaReadMixin 뷰의 읽기 요청
+# - _pinned: 최근 쓰기가 있었던 사용자 (쿠키 / 캐시)
+# - _wrote: 이번 요청에서 쓰기 발생 → 이후 읽기도 primary
+_replica_allowed = ContextVar("replica_allowed", default=False)
+_pinned = ContextVar("primary_pinned", default=False)
+_wrote = ContextVar("primary_wrote", default=False)
+
+
+# 사용자 id → 최근 쓰기 표시
+pin_cache = namespace("db.primary_pin", timeout=REPLICA_STICKY_SECONDS)
+
+
+def allow_replica_reads(user_id=None):
+    """ReplicaReadMixin 에서 호출 - 최근 쓰기가 없는 사용자면 이번 요청의 읽기를 replica 로"""
+    if not REPLICA_ALIASES or _pinned.get():
+        return
+    if user_id is not None and pin_cache.get(user_id):
+        _pinned.set(True)
+        return
+    _replica_allowed.set(True)
+
+
+def pin_primary():
+    """이번 요청의 읽기를 primary 로 고정 (방금 바뀐 데이터를 replica 지연 없이 읽어야 할 때)"""
+    _pinned.set(True)
+
+
+class PrimaryReplicaRouter:
+    """
+    쓰기는 항상 primary(default), 읽기는 허용된 요청에서만 replica 로 분산
+    - 트랜잭션 안의 읽기 / 같은 요청에서 쓰기 이후의 읽기는 primary
+    - 마이그레이션은 primary 에만 적용 (replica 는 스트리밍 복제로 동기화)
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _replica_allowed.get() or _pinned.get() or _wrote.get():
+            return None
+        if connections["default"].in_atomic_block:
+            return None
+        return random.choice(REPLICA_ALIASES)
+
+    def db_for_write(self, model, **hints):
+        _wrote.set(True)
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica 는 primary 의 복제본이므로 같은 DB 로 취급
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in REPLICA_ALIASES
+
+
+class ReplicaStickinessMiddleware:
+    """
+    요청마다 라우팅 상태를 초기화하고 read-your-writes 를 보장
+    - 요청 시작: 고정 쿠키가 유효하면 primary 고정
+    - 요청 종료: 쓰기가 있었으면 쿠키 + 사용자별 캐시 키로 REPLICA_STICKY_SECONDS 동안 primary 고정
+      (JWT 클라이언트처럼 쿠키를 보내지 않는 경우를 위해 사용자 id 기준 캐시도 사용)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = self._start(request)
+        try:
+            response = self.get_response(request)
+            self._finish(request, response)
+        finally:
+            self._reset(tokens)
+        return response
+
+    async def __acall__(self, request):
+        tokens = self._start(request)
+        try:
+            response = await self.get_response(request)
+            self._finish(request, response)
+        finally:
+            self._reset(tokens)
+        return response
+
+    @staticmethod
+    def _start(request):
+        try:
+            pinned = float(request.COOKIES.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            pinned = False
+        return (
+            _replica_allowed.set(False),
+            _pinned.set(pinned),
+            _wrote.set(False),
+        )
+
+    @staticmethod
+    def _reset(tokens):
+        for var, token in zip((_replica_allowed, _pinned, _wrote), tokens):
+            var.reset(token)
+
+    @staticmethod
+    def _finish(request, response):
+        if not REPLICA_ALIASES or not _wrote.get():
+            return
+        response.set_cookie(
+            PRIMARY_PIN_COOKIE,
+            str(time.time() + REPLICA_STICKY_SECONDS),
+            max_age=REPLICA_STICKY_SECONDS,
+            httponly=True,
+            samesite="Lax",
+        )
+        # DRF 인증 결과는 뷰 실행 후 request.user 에 반영됨 (평가 안 된 세션 사용자는 건너뜀)
+        user = request.__dict__.get("user")
+        if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+            return
+        if getattr(user, "is_authenticated", False):
+            pin_cache.set(user.pk, 1)
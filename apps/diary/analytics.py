@@ -0,0 +1,188 @@
+import numpy as np
+from django.db import transaction
+from django.db.models import Max, Q, Sum
+
+from .models import Diary, SatisfactionWeatherStats
+
+# 기온 구간 경계 (°C) - recommend_service 의 기온 분기와 동일, 상한 포함
+# 구간 0: ~ -5, 1: -5 ~ 0, ... , 9: 29 ~
+TEMPERATURE_BAND_EDGES = np.array([-5, 0, 5, 9, 11, 17, 21, 25, 29], dtype=float)
+N_TEMPERATURE_BANDS = len(TEMPERATURE_BAND_EDGES) + 1
+
+ALL_CONDITIONS = ""  # 날씨 상태 구분 없는 집계 행
+MIN_SAMPLES = 3  # 개인 곡선으로 인정할 최소 일기 수
+REFRESH_USER_BATCH = 500
+
+
+def temperature_band(temperature):
+    return int(np.searchsorted(TEMPERATURE_BAND_EDGES, float(temperature)))
+
+
+def _load_columns(user_ids):
+    """집계에 필요한 네 컬럼만 values_list 로 읽어 NumPy 배열로 변환"""
+    rows = list(
+        Diary.objects.filter(user_id__in=user_ids)
+        .values_list(
+            "user_id",
+            "weather_data__temperature",
+            "weather_data__condition",
+            "satisfaction",
+        )
+        .order_by()
+    )
+    if not rows:
+        return None
+    users, temps, conds, sats = zip(*rows)
+    return (
+        np.fromiter(users, dtype=np.int64, count=len(rows)),
+        np.array(temps, dtype=float),
+        np.array(conds, dtype=str),
+        np.array(sats, dtype=float),
+    )
+
+
+def compute_binned_stats(users, temps, conds, sats):
+    """
+    (사용자, 기온 구간, 날씨 상태) 별 count / 합 / 제곱합을 bincount 한 번으로 계산
+    - 상태 구분 없는 구간 집계(ALL_CONDITIONS)도 같은 패스에 포함
+    반환: [(user_id, band, condition, count, sum, sq_sum), ...]
+    """
+    user_labels, user_idx = np.unique(users, return_inverse=True)
+    cond_labels, cond_idx = np.unique(conds, return_inverse=True)
+    bands = np.searchsorted(TEMPERATURE_BAND_EDGES, temps)
+
+    n_conds = len(cond_labels) + 1  # 마지막 칸 = 전체 상태
+    base = (user_idx * N_TEMPERATURE_BANDS + bands) * n_conds
+    # 상태 값이 빈 문자열인 행은 전체 상태 칸에만 반영 (집계 행 키 충돌 방지)
+    named = cond_labels[cond_idx] != ALL_CONDITIONS
+    keys = np.concatenate([(base + cond_idx)[named], base + (n_conds - 1)])
+    weights = np.concatenate([sats[named], sats])
+    size = len(user_labels) * N_TEMPERATURE_BANDS * n_conds
+
+    count = np.bincount(keys, minlength=size)
+    total = np.bincount(keys, weights=weights, minlength=size)
+    sq_total = np.bincount(keys, weights=weights * weights, minlength=size)
+
+    filled = np.flatnonzero(count)
+    user_pos, rest = np.divmod(filled, N_TEMPERATURE_BANDS * n_conds)
+    band_pos, cond_pos = np.divmod(rest, n_conds)
+    cond_names = np.append(cond_labels, ALL_CONDITIONS)
+
+    return list(
+        zip(
+            user_labels[user_pos].tolist(),
+            band_pos.tolist(),
+            cond_names[cond_pos].tolist(),
+            count[filled].tolist(),
+            total[filled].tolist(),
+            sq_total[filled].tolist(),
+        )
+    )
+
+
+def refresh_user_stats(user_ids, watermark=None):
+    """해당 사용자들의 집계 행을 다시 계산해 교체"""
+    columns = _load_columns(user_ids)
+    rows = compute_binned_stats(*columns) if columns else []
+    with transaction.atomic():
+        SatisfactionWeatherStats.objects.filter(user_id__in=user_ids).delete()
+        SatisfactionWeatherStats.objects.bulk_create(
+            [
+                SatisfactionWeatherStats(
+                    user_id=user_id,
+                    temperature_band=band,
+                    condition=condition,
+                    count=n,
+                    satisfaction_sum=total,
+                    satisfaction_sq_sum=sq_total,
+                    source_watermark=watermark,
+                )
+                for user_id, band, condition, n, total, sq_total in rows
+            ]
+        )
+
+
+def refresh_global_stats(watermark=None):
+    """전체 집계 = 사용자별 집계 행의 합 (원본 일기를 다시 읽지 않음)"""
+    totals = (
+        SatisfactionWeatherStats.objects.filter(user__isnull=False)
+        .values("temperature_band", "condition")
+        .annotate(
+            n=Sum("count"),
+            total=Sum("satisfaction_sum"),
+            sq_total=Sum("satisfaction_sq_sum"),
+        )
+        .order_by()
+    )
+    with transaction.atomic():
+        SatisfactionWeatherStats.objects.filter(user__isnull=True).delete()
+        SatisfactionWeatherStats.objects.bulk_create(
+            [
+                SatisfactionWeatherStats(
+                    user=None,
+                    temperature_band=row["temperature_band"],
+                    condition=row["condition"],
+                    count=row["n"],
+                    satisfaction_sum=row["total"],
+                    satisfaction_sq_sum=row["sq_total"],
+                    source_watermark=watermark,
+                )
+                for row in totals
+            ]
+        )
+
+
+def refresh_satisfaction_stats(full=False):
+    """
+    마지막 갱신 이후 updated_at 이 바뀐 일기의 사용자만 다시 계산
+    - full=True: 전체 재계산
+    반환: 다시 계산한 사용자 수
+    """
+    # soft delete 도 updated_at 을 갱신하므로 삭제된 일기까지 포함해 변경 감지
+    new_watermark = Diary.all_objects.aggregate(m=Max("updated_at"))["m"]
+    if new_watermark is None:
+        return 0
+
+    if full:
+        SatisfactionWeatherStats.objects.all().delete()
+        changed = Diary.all_objects.all()
+    else:
+        watermark = SatisfactionWeatherStats.objects.aggregate(
+            m=Max("source_watermark")
+        )["m"]
+        if watermark is not None and watermark >= new_watermark:
+            return 0
+        changed = (
+            Diary.all_objects.filter(updated_at__gt=watermark)
+            if watermark is not None
+            else Diary.all_objects.all()
+        )
+
+    user_ids = list(changed.values_list("user_id", flat=True).distinct().order_by())
+    for start in range(0, len(user_ids), REFRESH_USER_BATCH):
+        refresh_user_stats(user_ids[start : start + REFRESH_USER_BATCH], new_watermark)
+    refresh_global_stats(new_watermark)
+    return len(user_ids)
+
+
+def get_comfort_curve(user_id):
+    """
+    기온 구간별 평균 만족도 (길이 N_TEMPERATURE_BANDS 배열)
+    - 개인 일기가 MIN_SAMPLES 이상인 구간은 개인 평균, 아니면 전체 평균, 둘 다 없으면 NaN
+    """
+    curve = np.full(N_TEMPERATURE_BANDS, np.nan)
+    rows = SatisfactionWeatherStats.objects.filter(
+        Q(user_id=user_id) | Q(user__isnull=True), condition=ALL_CONDITIONS
+    )
+    personal = {}
+    for owner, band, n, total in rows.values_list(
+        "user_id", "temperature_band", "count", "satisfaction_sum"
+    ):
+        if owner is None:
+            if np.isnan(curve[band]):
+                curve[band] = total / n
+        elif n >= MIN_SAMPLES:
+            personal[band] = total / n
+    for band, mean in personal.items():
+        curve[band] = mean
+    return curve
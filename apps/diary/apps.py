@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class DiaryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.diary'
+
+    def ready(self):
+        from . import signals
+
+        signals.connect()
@@ -0,0 +1,68 @@
+import asyncio
+import resource
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.diary.models import Diary
+from apps.diary.services.export_service import (
+    EXPORT_FORMATS,
+    aexport_diaries,
+    export_diaries,
+)
+
+
+def _peak_rss_mb():
+    # Linux 의 ru_maxrss 는 KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "사용자 1명의 일기 내보내기 처리량(rows/s) / 출력 크기 / 최대 RSS 증가량 측정 "
+        "(최대 RSS 는 프로세스 전체 기준이므로 형식마다 별도 프로세스로 실행 권장)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("user_id", type=int)
+        parser.add_argument(
+            "--file-format", choices=sorted(EXPORT_FORMATS), action="append"
+        )
+        parser.add_argument("--compress", action="store_true")
+        parser.add_argument(
+            "--async", dest="use_async", action="store_true", help="ASGI 경로로 측정"
+        )
+
+    def handle(self, *args, **options):
+        queryset = Diary.objects.filter(user_id=options["user_id"])
+        rows = queryset.count()
+        if not rows:
+            raise CommandError("일기가 없는 사용자")
+
+        compress = options["compress"]
+        self.stdout.write(
+            f"{rows} rows, {'async' if options['use_async'] else 'sync'}"
+            f"{', gzip' if compress else ''}"
+        )
+        for file_format in options["file_format"] or sorted(EXPORT_FORMATS):
+            before = _peak_rss_mb()
+            started = time.perf_counter()
+            if options["use_async"]:
+                size = asyncio.run(self._aconsume(queryset, file_format, compress))
+            else:
+                size = sum(
+                    len(chunk)
+                    for chunk in export_diaries(queryset, file_format, compress)
+                )
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{file_format:9} {rows / elapsed:9.0f} rows/s "
+                f"{size / 1e6:8.1f} MB  RSS +{_peak_rss_mb() - before:.1f} MB"
+            )
+
+    @staticmethod
+    async def _aconsume(queryset, file_format, compress):
+        size = 0
+        async for chunk in aexport_diaries(queryset, file_format, compress):
+            size += len(chunk)
+        return size
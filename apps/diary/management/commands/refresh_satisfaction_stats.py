@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.diary.analytics import refresh_satisfaction_stats
+
+
+class Command(BaseCommand):
+    help = "날씨 조건별 만족도 집계 갱신 (마지막 갱신 이후 변경된 사용자만 다시 계산)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="전체 재계산")
+
+    def handle(self, *args, **options):
+        refreshed = refresh_satisfaction_stats(full=options["full"])
+        self.stdout.write(self.style.SUCCESS(f"만족도 집계 갱신: 사용자 {refreshed}명"))
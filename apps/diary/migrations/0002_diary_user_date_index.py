@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diary', '0001_initial'),
+        ('users', '0004_admin_user_search_indexes'),
+        ('weather', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='diary',
+            index=models.Index(fields=['user', 'date'], name='diary_user_date_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:28
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from apps.diary.search import build_search_vector
+
+
+def backfill_search_vector(apps, schema_editor):
+    # 기존 일기 검색 벡터 채우기 (행 단위 UPDATE, 서버 측 커서로 순회)
+    Diary = apps.get_model('diary', 'Diary')
+    rows = Diary.objects.values_list('id', 'title', 'notes').order_by('id')
+    for pk, title, notes in rows.iterator(chunk_size=2000):
+        Diary.objects.filter(pk=pk).update(
+            search_vector=build_search_vector(title, notes)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diary', '0002_diary_user_date_index'),
+        ('users', '0004_admin_user_search_indexes'),
+        ('weather', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='diary',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='diary',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['search_vector'], name='diary_search_vector_idx'
+            ),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diary', '0003_diary_search_vector'),
+        ('users', '0004_admin_user_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SatisfactionWeatherStats',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('temperature_band', models.PositiveSmallIntegerField()),
+                ('condition', models.CharField(blank=True, default='', max_length=100)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('satisfaction_sum', models.FloatField(default=0)),
+                ('satisfaction_sq_sum', models.FloatField(default=0)),
+                ('source_watermark', models.DateTimeField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                (
+                    'user',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='satisfaction_stats',
+                        to='users.user',
+                    ),
+                ),
+            ],
+            options={
+                'db_table': 'diary_satisfaction_weather_stats',
+                'constraints': [
+                    models.UniqueConstraint(
+                        condition=models.Q(('user__isnull', False)),
+                        fields=('user', 'temperature_band', 'condition'),
+                        name='uq_satisfaction_stats_user_bucket',
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(('user__isnull', True)),
+                        fields=('temperature_band', 'condition'),
+                        name='uq_satisfaction_stats_global_bucket',
+                    ),
+                ],
+            },
+        ),
+    ]
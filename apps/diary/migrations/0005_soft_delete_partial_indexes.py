@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diary', '0004_satisfaction_weather_stats'),
+        ('users', '0004_admin_user_search_indexes'),
+        ('weather', '0002_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='diary',
+            name='diary_user_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='diary',
+            index=models.Index(
+                condition=models.Q(('deleted_at__isnull', True)),
+                fields=['user', 'date'],
+                name='diary_live_user_date_idx',
+            ),
+        ),
+    ]
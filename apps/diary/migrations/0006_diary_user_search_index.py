@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-19 21:10
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    BtreeGinExtension,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 대용량 테이블 - 쓰기를 막지 않도록 CONCURRENTLY 로 생성 / 삭제
+    atomic = False
+
+    dependencies = [
+        ('diary', '0005_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        BtreeGinExtension(),
+        # 새 인덱스를 먼저 만든 뒤 기존 인덱스 삭제 (그 사이에도 검색이 인덱스를 사용)
+        AddIndexConcurrently(
+            model_name='diary',
+            index=django.contrib.postgres.indexes.GinIndex(
+                condition=models.Q(('deleted_at__isnull', True)),
+                fields=['user', 'search_vector'],
+                name='diary_live_user_search_idx',
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name='diary',
+            name='diary_search_vector_idx',
+        ),
+    ]
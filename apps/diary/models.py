@@ -1,28 +1,15 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.utils import timezone
 
+from apps.core.models import SoftDeleteModel
 from apps.users.models import User
 from apps.weather.models import WeatherData
 
+from .search import build_search_vector
 
-class SoftDeleteMixin(models.Model):
-    """Soft Delete Mixin"""
 
-    deleted_at = models.DateTimeField(blank=True, null=True)  # 삭제 시각 (Soft Delete)
-
-    class Meta:
-        abstract = True  # DB 테이블 생성 안 함
-
-    def delete(self, using=None, keep_parents=False):
-        self.deleted_at = timezone.now()  # 실제 삭제 대신 삭제 시각 기록
-        self.save(update_fields=["deleted_at"])
-
-    def restore(self):
-        self.deleted_at = None  # 삭제 복구
-        self.save(update_fields=["deleted_at"])
-
-
-class Diary(models.Model):
+class Diary(SoftDeleteModel):
     id = models.AutoField(primary_key=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     date = models.DateField()
@@ -33,12 +20,88 @@ class Diary(models.Model):
     image_url = models.URLField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    deleted_at = models.DateTimeField(null=True, blank=True)
+    # 제목 / 본문 전문 검색용 (apps/diary/search.py 의 한글 n-gram 토큰)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         db_table = 'diary'
         verbose_name = 'Diary'
         verbose_name_plural = 'Diaries'
+        indexes = [
+            # 월별 목록 / 캘린더 조회 (user + date 범위, 삭제된 일기 제외)
+            models.Index(
+                fields=["user", "date"],
+                name="diary_live_user_date_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 전문 검색 (user + search_vector, btree_gin) - 검색은 항상 사용자 범위이므로
+            # 전체 사용자의 일치 행을 읽고 user 로 거르지 않고 인덱스 안에서 바로 좁힘
+            GinIndex(
+                fields=["user", "search_vector"],
+                name="diary_live_user_search_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         return str(self.date)
+
+    def save(self, *args, **kwargs):
+        # 제목 / 본문이 저장될 때만 검색 벡터 갱신
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"title", "notes"} & set(update_fields):
+            self.search_vector = build_search_vector(self.title, self.notes)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_vector"}
+        super().save(*args, **kwargs)
+
+
+class SatisfactionWeatherStats(models.Model):
+    """
+    날씨 조건별 일기 만족도 집계 (apps/diary/analytics.py 에서 갱신)
+    - user 가 NULL 이면 전체 사용자 집계
+    - condition 이 "" 이면 날씨 상태 구분 없이 기온 구간만 집계
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="satisfaction_stats",
+    )
+    temperature_band = (
+        models.PositiveSmallIntegerField()
+    )  # analytics.TEMPERATURE_BAND_EDGES 기준
+    condition = models.CharField(max_length=100, blank=True, default="")
+    count = models.PositiveIntegerField(default=0)
+    satisfaction_sum = models.FloatField(default=0)
+    satisfaction_sq_sum = models.FloatField(default=0)  # 분산 계산용
+    source_watermark = models.DateTimeField(
+        null=True, blank=True
+    )  # 반영된 Diary.updated_at 최대값
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "diary_satisfaction_weather_stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "temperature_band", "condition"],
+                condition=models.Q(user__isnull=False),
+                name="uq_satisfaction_stats_user_bucket",
+            ),
+            models.UniqueConstraint(
+                fields=["temperature_band", "condition"],
+                condition=models.Q(user__isnull=True),
+                name="uq_satisfaction_stats_global_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.user_id or 'global'} band={self.temperature_band} {self.condition}"
+        )
+
+    @property
+    def mean(self):
+        return self.satisfaction_sum / self.count if self.count else None
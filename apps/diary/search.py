@@ -0,0 +1,64 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db.models import TextField, Value
+
+# PostgreSQL 에 한국어 사전이 없으므로 'simple' 설정 + 직접 만든 토큰을 사용
+SEARCH_CONFIG = "simple"
+
+_WORD = re.compile(r"\w+")
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def _ngrams(token, n):
+    return [token[i : i + n] for i in range(len(token) - n + 1)]
+
+
+def tokenize_document(text):
+    """
+    저장용 토큰
+    - 영문 / 숫자: 소문자 단어 그대로
+    - 한글: 어절 + 음절 bigram + unigram (조사가 붙은 어절도 부분 일치 가능)
+      예) "비가" → 비가, 비, 가
+    """
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        tokens.append(word)
+        if _HANGUL.search(word) and len(word) > 1:
+            tokens.extend(_ngrams(word, 2) if len(word) > 2 else [])
+            tokens.extend(word)
+    return " ".join(tokens)
+
+
+def tokenize_query(text):
+    """
+    검색어 토큰 - 한글은 bigram 으로 쪼개 AND 검색 (1음절은 그대로)
+    예) "우산챙김" → 우산 & 산챙 & 챙김
+    """
+    terms = []
+    for word in _WORD.findall((text or "").lower()):
+        if _HANGUL.search(word) and len(word) > 2:
+            terms.extend(_ngrams(word, 2))
+        else:
+            terms.append(word)
+    return list(dict.fromkeys(terms))
+
+
+def build_search_vector(title, notes):
+    """제목(가중치 A) + 본문(가중치 B) tsvector 표현식"""
+    return SearchVector(
+        Value(tokenize_document(title), output_field=TextField()),
+        weight="A",
+        config=SEARCH_CONFIG,
+    ) + SearchVector(
+        Value(tokenize_document(notes), output_field=TextField()),
+        weight="B",
+        config=SEARCH_CONFIG,
+    )
+
+
+def build_search_query(text):
+    terms = tokenize_query(text)
+    if not terms:
+        return None
+    return SearchQuery(" ".join(terms), search_type="plain", config=SEARCH_CONFIG)
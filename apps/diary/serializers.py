@@ -1,7 +1,9 @@
 from rest_framework import serializers
 
+from apps.core.serializers import EagerLoadingMixin
+
 from ..weather.serializers import WeatherDataSerializer
-from .models import Diary
+from .models import Diary, SatisfactionWeatherStats
 
 
 class DiaryListSerializer(serializers.ModelSerializer):  # 목록조회
@@ -10,7 +12,14 @@ class DiaryListSerializer(serializers.ModelSerializer):  # 목록조회
         fields = ["id", "date", "title"]
 
 
-class DiaryDetailSerializer(serializers.ModelSerializer):  # 상세조회
+class DiarySearchResultSerializer(DiaryListSerializer):  # 검색 결과
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta(DiaryListSerializer.Meta):
+        fields = DiaryListSerializer.Meta.fields + ["satisfaction", "rank"]
+
+
+class DiaryDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):  # 상세조회
     weather_data = WeatherDataSerializer(read_only=True)
 
     class Meta:
@@ -28,6 +37,24 @@ class DiaryDetailSerializer(serializers.ModelSerializer):  # 상세조회
         ]
 
 
+class DiaryCalendarDaySerializer(serializers.Serializer):  # 월별 캘린더
+    date = serializers.DateField()
+    diary_id = serializers.IntegerField(allow_null=True)
+    title = serializers.CharField(allow_null=True)
+    satisfaction = serializers.IntegerField(allow_null=True)
+    icon = serializers.CharField(allow_null=True)
+    temperature = serializers.DecimalField(
+        max_digits=5, decimal_places=2, allow_null=True
+    )
+    condition = serializers.CharField(allow_null=True)
+    temperature_min = serializers.DecimalField(
+        max_digits=5, decimal_places=2, allow_null=True
+    )
+    temperature_max = serializers.DecimalField(
+        max_digits=5, decimal_places=2, allow_null=True
+    )
+
+
 class DiaryCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Diary
@@ -36,3 +63,11 @@ class DiaryCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         user = self.context["request"].user
         return Diary.objects.create(user=user, **validated_data)
+
+
+class SatisfactionWeatherStatsSerializer(serializers.ModelSerializer):  # 날씨별 만족도
+    mean = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = SatisfactionWeatherStats
+        fields = ["temperature_band", "condition", "count", "mean"]
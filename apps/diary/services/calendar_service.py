@@ -0,0 +1,72 @@
+import calendar
+from datetime import date
+
+from django.db import connection
+
+from apps.locations.models import FavoriteLocation
+from apps.weather.models import WeatherDailySummary, WeatherData
+
+from ..models import Diary
+
+# 한 달치 날짜를 generate_series 로 만들고 일기 / 날씨 / 일별 요약을 한 번에 조인
+# - 일기: (user_id, date) 부분 인덱스(삭제 제외)로 날짜별 최신 1건 (LATERAL)
+# - 일기가 없는 날: 기본 즐겨찾기 위치의 WeatherDailySummary
+MONTH_CALENDAR_SQL = """
+WITH days AS (
+    SELECT d::date AS day
+    FROM generate_series(%(start)s::date, %(end)s::date, interval '1 day') AS d
+),
+home AS (
+    SELECT location_id
+    FROM {favorite_table}
+    WHERE user_id = %(user_id)s AND deleted_at IS NULL
+    ORDER BY is_default DESC, created_at
+    LIMIT 1
+)
+SELECT
+    days.day AS date,
+    d.id AS diary_id,
+    d.title,
+    d.satisfaction,
+    w.icon,
+    w.temperature,
+    COALESCE(w.condition, s.dominant_condition) AS condition,
+    s.temperature_min,
+    s.temperature_max
+FROM days
+LEFT JOIN LATERAL (
+    SELECT id, title, satisfaction, weather_data_id
+    FROM {diary_table}
+    WHERE user_id = %(user_id)s AND date = days.day AND deleted_at IS NULL
+    ORDER BY created_at DESC
+    LIMIT 1
+) d ON TRUE
+LEFT JOIN {weather_table} w ON w.id = d.weather_data_id
+LEFT JOIN {summary_table} s
+    ON d.id IS NULL
+    AND s.date = days.day
+    AND s.location_id = (SELECT location_id FROM home)
+    AND s.deleted_at IS NULL
+ORDER BY days.day
+"""
+
+
+def get_month_calendar(user_id, year, month):
+    """해당 월의 모든 날짜 (일기 + 날씨 아이콘 / 기온) 를 쿼리 한 번으로 조회"""
+    last_day = calendar.monthrange(year, month)[1]
+    sql = MONTH_CALENDAR_SQL.format(
+        favorite_table=FavoriteLocation._meta.db_table,
+        diary_table=Diary._meta.db_table,
+        weather_table=WeatherData._meta.db_table,
+        summary_table=WeatherDailySummary._meta.db_table,
+    )
+    params = {
+        "user_id": user_id,
+        "start": date(year, month, 1),
+        "end": date(year, month, last_day),
+    }
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [col[0] for col in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
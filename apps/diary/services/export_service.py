@@ -0,0 +1,138 @@
+import csv
+import io
+import json
+import zlib
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+
+# 서버 측 커서에서 한 번에 가져올 행 수 = 응답으로 내보내는 블록 크기
+EXPORT_CHUNK_SIZE = 2000
+
+# (내보낼 컬럼명, ORM 경로)
+EXPORT_COLUMNS = [
+    ("diary_id", "id"),
+    ("date", "date"),
+    ("title", "title"),
+    ("satisfaction", "satisfaction"),
+    ("notes", "notes"),
+    ("image_url", "image_url"),
+    ("created_at", "created_at"),
+    ("city", "weather_data__location__city"),
+    ("district", "weather_data__location__district"),
+    ("valid_time", "weather_data__valid_time"),
+    ("temperature", "weather_data__temperature"),
+    ("feels_like", "weather_data__feels_like"),
+    ("humidity", "weather_data__humidity"),
+    ("rain_probability", "weather_data__rain_probability"),
+    ("rain_volume", "weather_data__rain_volume"),
+    ("wind_speed", "weather_data__wind_speed"),
+    ("condition", "weather_data__condition"),
+    ("icon", "weather_data__icon"),
+]
+
+EXPORT_FORMATS = {
+    # format: (content type, 확장자)
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "columnar": ("application/x-ndjson", "columns.jsonl"),
+}
+
+_encoder = DjangoJSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _iter_blocks(queryset):
+    """
+    Diary + WeatherData 조인 결과를 EXPORT_CHUNK_SIZE 행 단위 블록으로 반환
+    - iterator(chunk_size) → PostgreSQL 서버 측 커서 사용, 메모리는 블록 크기로 제한
+    """
+    rows = queryset.values_list(*(path for _, path in EXPORT_COLUMNS)).order_by(
+        "date", "id"
+    )
+    block = []
+    for row in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        block.append(row)
+        if len(block) >= EXPORT_CHUNK_SIZE:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def _csv_stream(queryset):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    for block in _iter_blocks(queryset):
+        writer.writerows(block)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _jsonl_stream(queryset):
+    names = [name for name, _ in EXPORT_COLUMNS]
+    for block in _iter_blocks(queryset):
+        yield "".join(_encoder.encode(dict(zip(names, row))) + "\n" for row in block)
+
+
+def _columnar_stream(queryset):
+    """
+    열 단위 블록 포맷 (컬럼명은 첫 줄에 한 번만 기록)
+    {"columns": [...]}
+    {"rows": n, "data": [[열1 값들], [열2 값들], ...]}
+    """
+    yield _encoder.encode({"columns": [name for name, _ in EXPORT_COLUMNS]}) + "\n"
+    for block in _iter_blocks(queryset):
+        columns = [list(col) for col in zip(*block)]
+        yield _encoder.encode({"rows": len(block), "data": columns}) + "\n"
+
+
+def _gzip_stream(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_diaries(queryset, file_format, compress=False):
+    """
+    내보내기 스트림 생성 (bytes / str 청크 iterator)
+    - file_format: csv | jsonl | columnar
+    """
+    streams = {
+        "csv": _csv_stream,
+        "jsonl": _jsonl_stream,
+        "columnar": _columnar_stream,
+    }
+    chunks = streams[file_format](queryset)
+    if compress:
+        return _gzip_stream(chunks)
+    return chunks
+
+
+_DONE = object()
+
+
+async def aexport_diaries(queryset, file_format, compress=False):
+    """
+    export_diaries 의 async iterator 버전 (ASGI 용)
+    - ASGI 의 StreamingHttpResponse 는 sync iterator 를 응답 전에 전부 메모리에 모으므로
+      블록을 하나씩 스레드에서 만들어 바로 내보냄
+    - 서버 측 커서가 같은 DB 연결을 쓰도록 thread_sensitive 스레드에서만 진행
+    """
+    chunks = export_diaries(queryset, file_format, compress=compress)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while True:
+            chunk = await next_chunk(chunks, _DONE)
+            if chunk is _DONE:
+                return
+            yield chunk
+    finally:
+        # 클라이언트가 중간에 끊어도 커서를 연 스레드에서 정리
+        await sync_to_async(chunks.close, thread_sensitive=True)()
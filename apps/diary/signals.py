@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save
+
+from apps.core.conditional import touch_on_commit
+from apps.core.signals import post_bulk_restore, post_bulk_soft_delete
+
+
+def _on_diary_changed(sender, instance, **kwargs):
+    # 일기 목록 / 상세 / 검색의 조건부 GET 워터마크 갱신 (soft delete 도 save 로 처리됨)
+    touch_on_commit("diary", instance.user_id)
+
+
+def _on_diary_changed_bulk(sender, queryset, **kwargs):
+    # QuerySet.delete() / restore() - 행이 바뀐 사용자마다 워터마크 갱신
+    for user_id in queryset.values_list("user_id", flat=True).distinct():
+        touch_on_commit("diary", user_id)
+
+
+def connect():
+    post_save.connect(
+        _on_diary_changed, sender="diary.Diary", dispatch_uid="diary_watermark"
+    )
+    post_delete.connect(
+        _on_diary_changed, sender="diary.Diary", dispatch_uid="diary_watermark"
+    )
+    for signal in (post_bulk_soft_delete, post_bulk_restore):
+        signal.connect(
+            _on_diary_changed_bulk,
+            sender="diary.Diary",
+            dispatch_uid="diary_watermark_bulk",
+        )
@@ -1,3 +1,129 @@
+from datetime import date
+from unittest import mock
+
+from asgiref.sync import async_to_sync
 from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.testing import assert_max_queries
+from apps.locations.models import Location
+from apps.users import signals as users_signals
+from apps.users.models import StatCounter, User
+from apps.users.utils.stat_buffer import StatBuffer
+from apps.weather.models import WeatherData
+
+from . import signals
+from .models import Diary
+from .serializers import DiaryDetailSerializer
+from .services.export_service import aexport_diaries, export_diaries
+
+
+class DiaryFixtureMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email="diary@example.com", password="x")
+        location = Location.objects.create(
+            city="서울특별시", district="강남구", latitude=37.5, longitude=127
+        )
+        now = timezone.now()
+        weather = WeatherData.objects.create(
+            location=location,
+            base_time=now,
+            valid_time=now,
+            temperature=20,
+            feels_like=19,
+            humidity=50,
+            wind_speed=2,
+            condition="맑음",
+        )
+        cls.diary = Diary.objects.create(
+            user=cls.user,
+            date=date(2025, 1, 1),
+            weather_data=weather,
+            satisfaction=4,
+            title="산책",
+            notes="맑은 날",
+            image_url="https://example.com/a.jpg",
+        )
+
+
+class DiaryDetailSerializerQueryTests(DiaryFixtureMixin, TestCase):
+    def test_detail_is_one_query(self):
+        # DiaryViewSet.retrieve 와 같은 조회 - 일기 / 날씨 / 지역을 한 번에 조인
+        with assert_max_queries(1):
+            diary = DiaryDetailSerializer.setup_eager_loading(
+                Diary.objects.filter(user=self.user)
+            ).get(pk=self.diary.pk)
+            data = DiaryDetailSerializer(diary).data
+
+        self.assertEqual(data["weather_data"]["location_name"], "서울특별시 강남구")
+
+
+class DiaryExportStreamTests(DiaryFixtureMixin, TestCase):
+    async def _collect(self, stream):
+        return [chunk async for chunk in stream]
+
+    def test_async_stream_matches_sync_stream(self):
+        queryset = Diary.objects.filter(user=self.user)
+        for file_format in ("csv", "jsonl", "columnar"):
+            for compress in (False, True):
+                with self.subTest(file_format=file_format, compress=compress):
+                    expected = list(export_diaries(queryset, file_format, compress))
+                    chunks = async_to_sync(self._collect)(
+                        aexport_diaries(queryset, file_format, compress)
+                    )
+                    self.assertEqual(chunks, expected)
+
+
+class DiaryBulkSoftDeleteTests(DiaryFixtureMixin, TestCase):
+    def setUp(self):
+        self.buffer = StatBuffer(interval=3600)
+        patches = [
+            mock.patch.object(users_signals, "stat_buffer", self.buffer),
+            mock.patch("apps.users.utils.stat_buffer.close_old_connections"),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        Diary.objects.create(
+            user=self.user,
+            date=date(2025, 1, 2),
+            weather_data=self.diary.weather_data,
+            satisfaction=3,
+            title="출근",
+            notes="흐림",
+            image_url="https://example.com/b.jpg",
+        )
+
+    def counter(self):
+        self.buffer.flush()
+        counter = StatCounter.objects.filter(name=StatCounter.DIARIES).first()
+        return counter.value if counter else 0
+
+    def test_bulk_delete_and_restore_update_counter_and_watermark(self):
+        before = self.counter()
+
+        with mock.patch.object(signals, "touch_on_commit") as touch:
+            with self.captureOnCommitCallbacks(execute=True):
+                deleted = Diary.objects.filter(user=self.user).delete()
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(self.counter(), before - 2)
+        touch.assert_called_once_with("diary", self.user.id)
+
+        with mock.patch.object(signals, "touch_on_commit") as touch:
+            with self.captureOnCommitCallbacks(execute=True):
+                restored = Diary.all_objects.filter(user=self.user).restore()
+
+        self.assertEqual(restored, 2)
+        self.assertEqual(self.counter(), before)
+        touch.assert_called_once_with("diary", self.user.id)
+
+    def test_already_deleted_rows_are_not_counted_twice(self):
+        before = self.counter()
+        with self.captureOnCommitCallbacks(execute=True):
+            Diary.objects.filter(user=self.user).delete()
+            deleted = Diary.all_objects.filter(user=self.user).delete()
 
-# Create your tests here.
+        self.assertEqual(deleted, 0)
+        self.assertEqual(self.counter(), before - 2)
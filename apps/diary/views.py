@@ -1,16 +1,47 @@
+from django.contrib.postgres.search import SearchRank
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import F
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.diary.models import Diary
-from apps.diary.serializers import DiaryDetailSerializer, DiaryListSerializer
+from apps.core.views import ConditionalGetMixin, ReplicaReadMixin
+from apps.diary.analytics import TEMPERATURE_BAND_EDGES
+from apps.diary.models import Diary, SatisfactionWeatherStats
+from apps.diary.search import build_search_query
+from apps.diary.serializers import (
+    DiaryCalendarDaySerializer,
+    DiaryDetailSerializer,
+    DiaryListSerializer,
+    DiarySearchResultSerializer,
+    SatisfactionWeatherStatsSerializer,
+)
+from apps.diary.services.calendar_service import get_month_calendar
+from apps.diary.services.export_service import (
+    EXPORT_FORMATS,
+    aexport_diaries,
+    export_diaries,
+)
 
 
-class DiaryViewSet(viewsets.ViewSet):
+class DiarySearchPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class DiaryViewSet(ConditionalGetMixin, ReplicaReadMixin, viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
+    # 일기만으로 결과가 정해지는 조회 - 일기 변경이 없으면 304 (캘린더는 날씨 요약도 포함하므로 제외)
+    conditional_user_scopes = ("diary",)
+    conditional_actions = ("list", "retrieve", "search")
 
     def get_queryset(self):
-        return Diary.objects.filter(user=self.request.user, deleted_at__isnull=True)
+        return Diary.objects.filter(user=self.request.user)
 
     def list(self, request):
         year = request.query_params.get("year")
@@ -31,7 +62,9 @@ class DiaryViewSet(viewsets.ViewSet):
 
     def retrieve(self, request, pk=None):
         try:
-            diary = self.get_queryset().get(pk=pk)
+            diary = DiaryDetailSerializer.setup_eager_loading(self.get_queryset()).get(
+                pk=pk
+            )
         except Diary.DoesNotExist:
             return Response(
                 {"error": "존재하지 않습니다", "error_status": "not_found"},
@@ -39,3 +72,103 @@ class DiaryViewSet(viewsets.ViewSet):
             )
         serializer = DiaryDetailSerializer(diary)
         return Response(serializer.data)
+
+    @action(detail=False, methods=["get"], url_path="calendar")
+    def calendar(self, request):
+        """
+        GET /api/diary/calendar/?year=2025&month=10
+        해당 월의 모든 날짜 - 일기(id, 제목, 만족도) + 날씨 아이콘 / 기온
+        일기가 없는 날은 기본 위치의 일별 날씨 요약으로 채움
+        """
+        try:
+            year = int(request.query_params.get("year"))
+            month = int(request.query_params.get("month"))
+        except (TypeError, ValueError):
+            year = month = 0
+        if not (1 <= month <= 12 and 1 <= year <= 9999):
+            return Response(
+                {"error": "year/month 오류", "error_status": "invalid_date"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        days = get_month_calendar(request.user.id, year, month)
+        serializer = DiaryCalendarDaySerializer(days, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        """
+        GET /api/diary/export/?file_format=csv|jsonl|columnar&compress=gzip
+        일기 + 날씨 전체 이력을 스트리밍으로 내려받기 (행 수와 무관하게 메모리 일정)
+        """
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {"error": "지원하지 않는 형식", "error_status": "invalid_format"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        compress = request.query_params.get("compress") == "gzip"
+
+        content_type, extension = EXPORT_FORMATS[file_format]
+        filename = f"diary-{timezone.localdate():%Y%m%d}.{extension}"
+        if compress:
+            content_type = "application/gzip"
+            filename += ".gz"
+
+        # ASGI 는 sync iterator 를 전부 모은 뒤 보내므로 async iterator 로 블록 단위 전송
+        stream = (
+            aexport_diaries
+            if isinstance(request._request, ASGIRequest)
+            else export_diaries
+        )
+        response = StreamingHttpResponse(
+            stream(self.get_queryset(), file_format, compress=compress),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        """
+        GET /api/diary/search/?q=우산&page=1
+        제목 / 본문 전문 검색 (관련도순, 같은 점수면 최신 날짜순)
+        """
+        query = build_search_query(request.query_params.get("q", ""))
+        if query is None:
+            return Response(
+                {"error": "검색어 누락", "error_status": "invalid_query"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        diary_qs = (
+            self.get_queryset()
+            .filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "-date", "-id")
+        )
+        paginator = DiarySearchPagination()
+        page = paginator.paginate_queryset(diary_qs, request)
+        serializer = DiarySearchResultSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["get"], url_path="satisfaction-weather")
+    def satisfaction_weather(self, request):
+        """
+        GET /api/diary/satisfaction-weather/
+        기온 구간 / 날씨 상태별 내 평균 만족도와 전체 사용자 평균 (미리 집계된 값)
+        """
+        stats_qs = SatisfactionWeatherStats.objects.order_by(
+            "temperature_band", "condition"
+        )
+        return Response(
+            {
+                "temperature_band_edges": TEMPERATURE_BAND_EDGES.tolist(),
+                "mine": SatisfactionWeatherStatsSerializer(
+                    stats_qs.filter(user=request.user), many=True
+                ).data,
+                "overall": SatisfactionWeatherStatsSerializer(
+                    stats_qs.filter(user__isnull=True), many=True
+                ).data,
+            }
+        )
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class LocationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.locations'
+
+    def ready(self):
+        from . import signals
+
+        signals.connect()
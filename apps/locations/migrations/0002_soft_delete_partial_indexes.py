@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='favoritelocation',
+            name='uq_user_location',
+        ),
+        migrations.RemoveConstraint(
+            model_name='favoritelocation',
+            name='uq_user_default_location',
+        ),
+        migrations.AddIndex(
+            model_name='favoritelocation',
+            index=models.Index(
+                condition=models.Q(('deleted_at__isnull', True)),
+                fields=['user'],
+                name='fav_location_live_user_idx',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='favoritelocation',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('deleted_at__isnull', True)),
+                fields=('user', 'location'),
+                name='uq_user_location',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='favoritelocation',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('deleted_at__isnull', True), ('is_default', True)),
+                fields=('user',),
+                name='uq_user_default_location',
+            ),
+        ),
+    ]
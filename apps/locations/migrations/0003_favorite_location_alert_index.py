@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0002_soft_delete_partial_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='favoritelocation',
+            index=models.Index(
+                condition=models.Q(('deleted_at__isnull', True)),
+                fields=['location', 'user'],
+                name='fav_location_live_loc_user_idx',
+            ),
+        ),
+    ]
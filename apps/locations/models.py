@@ -1,25 +1,9 @@
 from django.conf import settings
 from django.db import models
-from django.utils import timezone
 
-User = settings.AUTH_USER_MODEL
-
-
-class SoftDeleteMixin(models.Model):
-    """Soft Delete Mixin"""
-
-    deleted_at = models.DateTimeField(blank=True, null=True)  # 삭제 시각 (Soft Delete)
-
-    class Meta:
-        abstract = True  # DB 테이블 생성 안 함
+from apps.core.models import SoftDeleteModel
 
-    def delete(self, using=None, keep_parents=False):
-        self.deleted_at = timezone.now()  # 실제 삭제 대신 삭제 시각 기록
-        self.save()
-
-    def restore(self):
-        self.deleted_at = None  # 삭제 복구
-        self.save()
+User = settings.AUTH_USER_MODEL
 
 
 class Location(models.Model):
@@ -61,7 +45,7 @@ class Location(models.Model):
         return f"{self.city} {self.district}"
 
 
-class FavoriteLocation(SoftDeleteMixin):
+class FavoriteLocation(SoftDeleteModel):
     """
     사용자별 즐겨찾기 위치 관리 테이블
     """
@@ -84,16 +68,32 @@ class FavoriteLocation(SoftDeleteMixin):
         verbose_name = "Favorite Location"
         verbose_name_plural = "Favorite Locations"
         constraints = [
+            # 삭제된 즐겨찾기는 제외 (삭제 후 같은 위치 재등록 허용)
             models.UniqueConstraint(
                 fields=["user", "location"],
+                condition=models.Q(deleted_at__isnull=True),
                 name="uq_user_location",  # 동일 사용자가 같은 위치 중복 등록 금지
             ),
             models.UniqueConstraint(
                 fields=["user"],  # 기본 위치는 한 개만!
-                condition=models.Q(is_default=True),
+                condition=models.Q(is_default=True, deleted_at__isnull=True),
                 name="uq_user_default_location",
             ),
         ]
+        indexes = [
+            # 사용자별 즐겨찾기 목록 (삭제된 행 제외)
+            models.Index(
+                fields=["user"],
+                name="fav_location_live_user_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 날씨 알림 대상자 조회 (위치 → 사용자, index-only scan)
+            models.Index(
+                fields=["location", "user"],
+                name="fav_location_live_loc_user_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         """
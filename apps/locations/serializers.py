@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from apps.core.serializers import EagerLoadingMixin
 from apps.locations.models import FavoriteLocation, Location
 
 
@@ -11,7 +12,7 @@ class LocationSerializer(serializers.ModelSerializer):
         fields = ["id", "city", "district", "latitude", "longitude"]
 
 
-class FavoriteLocationSerializer(serializers.ModelSerializer):
+class FavoriteLocationSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """즐겨찾기 위치 직렬화"""
 
     location = LocationSerializer(read_only=True)
@@ -0,0 +1,34 @@
+from django.db.models.signals import post_delete, post_save
+
+from apps.core.conditional import touch_on_commit
+from apps.core.signals import post_bulk_restore, post_bulk_soft_delete
+
+
+def _on_favorite_changed(sender, instance, **kwargs):
+    # 즐겨찾기 목록 / 날씨 알림 목록의 조건부 GET 워터마크 갱신
+    touch_on_commit("favorites", instance.user_id)
+
+
+def _on_favorite_changed_bulk(sender, queryset, **kwargs):
+    # QuerySet.delete() / restore() - 행이 바뀐 사용자마다 워터마크 갱신
+    for user_id in queryset.values_list("user_id", flat=True).distinct():
+        touch_on_commit("favorites", user_id)
+
+
+def connect():
+    post_save.connect(
+        _on_favorite_changed,
+        sender="locations.FavoriteLocation",
+        dispatch_uid="locations_favorites_watermark",
+    )
+    post_delete.connect(
+        _on_favorite_changed,
+        sender="locations.FavoriteLocation",
+        dispatch_uid="locations_favorites_watermark",
+    )
+    for signal in (post_bulk_soft_delete, post_bulk_restore):
+        signal.connect(
+            _on_favorite_changed_bulk,
+            sender="locations.FavoriteLocation",
+            dispatch_uid="locations_favorites_watermark_bulk",
+        )
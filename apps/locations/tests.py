@@ -1,3 +1,44 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.core.testing import assert_max_queries
+
+from . import signals
+from .models import FavoriteLocation, Location
+
+
+class FavoriteLocationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user("fav", "fav@example.com")
+        for i in range(5):
+            location = Location.objects.create(
+                city="서울특별시", district=f"구{i}", latitude=37 + i, longitude=127
+            )
+            FavoriteLocation.objects.create(
+                user=cls.user, location=location, alias=f"장소{i}"
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_is_one_query(self):
+        # 지역 정보는 조인으로 함께 조회 - 즐겨찾기 수와 무관하게 1개 쿼리
+        with assert_max_queries(1):
+            res = self.client.get("/api/location/favorites/")
+
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(len(res.json()), 5)
+        self.assertEqual(res.json()[0]["location"]["city"], "서울특별시")
+
+    def test_bulk_delete_touches_watermark(self):
+        with mock.patch.object(signals, "touch_on_commit") as touch:
+            with self.captureOnCommitCallbacks(execute=True):
+                deleted = FavoriteLocation.objects.filter(user=self.user).delete()
 
-# Create your tests here.
+        self.assertEqual(deleted, 5)
+        touch.assert_called_once_with("favorites", self.user.id)
@@ -2,12 +2,18 @@ from rest_framework import generics, status, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.core.views import (
+    ConditionalGetMixin,
+    EagerLoadingViewMixin,
+    ReplicaReadMixin,
+)
+
 from .models import FavoriteLocation, Location
 from .serializers import FavoriteLocationSerializer, LocationSerializer
 
 
 # 좌표 기반 지역 검색
-class LocationSearchView(generics.GenericAPIView):
+class LocationSearchView(ReplicaReadMixin, generics.GenericAPIView):
     """
     GET /api/location/search?lat=&lon=
     위도(lat), 경도(lon)를 쿼리로 받아 DB에서 해당 위치 조회
@@ -57,24 +63,27 @@ class LocationSearchView(generics.GenericAPIView):
 
 
 # 즐겨찾기 관리 CRUD
-class FavoriteLocationViewSet(viewsets.ModelViewSet):
+class FavoriteLocationViewSet(
+    ConditionalGetMixin, EagerLoadingViewMixin, viewsets.ModelViewSet
+):
     """
     /api/location/favorites/
     GET: 즐겨찾기 목록 조회
     POST: 즐겨찾기 추가
     PATCH: 별칭 수정 / 기본 위치 설정
     DELETE: 즐겨찾기 삭제
+    목록 / 상세는 즐겨찾기 변경이 없으면 304 (ETag / Last-Modified)
     """
 
-    queryset = FavoriteLocation.objects.select_related("location").all()
+    queryset = FavoriteLocation.objects.all()
     serializer_class = FavoriteLocationSerializer
     permission_classes = [IsAuthenticated]
+    conditional_user_scopes = ("favorites",)
+    conditional_actions = ("list", "retrieve")
 
     def get_queryset(self):
         """현재 로그인한 사용자 데이터만 조회"""
-        return FavoriteLocation.objects.filter(
-            user=self.request.user, deleted_at__isnull=True
-        ).select_related("location")
+        return FavoriteLocation.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
         """중복 등록 방지 + 기본위치 처리"""
@@ -82,9 +91,7 @@ class FavoriteLocationViewSet(viewsets.ModelViewSet):
         location = serializer.validated_data.get("location")
 
         # 동일 위치 중복 방지
-        if FavoriteLocation.objects.filter(
-            user=user, location=location, deleted_at__isnull=True
-        ).exists():
+        if FavoriteLocation.objects.filter(user=user, location=location).exists():
             return Response(
                 {"error": "중복 등록", "error_status": "favorite_duplicate"},
                 status=status.HTTP_409_CONFLICT,
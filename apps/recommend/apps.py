@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class RecommendConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.recommend'
+
+    def ready(self):
+        from . import signals
+
+        signals.connect()
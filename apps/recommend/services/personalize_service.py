@@ -0,0 +1,138 @@
+import os
+import zlib
+from functools import partial
+
+import numpy as np
+
+from apps.core.cache import namespace
+from apps.diary.analytics import N_TEMPERATURE_BANDS, temperature_band
+from apps.diary.models import Diary
+from apps.users.utils.system_settings import get_bool
+
+from ..models import OutfitRecommendation
+from .outfits import all_outfits, outfit_items
+
+# 선호도 계산에 사용할 최근 일기 수
+PERSONALIZE_HISTORY_LIMIT = int(os.getenv("PERSONALIZE_HISTORY_LIMIT", "365"))
+# 기록이 적은 아이템의 선호도를 0 쪽으로 당기는 사전 가중치
+PERSONALIZE_PRIOR_STRENGTH = float(os.getenv("PERSONALIZE_PRIOR_STRENGTH", "2"))
+# 기본 순서 점수 대비 개인 선호도 반영 비율
+PERSONALIZE_WEIGHT = float(os.getenv("PERSONALIZE_WEIGHT", "1"))
+PERSONALIZE_CACHE_SECONDS = int(os.getenv("PERSONALIZE_CACHE_SECONDS", "86400"))
+
+# 추천 당일 노출 가중치 (rec_1 을 가장 많이 입었다고 가정)
+EXPOSURE_WEIGHTS = (1.0, 0.5, 0.25)
+# 비슷한 기온 구간의 기록도 반영 (자기 구간 1, 인접 구간 0.5)
+BAND_KERNEL = (0.5, 1.0, 0.5)
+
+# 아이템 사전: 전체 추천 후보 문자열을 "+" 로 나눈 아이템
+VOCABULARY = sorted({item for outfit in all_outfits() for item in outfit_items(outfit)})
+ITEM_INDEX = {item: i for i, item in enumerate(VOCABULARY)}
+VOCABULARY_VERSION = zlib.crc32("|".join(VOCABULARY).encode())
+
+
+def _outfit_vector(outfit):
+    """코디의 아이템 벡터 (아이템 수로 정규화 - 아이템이 많은 코디가 유리하지 않도록)"""
+    vector = np.zeros(len(VOCABULARY), dtype=np.float32)
+    items = [ITEM_INDEX[item] for item in outfit_items(outfit) if item in ITEM_INDEX]
+    if items:
+        vector[items] = 1.0 / len(items)
+    return vector
+
+
+OUTFIT_VECTORS = {outfit: _outfit_vector(outfit) for outfit in all_outfits()}
+
+
+def _vector(outfit):
+    vector = OUTFIT_VECTORS.get(outfit)
+    return vector if vector is not None else _outfit_vector(outfit)
+
+
+# 아이템 사전이 바뀌면 행렬 모양이 달라지므로 사전 버전으로 전체 무효화
+preferences_cache = namespace(
+    "recommend.preferences",
+    version=VOCABULARY_VERSION,
+    timeout=PERSONALIZE_CACHE_SECONDS,
+)
+
+
+def compute_preferences(user_id):
+    """
+    (기온 구간 × 아이템) 선호도 행렬
+    - 일기 만족도(사용자 평균 대비 편차)를 그날 추천받은 코디 / 일기에 언급된 아이템에 배분
+    - 인접 기온 구간에도 절반 가중치로 반영
+    기록이 없으면 None
+    """
+    diaries = list(
+        Diary.objects.filter(user_id=user_id)
+        .order_by("-date")
+        .values_list(
+            "date", "weather_data__temperature", "satisfaction", "title", "notes"
+        )[:PERSONALIZE_HISTORY_LIMIT]
+    )
+    if not diaries:
+        return None
+
+    # 날짜별 마지막 추천 (일기와 같은 날 받은 추천을 그날 입은 코디로 간주)
+    recommended = {}
+    oldest = diaries[-1][0]
+    for day, *outfits in (
+        OutfitRecommendation.objects.filter(
+            user_id=user_id, created_at__date__gte=oldest
+        )
+        .order_by("created_at")
+        .values_list("created_at__date", "rec_1", "rec_2", "rec_3")
+    ):
+        recommended[day] = outfits
+
+    exposure = np.zeros((len(diaries), len(VOCABULARY)), dtype=np.float32)
+    bands = np.empty(len(diaries), dtype=np.int64)
+    satisfaction = np.empty(len(diaries), dtype=np.float32)
+    for row, (day, temperature, score, title, notes) in enumerate(diaries):
+        bands[row] = temperature_band(temperature)
+        satisfaction[row] = score
+        for weight, outfit in zip(EXPOSURE_WEIGHTS, recommended.get(day, ())):
+            if outfit:
+                exposure[row] += weight * _vector(outfit)
+        text = f"{title} {notes}"
+        mentioned = [i for item, i in ITEM_INDEX.items() if item in text]
+        exposure[row, mentioned] += 1.0
+
+    # (일기 × 기온 구간) 커널 가중치
+    kernel = np.zeros((len(diaries), N_TEMPERATURE_BANDS), dtype=np.float32)
+    for offset, weight in zip((-1, 0, 1), BAND_KERNEL):
+        target = bands + offset
+        valid = (target >= 0) & (target < N_TEMPERATURE_BANDS)
+        kernel[np.flatnonzero(valid), target[valid]] = weight
+
+    centered = satisfaction - satisfaction.mean()
+    numerator = kernel.T @ (centered[:, None] * exposure)
+    denominator = kernel.T @ exposure
+    return numerator / (denominator + PERSONALIZE_PRIOR_STRENGTH)
+
+
+def refresh_preferences(user_id):
+    """선호도 행렬을 다시 계산해 캐시에 저장 (일기 저장 / 삭제 후 호출)"""
+    return preferences_cache.refresh(user_id, partial(compute_preferences, user_id))
+
+
+def get_preferences(user_id):
+    return preferences_cache.get_or_set(user_id, partial(compute_preferences, user_id))
+
+
+def rank_outfits(user_id, band, candidates):
+    """
+    후보 코디를 기본 점수 + 개인 선호도 점수 순으로 정렬
+    candidates: [(코디, 기본 점수), ...]
+    """
+    outfits = [outfit for outfit, _ in candidates]
+    scores = np.array([base for _, base in candidates], dtype=np.float32)
+
+    if get_bool("recommend_personalization", True):
+        preferences = get_preferences(user_id)
+        if preferences is not None:
+            matrix = np.stack([_vector(outfit) for outfit in outfits])
+            scores += PERSONALIZE_WEIGHT * (matrix @ preferences[band])
+
+    order = np.argsort(-scores, kind="stable")
+    return [outfits[i] for i in order]
@@ -1,10 +1,22 @@
+from apps.weather.services.interpolation_service import estimate_weather
+
+# 좌표가 없거나 수집된 날씨가 없을 때의 기본값
+DEFAULT_WEATHER = {
+    "temperature": 22.5,
+    "condition": "Clear",
+}
+
+
 def get_weather_data(latitude: float, longitude: float) -> dict:
     """
-    임시
-    실제로는 OpenWeather API 등을 호출해서 데이터를 받아올 예정.
-    현재는 테스트용으로 임의 값 반환.
+    임의 좌표의 현재 날씨
+    - 수집된 위치들의 최신 날씨를 역거리 가중(IDW)으로 보간 (apps.weather 스냅샷)
     """
-    return {
-        "temperature": 22.5,  # 임시 기온
-        "condition": "Clear",  # 임시 날씨
-    }
+    try:
+        latitude, longitude = float(latitude), float(longitude)
+    except (TypeError, ValueError):
+        return dict(DEFAULT_WEATHER)
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return dict(DEFAULT_WEATHER)
+
+    return estimate_weather(latitude, longitude) or dict(DEFAULT_WEATHER)
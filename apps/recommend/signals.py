@@ -0,0 +1,40 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from apps.core.signals import post_bulk_restore, post_bulk_soft_delete
+
+from .services.personalize_service import refresh_preferences
+
+
+def _on_diary_changed(sender, instance, **kwargs):
+    # 요청 시점에는 캐시된 행렬만 읽도록 일기 변경 직후 미리 다시 계산
+    transaction.on_commit(partial(refresh_preferences, instance.user_id))
+
+
+def _on_diary_deleted(sender, instance, **kwargs):
+    # 이미 soft delete 된 일기의 실제 삭제(아카이브)는 선호도에 영향 없음
+    if instance.deleted_at is None:
+        _on_diary_changed(sender, instance, **kwargs)
+
+
+def _on_diary_changed_bulk(sender, queryset, **kwargs):
+    # QuerySet.delete() / restore() - 일기가 바뀐 사용자마다 다시 계산
+    for user_id in queryset.values_list("user_id", flat=True).distinct():
+        transaction.on_commit(partial(refresh_preferences, user_id))
+
+
+def connect():
+    post_save.connect(
+        _on_diary_changed, sender="diary.Diary", dispatch_uid="recommend_preferences"
+    )
+    post_delete.connect(
+        _on_diary_deleted, sender="diary.Diary", dispatch_uid="recommend_preferences"
+    )
+    for signal in (post_bulk_soft_delete, post_bulk_restore):
+        signal.connect(
+            _on_diary_changed_bulk,
+            sender="diary.Diary",
+            dispatch_uid="recommend_preferences_bulk",
+        )
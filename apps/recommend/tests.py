@@ -1,3 +1,53 @@
-from django.test import TestCase
+from datetime import date
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.diary.models import Diary
+from apps.locations.models import Location
+from apps.users.models import User
+from apps.weather.models import WeatherData
+
+from .services.personalize_service import get_preferences
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class PreferenceInvalidationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email="recommend@example.com", password="x")
+        location = Location.objects.create(
+            city="서울특별시", district="강남구", latitude=37.5, longitude=127
+        )
+        now = timezone.now()
+        weather = WeatherData.objects.create(
+            location=location,
+            base_time=now,
+            valid_time=now,
+            temperature=20,
+            feels_like=19,
+            humidity=50,
+            wind_speed=2,
+            condition="맑음",
+        )
+        Diary.objects.create(
+            user=cls.user,
+            date=date(2025, 1, 1),
+            weather_data=weather,
+            satisfaction=4,
+            title="산책",
+            notes="맑은 날",
+        )
+
+    def test_bulk_delete_and_restore_refresh_preferences(self):
+        self.assertIsNotNone(get_preferences(self.user.id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Diary.objects.filter(user=self.user).delete()
+        self.assertIsNone(get_preferences(self.user.id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Diary.all_objects.filter(user=self.user).restore()
+        self.assertIsNotNone(get_preferences(self.user.id))
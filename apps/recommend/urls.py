@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import OutfitRecommendView
+
+app_name = "recommend"
+urlpatterns = [
+    path("outfit/", OutfitRecommendView.as_view(), name="outfit"),
+]
@@ -10,7 +10,9 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import importlib.util
 import os
+import tempfile
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -44,6 +46,10 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    # OpClass 인덱스(trigram) / 전문 검색 등 Postgres 전용 기능
+    'django.contrib.postgres',
+    # 공통 (soft delete 기반 모델 등)
+    'apps.core',
     # user
     'apps.users',
     'apps.locations',
@@ -60,16 +66,22 @@ INSTALLED_APPS = [
     "drf_yasg",
     # chat
     'apps.chatbot',
+    # 이미지 업로드
+    'apps.uploads',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # 읽기 replica 라우팅 상태 초기화 / 쓰기 후 primary 고정 (다른 미들웨어의 DB 접근보다 바깥)
+    'apps.db_router.ReplicaStickinessMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # API 호출 수 집계 (DashboardStats.api_calls)
+    'apps.users.middleware.ApiCallMeteringMiddleware',
 ]
 
 ROOT_URLCONF = 'apps.urls'
@@ -95,6 +107,21 @@ WSGI_APPLICATION = 'apps.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# 커넥션 풀 (psycopg3 ConnectionPool, 워커 프로세스마다 1개)
+# - 요청마다 TCP 연결 + 인증 + 백엔드 프로세스 생성을 반복하지 않음
+# - 전체 최대 연결 수 = 워커 수 x DB_POOL_MAX_SIZE (Postgres max_connections 이내로 유지)
+# - 풀을 끄면 CONN_MAX_AGE 기반 영구 연결 사용 (ASGI 모드에서는 요청 스레드마다 연결이 남으므로 비권장)
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "1") == "1"
+DB_POOL_OPTIONS = {
+    "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+    "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+    # 풀이 가득 찼을 때 연결을 기다리는 최대 시간 (초) - 초과 시 PoolTimeout
+    "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+    # min_size 를 넘는 유휴 연결 정리 / 연결 재생성 주기 (초)
+    "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+    "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -103,9 +130,57 @@ DATABASES = {
         'PASSWORD': os.environ.get('POSTGRES_PASSWORD'),
         'HOST': os.environ.get('POSTGRES_HOST'),
         'PORT': os.environ.get('POSTGRES_PORT', 5432),
+        # 풀 사용 시 0 이어야 함 (연결 반납은 풀이 담당)
+        'CONN_MAX_AGE': (
+            0 if DB_POOL_ENABLED else int(os.getenv("DB_CONN_MAX_AGE", "60"))
+        ),
+        # 풀: 빌려줄 때마다 연결 상태 확인 / 영구 연결: 요청 시작 시 확인
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {"pool": DB_POOL_OPTIONS} if DB_POOL_ENABLED else {},
     }
 }
 
+# 읽기 전용 replica (예: "replica-db:5432,replica-db-2:5432") - 설정 시 replica_0, replica_1 ... 별칭 추가
+# ReplicaReadMixin 을 쓴 뷰의 조회만 replica 로 보내고 나머지는 모두 primary (apps/db_router.py)
+for _i, _replica in enumerate(
+    filter(None, os.getenv("POSTGRES_REPLICA_HOSTS", "").split(","))
+):
+    _host, _, _port = _replica.strip().partition(":")
+    DATABASES[f"replica_{_i}"] = {
+        **DATABASES["default"],
+        'HOST': _host,
+        'PORT': _port or DATABASES["default"]["PORT"],
+        # 테스트에서는 별도 DB 를 만들지 않고 default 를 그대로 사용
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['apps.db_router.PrimaryReplicaRouter']
+
+# 캐시 (gunicorn 워커 / 프로세스 간 공유)
+# - REDIS_URL 이 있으면 Redis, 없으면 파일 캐시로 대체 (같은 호스트의 워커끼리만 공유, 로컬 개발용)
+# - 앱별 네임스페이스 / 조기 만료 / hit·miss 지표는 apps/core/cache.py
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'team4',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv(
+                "CACHE_DIR", os.path.join(tempfile.gettempdir(), "team4-cache")
+            ),
+            'KEY_PREFIX': 'team4',
+            # 위치별 예보 / 사용자별 선호도 키가 기본 한도(300)를 넘으므로 여유 있게
+            'OPTIONS': {'MAX_ENTRIES': 20000},
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -143,17 +218,65 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# 업로드 파일 (apps.uploads)
+MEDIA_URL = os.environ.get("MEDIA_URL", "media/")
+MEDIA_ROOT = os.environ.get("MEDIA_ROOT", BASE_DIR / "media")
+
+# 기본 스토리지: 로컬 파일시스템
+# S3 호환 스토리지는 django-storages 설치 후 DEFAULT_STORAGE_BACKEND=storages.backends.s3.S3Storage
+STORAGES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "DEFAULT_STORAGE_BACKEND",
+            "django.core.files.storage.FileSystemStorage",
+        ),
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+# 이 크기를 넘는 업로드는 메모리 대신 임시 파일로 받음 (bytes)
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(
+    os.environ.get("FILE_UPLOAD_MAX_MEMORY_SIZE", 1024 * 1024)
+)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# orjson 이 설치되어 있으면 JSON 응답 렌더링 / 요청 파싱을 orjson 으로 처리 (apps/core/renderers.py)
+FAST_JSON_ENABLED = (
+    os.getenv("FAST_JSON_ENABLED", "1") == "1"
+    and importlib.util.find_spec("orjson") is not None
+)
+JSON_RENDERER = (
+    "apps.core.renderers.ORJSONRenderer"
+    if FAST_JSON_ENABLED
+    else "rest_framework.renderers.JSONRenderer"
+)
+JSON_PARSER = (
+    "apps.core.renderers.ORJSONParser"
+    if FAST_JSON_ENABLED
+    else "rest_framework.parsers.JSONParser"
+)
+
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
+    "DEFAULT_RENDERER_CLASSES": [
+        JSON_RENDERER,
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        JSON_PARSER,
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
 
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:35
+
+import apps.uploads.models
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadedImage',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'purpose',
+                    models.CharField(
+                        choices=[('diary', '일기'), ('recommendation', '코디 추천')],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    'original',
+                    models.FileField(
+                        max_length=255, upload_to=apps.uploads.models.original_upload_to
+                    ),
+                ),
+                ('content_type', models.CharField(max_length=50)),
+                ('size', models.PositiveBigIntegerField()),
+                ('width', models.PositiveIntegerField()),
+                ('height', models.PositiveIntegerField()),
+                ('variants', models.JSONField(blank=True, default=dict)),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('pending', '처리 중'),
+                            ('ready', '완료'),
+                            ('failed', '실패'),
+                        ],
+                        default='pending',
+                        max_length=10,
+                    ),
+                ),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                (
+                    'user',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='uploaded_images',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                'db_table': 'uploaded_images',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+User = settings.AUTH_USER_MODEL
+
+
+# 저장 확장자 (image_service.ALLOWED_FORMATS 의 content_type 기준)
+IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+
+
+def original_upload_to(instance, filename):
+    """
+    uploads/<용도>/<yyyy/mm>/<uuid>.<확장자> - 원본 파일명은 경로에 쓰지 않음
+    확장자는 클라이언트 파일명이 아니라 inspect_image 가 판별한 형식(content_type)으로 결정
+    """
+    ext = IMAGE_EXTENSIONS.get(instance.content_type, "")
+    return f"uploads/{instance.purpose}/{timezone.now():%Y/%m}/{uuid.uuid4().hex}{ext}"
+
+
+class UploadedImage(models.Model):
+    """
+    일기 / 코디 추천 이미지 업로드
+    - 원본은 STORAGES["default"] (로컬 파일시스템 또는 S3 호환 스토리지)에 저장
+    - 썸네일 등 축소본은 백그라운드 워커가 생성해 variants 에 기록
+    """
+
+    PURPOSE_CHOICES = [
+        ("diary", "일기"),
+        ("recommendation", "코디 추천"),
+    ]
+    STATUS_PENDING = "pending"
+    STATUS_READY = "ready"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "처리 중"),
+        (STATUS_READY, "완료"),
+        (STATUS_FAILED, "실패"),
+    ]
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="uploaded_images"
+    )
+    purpose = models.CharField(max_length=20, choices=PURPOSE_CHOICES)
+    original = models.FileField(upload_to=original_upload_to, max_length=255)
+    content_type = models.CharField(max_length=50)
+    size = models.PositiveBigIntegerField()  # bytes
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    variants = models.JSONField(default=dict, blank=True)  # {이름: 스토리지 경로}
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "uploaded_images"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.purpose} #{self.id} ({self.status})"
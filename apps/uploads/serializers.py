@@ -0,0 +1,41 @@
+from django.core.files.storage import default_storage
+from rest_framework import serializers
+
+from .models import UploadedImage
+
+
+class UploadedImageSerializer(serializers.ModelSerializer):
+    url = serializers.SerializerMethodField()
+    variants = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadedImage
+        fields = [
+            "id",
+            "purpose",
+            "url",
+            "variants",
+            "status",
+            "content_type",
+            "size",
+            "width",
+            "height",
+            "created_at",
+        ]
+
+    def _absolute(self, path):
+        url = default_storage.url(path)
+        request = self.context.get("request")
+        # 로컬 스토리지는 MEDIA_URL 기준 상대 경로이므로 절대 URL 로 변환
+        return request.build_absolute_uri(url) if request is not None else url
+
+    def get_url(self, obj):
+        return self._absolute(obj.original.name)
+
+    def get_variants(self, obj):
+        return {name: self._absolute(path) for name, path in obj.variants.items()}
+
+
+class ImageUploadSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    purpose = serializers.ChoiceField(choices=UploadedImage.PURPOSE_CHOICES)
@@ -0,0 +1,150 @@
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from ..models import UploadedImage
+
+logger = logging.getLogger(__name__)
+
+# 업로드 허용 크기 / 해상도 (압축 폭탄 방지)
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_MAX_PIXELS = int(os.getenv("UPLOAD_MAX_PIXELS", str(40_000_000)))
+
+# 축소본 생성 워커 수 (gunicorn 워커 1개 기준)
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+
+ALLOWED_FORMATS = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+}
+
+# 축소본 이름 → 긴 변 최대 픽셀 (큰 것부터 생성해 다음 축소의 원본으로 재사용)
+IMAGE_VARIANTS = {
+    "medium": 1080,
+    "thumbnail": 320,
+}
+VARIANT_FORMAT = "WEBP"
+VARIANT_QUALITY = 80
+
+
+class InvalidImage(Exception):
+    """이미지가 아니거나 허용하지 않는 형식 / 크기"""
+
+
+def inspect_image(uploaded_file):
+    """
+    헤더만 읽어 형식 / 해상도 확인 (픽셀 디코딩 없음)
+    반환: (content_type, width, height)
+    """
+    try:
+        with Image.open(uploaded_file) as img:
+            image_format, (width, height) = img.format, img.size
+    except Image.DecompressionBombError as e:
+        # 헤더 해상도가 Pillow 한도(MAX_IMAGE_PIXELS 의 2배)를 넘으면 열기 단계에서 거부됨
+        raise InvalidImage("해상도가 너무 큽니다") from e
+    except (UnidentifiedImageError, OSError) as e:
+        raise InvalidImage("이미지 파일이 아닙니다") from e
+    finally:
+        uploaded_file.seek(0)
+
+    if image_format not in ALLOWED_FORMATS:
+        raise InvalidImage(f"지원하지 않는 형식: {image_format}")
+    if width * height > UPLOAD_MAX_PIXELS:
+        raise InvalidImage("해상도가 너무 큽니다")
+    return ALLOWED_FORMATS[image_format], width, height
+
+
+def save_upload(user, purpose, uploaded_file):
+    """
+    원본 저장 + 축소본 생성 예약
+    - uploaded_file 은 Django 업로드 핸들러가 FILE_UPLOAD_MAX_MEMORY_SIZE 를 넘으면
+      임시 파일로 받아둔 것이므로 스토리지에도 청크 단위로 복사됨
+    """
+    content_type, width, height = inspect_image(uploaded_file)
+    image = UploadedImage.objects.create(
+        user=user,
+        purpose=purpose,
+        original=uploaded_file,
+        content_type=content_type,
+        size=uploaded_file.size,
+        width=width,
+        height=height,
+    )
+    transaction.on_commit(partial(submit_variants, image.id))
+    return image
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    # gunicorn fork 이후 워커별로 처음 필요할 때 생성
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=IMAGE_WORKERS, thread_name_prefix="image-variants"
+                )
+    return _executor
+
+
+def submit_variants(image_id):
+    return _get_executor().submit(_run_variants, image_id)
+
+
+def _run_variants(image_id):
+    close_old_connections()
+    try:
+        generate_variants(image_id)
+    except Exception:
+        logger.exception("이미지 축소본 생성 실패 (id=%s)", image_id)
+        UploadedImage.objects.filter(id=image_id).update(
+            status=UploadedImage.STATUS_FAILED
+        )
+    finally:
+        close_old_connections()
+
+
+def _encode(img):
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    buffer = io.BytesIO()
+    img.save(buffer, VARIANT_FORMAT, quality=VARIANT_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def generate_variants(image_id):
+    """원본을 한 번만 디코딩해 IMAGE_VARIANTS 크기별 WEBP 축소본 저장"""
+    image = UploadedImage.objects.get(id=image_id)
+    base, _ = os.path.splitext(image.original.name)
+    largest = max(IMAGE_VARIANTS.values())
+
+    variants = {}
+    with default_storage.open(image.original.name, "rb") as f, Image.open(f) as img:
+        # JPEG 은 디코딩 단계에서 1/2 ~ 1/8 로 축소 → 워커 메모리 사용량 감소
+        img.draft("RGB", (largest, largest))
+        current = ImageOps.exif_transpose(img)
+        for name, size in sorted(
+            IMAGE_VARIANTS.items(), key=lambda item: item[1], reverse=True
+        ):
+            current.thumbnail((size, size), Image.Resampling.LANCZOS)
+            variants[name] = default_storage.save(
+                f"{base}_{name}.webp", ContentFile(_encode(current))
+            )
+
+    UploadedImage.objects.filter(id=image_id).update(
+        variants=variants, status=UploadedImage.STATUS_READY
+    )
+    return variants
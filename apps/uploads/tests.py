@@ -0,0 +1,67 @@
+import io
+import struct
+import zlib
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from PIL import Image
+
+from .models import IMAGE_EXTENSIONS, UploadedImage, original_upload_to
+from .services.image_service import ALLOWED_FORMATS, InvalidImage, inspect_image
+
+
+def _png_header(width, height):
+    """픽셀 데이터 없이 IHDR 만 있는 PNG (헤더의 해상도만 검사되는지 확인용)"""
+
+    def chunk(kind, data):
+        crc = zlib.crc32(kind + data)
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IEND", b"")
+
+
+def _png(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class InspectImageTests(SimpleTestCase):
+    def test_valid_image(self):
+        upload = SimpleUploadedFile("a.png", _png(4, 3))
+
+        self.assertEqual(inspect_image(upload), ("image/png", 4, 3))
+        self.assertEqual(upload.tell(), 0)
+
+    def test_decompression_bomb_is_rejected_as_too_large(self):
+        # Pillow 한도의 2배를 넘는 해상도 → 열기 단계의 DecompressionBombError
+        upload = SimpleUploadedFile("bomb.png", _png_header(100_000, 100_000))
+
+        with self.assertRaisesMessage(InvalidImage, "해상도가 너무 큽니다"):
+            inspect_image(upload)
+
+    def test_resolution_over_upload_limit(self):
+        upload = SimpleUploadedFile("big.png", _png_header(8_000, 8_000))
+
+        with self.assertRaisesMessage(InvalidImage, "해상도가 너무 큽니다"):
+            inspect_image(upload)
+
+    def test_not_an_image(self):
+        upload = SimpleUploadedFile("a.png", b"<html></html>")
+
+        with self.assertRaisesMessage(InvalidImage, "이미지 파일이 아닙니다"):
+            inspect_image(upload)
+
+
+class OriginalUploadToTests(SimpleTestCase):
+    def test_every_allowed_format_has_extension(self):
+        self.assertLessEqual(set(ALLOWED_FORMATS.values()), set(IMAGE_EXTENSIONS))
+
+    def test_extension_comes_from_detected_format(self):
+        image = UploadedImage(purpose="diary", content_type="image/png")
+
+        path = original_upload_to(image, "photo.html")
+
+        self.assertTrue(path.startswith("uploads/diary/"))
+        self.assertTrue(path.endswith(".png"))
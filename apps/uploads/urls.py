@@ -0,0 +1,13 @@
+from django.urls import path
+
+from .views import ImageUploadView, UploadedImageDetailView
+
+app_name = "uploads"
+urlpatterns = [
+    path("images/", ImageUploadView.as_view(), name="image-upload"),
+    path(
+        "images/<int:pk>/",
+        UploadedImageDetailView.as_view(),
+        name="image-detail",
+    ),
+]
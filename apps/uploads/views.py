@@ -0,0 +1,67 @@
+from rest_framework import generics, status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .models import UploadedImage
+from .serializers import ImageUploadSerializer, UploadedImageSerializer
+from .services.image_service import UPLOAD_MAX_BYTES, InvalidImage, save_upload
+
+
+class ImageUploadView(generics.GenericAPIView):
+    """
+    POST /api/uploads/images/ (multipart: file, purpose=diary|recommendation)
+    - 원본 URL 은 바로 반환, 축소본(variants)은 생성 완료 후 조회 API 에서 확인
+    """
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+    serializer_class = ImageUploadSerializer
+
+    def post(self, request):
+        # 본문을 읽기 전에 Content-Length 로 먼저 거절
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > UPLOAD_MAX_BYTES:
+            return Response(
+                {"error": "파일 크기 초과", "error_status": "file_too_large"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": serializer.errors, "error_status": "invalid_request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        uploaded_file = serializer.validated_data["file"]
+        if uploaded_file.size > UPLOAD_MAX_BYTES:
+            return Response(
+                {"error": "파일 크기 초과", "error_status": "file_too_large"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        try:
+            image = save_upload(
+                request.user, serializer.validated_data["purpose"], uploaded_file
+            )
+        except InvalidImage as e:
+            return Response(
+                {"error": str(e), "error_status": "invalid_image"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        data = UploadedImageSerializer(image, context={"request": request}).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class UploadedImageDetailView(generics.RetrieveAPIView):
+    """GET /api/uploads/images/<id>/ - 축소본 생성 상태 확인"""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = UploadedImageSerializer
+
+    def get_queryset(self):
+        return UploadedImage.objects.filter(user=self.request.user)
@@ -15,6 +15,8 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import (
@@ -44,5 +46,11 @@ urlpatterns = [
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("api/users/", include("apps.users.urls", namespace="users")),
     path("api/location/", include("apps.locations.urls")),
+    path("api/weather/", include("apps.weather.urls", namespace="weather")),
     path("api/diary/", include("apps.diary.urls", namespace="diary")),
+    path("api/uploads/", include("apps.uploads.urls", namespace="uploads")),
+    path("api/recommend/", include("apps.recommend.urls", namespace="recommend")),
 ]
+
+# 로컬 파일시스템 스토리지 사용 시 개발 서버에서 업로드 파일 제공
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,49 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+from django_filters import rest_framework as filters
+
+from .models import User
+
+
+class AdminUserFilter(filters.FilterSet):
+    """
+    관리자 유저 목록 필터
+    - verified / deleted / staff: true | false
+    - joined_from / joined_to: YYYY-MM-DD (가입일 범위, 양 끝 포함)
+    - q: 이메일 / 닉네임 부분 검색 (trigram 인덱스 사용)
+    """
+
+    verified = filters.BooleanFilter(field_name="email_verified")
+    deleted = filters.BooleanFilter(method="filter_deleted")
+    staff = filters.BooleanFilter(field_name="is_staff")
+    joined_from = filters.DateFilter(method="filter_joined_from")
+    joined_to = filters.DateFilter(method="filter_joined_to")
+    q = filters.CharFilter(method="filter_search")
+
+    class Meta:
+        model = User
+        fields = ["verified", "deleted", "staff", "joined_from", "joined_to", "q"]
+
+    def filter_deleted(self, queryset, name, value):
+        return queryset.filter(deleted_at__isnull=not value)
+
+    @staticmethod
+    def _start_of_day(value):
+        return timezone.make_aware(datetime.combine(value, time.min))
+
+    # created_at__date 는 컬럼에 형변환이 걸려 인덱스를 못 타므로 시각 범위로 비교
+    def filter_joined_from(self, queryset, name, value):
+        return queryset.filter(created_at__gte=self._start_of_day(value))
+
+    def filter_joined_to(self, queryset, name, value):
+        end = self._start_of_day(value + timedelta(days=1))
+        return queryset.filter(created_at__lt=end)
+
+    def filter_search(self, queryset, name, value):
+        value = value.strip()
+        if not value:
+            return queryset
+        # icontains → UPPER(col) LIKE UPPER('%..%') : UPPER(col) trigram GIN 인덱스와 일치
+        return queryset.filter(Q(email__icontains=value) | Q(nickname__icontains=value))
@@ -0,0 +1,102 @@
+import math
+import time
+from datetime import datetime, timezone
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import F, Max
+
+from apps.users.models import StatCounter
+from apps.users.utils.stat_buffer import STAT_BUFFER_FLUSH_SECONDS
+
+# 카운터 이름 → (모델, live 행 조건)
+COUNTER_SOURCES = {
+    StatCounter.USERS: ("users.User", {"deleted_at__isnull": True}),
+    StatCounter.DIARIES: ("diary.Diary", {"deleted_at__isnull": True}),
+    StatCounter.CHAT_MESSAGES: ("chatbot.AiChatLogs", {}),
+    StatCounter.RECOMMENDATIONS: ("recommend.OutfitRecommendation", {}),
+}
+
+# 기준 시각 이전 이벤트의 증감값이 모든 워커의 버퍼에서 반영될 때까지 기다리는 시간 (초)
+SETTLE_SECONDS = STAT_BUFFER_FLUSH_SECONDS * 2
+
+
+class Command(BaseCommand):
+    help = (
+        "StatCounter 누적값을 실제 행 수와 비교해 보정 (id 구간 단위로 나눠서 COUNT)\n"
+        "- 기준 시각(watermark) 시점의 행 수와, 카운터 중 그 이전 이벤트분만 비교\n"
+        "- 차이만큼 상대적으로 더하므로 집계 중 / 이후에 반영되는 증감값은 그대로 유지"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50000)
+        parser.add_argument(
+            "--sleep", type=float, default=0.0, help="배치 사이 대기 시간(초)"
+        )
+
+    def handle(self, *args, **options):
+        for name, (model_label, live_filter) in COUNTER_SOURCES.items():
+            StatCounter.objects.get_or_create(name=name)
+            counter = StatCounter.objects.filter(name=name)
+
+            # 다음 정각 초를 기준 시각으로 공개 → 이후 flush 는 그 이후 이벤트분을 따로 기록
+            # (공개 전에 시작된 flush 는 공개 이전 = 기준 시각 이전 이벤트만 담고 있음)
+            watermark = math.floor(time.time()) + 2
+            counter.update(
+                watermark=datetime.fromtimestamp(watermark, tz=timezone.utc),
+                value_since_watermark=0,
+            )
+            self._sleep_until(watermark)
+
+            actual = self._count_live(
+                apps.get_model(model_label),
+                live_filter,
+                options["batch_size"],
+                options["sleep"],
+            )
+
+            self._sleep_until(watermark + SETTLE_SECONDS)
+            value, since = counter.values_list("value", "value_since_watermark").get()
+            drift = actual - (value - since)
+            counter.update(
+                value=F("value") + drift, watermark=None, value_since_watermark=0
+            )
+
+            if drift:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{name}: {value - since} -> {actual} (drift {drift:+d} 보정)"
+                    )
+                )
+            else:
+                self.stdout.write(f"{name}: {actual} (ok)")
+
+    @staticmethod
+    def _count_live(model, live_filter, batch_size, pause):
+        """
+        기준 시각 직후의 한 스냅샷에서 live 행 수 집계
+        - REPEATABLE READ: 배치 사이에 커밋된 삭제 / 복구가 뒤쪽 구간에만 보이지 않도록 함
+        - 배치 단위 COUNT 라 스냅샷을 오래 쥐어도 락은 잡지 않음
+        """
+        outer = connection.in_atomic_block
+        with transaction.atomic():
+            if not outer:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY"
+                    )
+            qs = model._base_manager.filter(**live_filter)
+            max_id = model._base_manager.aggregate(max_id=Max("id"))["max_id"] or 0
+            actual = 0
+            for lo in range(0, max_id, batch_size):
+                actual += qs.filter(id__gt=lo, id__lte=lo + batch_size).count()
+                if pause:
+                    time.sleep(pause)
+        return actual
+
+    @staticmethod
+    def _sleep_until(deadline):
+        remaining = deadline - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
@@ -0,0 +1,118 @@
+import os
+from collections import defaultdict
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject, empty
+
+from .utils.stat_buffer import BufferedCounter
+
+# 메모리 카운터를 DB 로 내보내는 주기 (초)
+API_METER_FLUSH_SECONDS = float(os.getenv("API_METER_FLUSH_SECONDS", "5"))
+
+
+class ApiCallMeter(BufferedCounter):
+    """
+    API 호출 수를 프로세스 메모리에 모았다가 주기적으로 한 번에 DB 반영
+    - record(): dict 카운트 증가만 수행 (요청당 수 마이크로초)
+    - flush(): 버킷당 UPDATE ... SET calls = calls + n 한 번
+      (일별 DashboardStats / 시간별 DashboardHourlyStats 합계도 함께 반영)
+    """
+
+    thread_name = "api-call-meter"
+
+    def record(self, route, status_class, user_tier):
+        from .models import DashboardHourlyStats
+
+        # 반영 시점이 아니라 호출 시점의 일 / 시간 버킷에 집계 (자정 / 정시 직전 호출 포함)
+        stat_hour = DashboardHourlyStats.current_hour()
+        stat_date = timezone.localdate(stat_hour)
+        self.add((stat_date, stat_hour, route, status_class, user_tier))
+
+    def write(self, counts):
+        from .models import ApiCallStats, DashboardHourlyStats, DashboardStats
+
+        daily = defaultdict(int)
+        hourly = defaultdict(int)
+        for (stat_date, stat_hour, route, status_class, user_tier), n in counts.items():
+            daily[stat_date] += n
+            hourly[stat_hour] += n
+            bucket = ApiCallStats.objects.filter(
+                stat_date=stat_date,
+                route=route,
+                status_class=status_class,
+                user_tier=user_tier,
+            )
+            if bucket.update(calls=F("calls") + n):
+                continue
+            try:
+                with transaction.atomic():
+                    ApiCallStats.objects.create(
+                        stat_date=stat_date,
+                        route=route,
+                        status_class=status_class,
+                        user_tier=user_tier,
+                        calls=n,
+                    )
+            except IntegrityError:
+                # 다른 워커가 먼저 버킷을 만든 경우
+                bucket.update(calls=F("calls") + n)
+
+        for stat_date, total in daily.items():
+            days = DashboardStats.objects.filter(stat_date=stat_date)
+            if not days.update(api_calls=F("api_calls") + total):
+                DashboardStats.objects.get_or_create(stat_date=stat_date)
+                days.update(api_calls=F("api_calls") + total)
+        for stat_hour, total in hourly.items():
+            DashboardHourlyStats.add(stat_hour, api_calls=total)
+
+
+api_call_meter = ApiCallMeter(API_METER_FLUSH_SECONDS)
+
+
+def _user_tier(request):
+    user = request.__dict__.get("user")
+    # 아직 평가되지 않은 세션 사용자는 익명으로 취급 (세션 조회 쿼리 방지)
+    if user is None or (isinstance(user, SimpleLazyObject) and user._wrapped is empty):
+        return "anonymous"
+    if not user.is_authenticated:
+        return "anonymous"
+    return "staff" if getattr(user, "is_staff", False) else "user"
+
+
+class ApiCallMeteringMiddleware:
+    """
+    라우트 / 상태코드 구간 / 사용자 등급별 API 호출 수 집계
+    - sync / async 모두 지원 (ASGI 모드에서 async 뷰 앞에 스레드 전환이 생기지 않도록)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        self._record(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        self._record(request, response)
+        return response
+
+    @staticmethod
+    def _record(request, response):
+        # 메모리 카운터 증가만 하므로 이벤트 루프에서 바로 호출해도 됨
+        match = request.resolver_match
+        route = match.route if match is not None else "<unmatched>"
+        api_call_meter.record(
+            route, f"{response.status_code // 100}xx", _user_tier(request)
+        )
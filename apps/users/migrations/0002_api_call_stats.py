@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApiCallStats',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('stat_date', models.DateField()),
+                ('route', models.CharField(max_length=255)),
+                ('status_class', models.CharField(max_length=3)),
+                ('user_tier', models.CharField(max_length=10)),
+                ('calls', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'api_call_stats',
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('stat_date', 'route', 'status_class', 'user_tier'),
+                        name='uq_api_call_stats_bucket',
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:24
+
+from django.db import migrations, models
+
+
+def seed_counters(apps, schema_editor):
+    # 기존 데이터 기준으로 카운터 초기값 설정 (이후에는 signal 로 증감)
+    StatCounter = apps.get_model('users', 'StatCounter')
+    sources = {
+        'users': apps.get_model('users', 'User').objects.filter(
+            deleted_at__isnull=True
+        ),
+        'diaries': apps.get_model('diary', 'Diary').objects.filter(
+            deleted_at__isnull=True
+        ),
+        'chat_messages': apps.get_model('chatbot', 'AiChatLogs').objects.all(),
+        'recommendations': apps.get_model(
+            'recommend', 'OutfitRecommendation'
+        ).objects.all(),
+    }
+    for name, qs in sources.items():
+        StatCounter.objects.update_or_create(name=name, defaults={'value': qs.count()})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_api_call_stats'),
+        ('diary', '0001_initial'),
+        ('chatbot', '0001_initial'),
+        ('recommend', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardHourlyStats',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('stat_hour', models.DateTimeField(unique=True)),
+                ('new_users', models.IntegerField(default=0)),
+                ('new_diaries', models.IntegerField(default=0)),
+                ('chat_messages', models.IntegerField(default=0)),
+                ('recommendations', models.IntegerField(default=0)),
+                ('api_calls', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'dashboard_hourly_stats',
+                'ordering': ['-stat_hour'],
+            },
+        ),
+        migrations.CreateModel(
+            name='StatCounter',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'stat_counters',
+            },
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='total_chat_messages',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='total_recommendations',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:25
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_incremental_dashboard_stats'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(
+                fields=['-created_at', '-id'], name='users_created_id_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'
+                ),
+                name='users_email_trgm_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('nickname'),
+                    name='gin_trgm_ops',
+                ),
+                name='users_nickname_trgm_idx',
+            ),
+        ),
+    ]
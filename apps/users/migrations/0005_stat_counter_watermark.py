@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 20:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_admin_user_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='statcounter',
+            name='value_since_watermark',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='statcounter',
+            name='watermark',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
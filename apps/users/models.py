@@ -1,7 +1,10 @@
 import os
 
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -32,6 +35,19 @@ class User(models.Model):
         db_table = "users"
         verbose_name = "User"
         verbose_name_plural = "Users"
+        indexes = [
+            # 관리자 목록 keyset 페이지네이션 (created_at DESC, id DESC)
+            models.Index(fields=["-created_at", "-id"], name="users_created_id_idx"),
+            # 관리자 검색 (icontains → UPPER(col) LIKE) 용 trigram 인덱스
+            GinIndex(
+                OpClass(Upper("email"), name="gin_trgm_ops"),
+                name="users_email_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("nickname"), name="gin_trgm_ops"),
+                name="users_nickname_trgm_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.email
@@ -164,6 +180,8 @@ class DashboardStats(models.Model):
     stat_date = models.DateField()
     total_users = models.IntegerField(default=0)
     total_diaries = models.IntegerField(default=0)
+    total_chat_messages = models.IntegerField(default=0)
+    total_recommendations = models.IntegerField(default=0)
     api_calls = models.IntegerField(default=0)
     created_at = models.DateTimeField(default=timezone.now)
 
@@ -172,16 +190,137 @@ class DashboardStats(models.Model):
 
     @classmethod
     def update_daily_status(cls):
+        """
+        StatCounter 의 누적값을 오늘 통계에 기록
+        - 전체 COUNT(*) 대신 signal 로 유지되는 카운터 행 몇 개만 읽음
+        """
         today = timezone.localdate()
-        total_users = User.objects.filter(deleted_at__isnull=True).count()
-        total_diaries = 0
-        api_calls = 0
+        counters = StatCounter.snapshot()
 
+        # api_calls 는 ApiCallMeteringMiddleware 가 주기적으로 누적하므로 덮어쓰지 않음
         stat, created = cls.objects.get_or_create(stat_date=today)
-        stat.total_users = total_users
-        stat.total_diaries = total_diaries
-        stat.api_calls = api_calls
-        stat.save()
+        stat.total_users = counters.get(StatCounter.USERS, 0)
+        stat.total_diaries = counters.get(StatCounter.DIARIES, 0)
+        stat.total_chat_messages = counters.get(StatCounter.CHAT_MESSAGES, 0)
+        stat.total_recommendations = counters.get(StatCounter.RECOMMENDATIONS, 0)
+        stat.save(
+            update_fields=[
+                "total_users",
+                "total_diaries",
+                "total_chat_messages",
+                "total_recommendations",
+            ]
+        )
+
+
+class DashboardHourlyStats(models.Model):
+    """시간대별 부하 통계 (관리자 대시보드 차트용)"""
+
+    stat_hour = models.DateTimeField(unique=True)  # 정시 단위로 절삭된 시각
+    new_users = models.IntegerField(default=0)
+    new_diaries = models.IntegerField(default=0)
+    chat_messages = models.IntegerField(default=0)
+    recommendations = models.IntegerField(default=0)
+    api_calls = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "dashboard_hourly_stats"
+        ordering = ["-stat_hour"]
+
+    @staticmethod
+    def current_hour():
+        return timezone.now().replace(minute=0, second=0, microsecond=0)
+
+    @classmethod
+    def add(cls, stat_hour=None, **deltas):
+        """해당 시간 버킷에 증감값을 더함 (행이 없으면 생성)"""
+        stat_hour = stat_hour or cls.current_hour()
+        updates = {field: F(field) + n for field, n in deltas.items()}
+        bucket = cls.objects.filter(stat_hour=stat_hour)
+        if bucket.update(**updates):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(stat_hour=stat_hour, **deltas)
+        except IntegrityError:
+            bucket.update(**updates)
+
+
+class StatCounter(models.Model):
+    """
+    대시보드용 누적 카운터
+    - 생성 / soft delete / 복구 signal 로 증감 (apps/users/signals.py)
+    - 증감값은 커밋 후 메모리에 모았다가 주기적으로 반영 (apps/users/utils/stat_buffer.py)
+    - 누락분은 reconcile_stats 명령으로 주기적으로 보정
+    - watermark: 보정 중 기준 시각 / value_since_watermark: value 중 그 이후 이벤트의 증감분
+    """
+
+    USERS = "users"
+    DIARIES = "diaries"
+    CHAT_MESSAGES = "chat_messages"
+    RECOMMENDATIONS = "recommendations"
+
+    name = models.CharField(max_length=50, unique=True)
+    value = models.BigIntegerField(default=0)
+    watermark = models.DateTimeField(null=True, blank=True)
+    value_since_watermark = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "stat_counters"
+
+    def __str__(self):
+        return f"{self.name} : {self.value}"
+
+    @classmethod
+    def add(cls, name, delta, since_watermark=0):
+        counter = cls.objects.filter(name=name)
+        changes = {
+            "value": F("value") + delta,
+            "value_since_watermark": F("value_since_watermark") + since_watermark,
+            "updated_at": timezone.now(),
+        }
+        if not counter.update(**changes):
+            cls.objects.get_or_create(name=name)
+            counter.update(**changes)
+
+    @classmethod
+    def watermarks(cls, names):
+        """보정 중인 카운터의 기준 시각 (epoch 초)"""
+        rows = cls.objects.filter(name__in=names, watermark__isnull=False)
+        return {
+            name: watermark.timestamp()
+            for name, watermark in rows.values_list("name", "watermark")
+        }
+
+    @classmethod
+    def snapshot(cls):
+        return dict(cls.objects.values_list("name", "value"))
+
+
+class ApiCallStats(models.Model):
+    """
+    API 호출 집계 (일자 / 라우트 / 상태코드 구간 / 사용자 등급 단위)
+    - 요청마다 쓰지 않고 미들웨어가 메모리에 모은 값을 주기적으로 더함
+    """
+
+    stat_date = models.DateField()
+    route = models.CharField(max_length=255)  # URL 패턴 (예: api/diary/<pk>/)
+    status_class = models.CharField(max_length=3)  # 2xx / 4xx / 5xx
+    user_tier = models.CharField(max_length=10)  # anonymous / user / staff
+    calls = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "api_call_stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["stat_date", "route", "status_class", "user_tier"],
+                name="uq_api_call_stats_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.stat_date} {self.route} {self.status_class} ({self.calls})"
 
 
 class SystemSettings(models.Model):
@@ -0,0 +1,89 @@
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CreatedAtKeysetPagination(BasePagination):
+    """
+    (created_at, id) 기준 keyset 페이지네이션
+    - OFFSET 없이 직전 페이지 마지막 행 이후만 조회 → 페이지 깊이와 무관하게 일정한 비용
+    - 최신 가입순 (created_at DESC, id DESC)
+    """
+
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, 0))
+        except ValueError:
+            size = 0
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            decoded = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("ascii")
+            created_at, pk = decoded.split("|")
+            return datetime.fromisoformat(created_at), int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def encode_cursor(created_at, pk):
+        raw = f"{created_at.isoformat()}|{pk}"
+        return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by("-created_at", "-id")
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            created_at, pk = cursor
+            # created_at <= c 범위 조건으로 (created_at, id) 인덱스 범위 스캔 유도
+            queryset = queryset.filter(created_at__lte=created_at).filter(
+                Q(created_at__lt=created_at) | Q(id__lt=pk)
+            )
+
+        rows = list(queryset[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        self.next_cursor = (
+            self.encode_cursor(rows[-1].created_at, rows[-1].id)
+            if self.has_next
+            else None
+        )
+        return rows
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -4,8 +4,11 @@ from django.utils import timezone
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from apps.core.serializers import EagerLoadingMixin
+
 from .models import (
     AdminAction,
+    DashboardHourlyStats,
     DashboardStats,
     EmailVerification,
     SocialAccount,
@@ -166,7 +169,7 @@ class AdminUserSerializer(serializers.ModelSerializer):
         read_only_fields = ["email"]
 
 
-class AdminActionSerializer(serializers.ModelSerializer):
+class AdminActionSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     admin_email = serializers.EmailField(source="admin.email", read_only=True)
     user_email = serializers.EmailField(source="user.email", read_only=True)
 
@@ -194,12 +197,27 @@ class DashboardStatsSerializer(serializers.ModelSerializer):
             "stat_date",
             "total_users",
             "total_diaries",
+            "total_chat_messages",
+            "total_recommendations",
             "api_calls",
             "created_at",
         ]
         read_only_fields = ["created_at"]
 
 
+class DashboardHourlyStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DashboardHourlyStats
+        fields = [
+            "stat_hour",
+            "new_users",
+            "new_diaries",
+            "chat_messages",
+            "recommendations",
+            "api_calls",
+        ]
+
+
 class SystemSettingsSerializer(serializers.ModelSerializer):
     class Meta:
         model = SystemSettings
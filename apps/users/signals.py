@@ -0,0 +1,149 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+
+from apps.core.signals import post_bulk_restore, post_bulk_soft_delete
+
+from .models import DashboardHourlyStats, StatCounter, SystemSettings
+from .utils.stat_buffer import stat_buffer
+from .utils.system_settings import bump_version
+
+# soft delete 되는 모델: 살아있는 행 수를 카운트
+SOFT_DELETE_COUNTERS = {
+    "users.User": (StatCounter.USERS, "new_users"),
+    "diary.Diary": (StatCounter.DIARIES, "new_diaries"),
+}
+
+# 추가만 되는 모델: 전체 행 수를 카운트
+APPEND_ONLY_COUNTERS = {
+    "chatbot.AiChatLogs": (StatCounter.CHAT_MESSAGES, "chat_messages"),
+    "recommend.OutfitRecommendation": (
+        StatCounter.RECOMMENDATIONS,
+        "recommendations",
+    ),
+}
+
+_UNKNOWN = object()
+
+
+def _count(counter, delta):
+    # 롤백된 변경은 세지 않도록 커밋 후 메모리 버퍼에만 더함 (DB 반영은 stat_buffer 주기마다)
+    transaction.on_commit(partial(stat_buffer.counter, counter, delta))
+
+
+def _count_hourly(field):
+    stat_hour = DashboardHourlyStats.current_hour()
+    transaction.on_commit(partial(stat_buffer.hourly, field, 1, stat_hour))
+
+
+def _remember_deleted_at(sender, instance, **kwargs):
+    # only()/defer() 로 deleted_at 이 빠진 경우 조회 쿼리를 만들지 않도록 __dict__ 로 확인
+    instance._stats_deleted_at = instance.__dict__.get("deleted_at", _UNKNOWN)
+
+
+def _on_soft_delete_model_saved(
+    counter, hourly_field, sender, instance, created, **kwargs
+):
+    alive = instance.deleted_at is None
+    if created:
+        if alive:
+            _count(counter, 1)
+        # raw: 아카이브 복구 / loaddata - 새로 생성된 행이 아님
+        if not kwargs.get("raw"):
+            _count_hourly(hourly_field)
+    else:
+        before = getattr(instance, "_stats_deleted_at", _UNKNOWN)
+        if before is not _UNKNOWN:
+            if before is None and not alive:  # soft delete
+                _count(counter, -1)
+            elif before is not None and alive:  # 복구
+                _count(counter, 1)
+    instance._stats_deleted_at = instance.deleted_at
+
+
+def _on_soft_delete_model_deleted(counter, sender, instance, **kwargs):
+    if instance.__dict__.get("deleted_at") is None:
+        _count(counter, -1)
+
+
+def _on_soft_delete_bulk_changed(counter, delta, sender, count, **kwargs):
+    # QuerySet.delete() / restore() - 바뀐 행 수만큼 한 번에 증감
+    _count(counter, delta * count)
+
+
+def _on_append_only_model_saved(
+    counter, hourly_field, sender, instance, created, **kwargs
+):
+    if created:
+        _count(counter, 1)
+        _count_hourly(hourly_field)
+
+
+def _on_append_only_model_deleted(counter, sender, instance, **kwargs):
+    _count(counter, -1)
+
+
+def _on_system_settings_changed(sender, **kwargs):
+    # 관리자 API(SystemSettingsDetailView) / admin / shell 어디서 수정해도 캐시 무효화
+    # 커밋 전에 다른 프로세스가 옛 값을 다시 읽지 않도록 커밋 이후 버전 증가
+    transaction.on_commit(bump_version)
+
+
+def connect():
+    """UsersConfig.ready() 에서 호출 - 다른 앱 모델은 문자열 sender 로 지연 연결"""
+    post_save.connect(
+        _on_system_settings_changed,
+        sender=SystemSettings,
+        dispatch_uid="system_settings_saved",
+    )
+    post_delete.connect(
+        _on_system_settings_changed,
+        sender=SystemSettings,
+        dispatch_uid="system_settings_deleted",
+    )
+
+    for sender, (counter, hourly_field) in SOFT_DELETE_COUNTERS.items():
+        post_init.connect(
+            _remember_deleted_at,
+            sender=sender,
+            dispatch_uid=f"stats_init_{counter}",
+        )
+        post_save.connect(
+            partial(_on_soft_delete_model_saved, counter, hourly_field),
+            sender=sender,
+            weak=False,
+            dispatch_uid=f"stats_save_{counter}",
+        )
+        post_delete.connect(
+            partial(_on_soft_delete_model_deleted, counter),
+            sender=sender,
+            weak=False,
+            dispatch_uid=f"stats_delete_{counter}",
+        )
+        post_bulk_soft_delete.connect(
+            partial(_on_soft_delete_bulk_changed, counter, -1),
+            sender=sender,
+            weak=False,
+            dispatch_uid=f"stats_bulk_delete_{counter}",
+        )
+        post_bulk_restore.connect(
+            partial(_on_soft_delete_bulk_changed, counter, 1),
+            sender=sender,
+            weak=False,
+            dispatch_uid=f"stats_bulk_restore_{counter}",
+        )
+
+    for sender, (counter, hourly_field) in APPEND_ONLY_COUNTERS.items():
+        post_save.connect(
+            partial(_on_append_only_model_saved, counter, hourly_field),
+            sender=sender,
+            weak=False,
+            dispatch_uid=f"stats_save_{counter}",
+        )
+        post_delete.connect(
+            partial(_on_append_only_model_deleted, counter),
+            sender=sender,
+            weak=False,
+            dispatch_uid=f"stats_delete_{counter}",
+        )
@@ -1,3 +1,316 @@
+import io
+import json
+import threading
+import time
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import transaction
+from django.db.models import F
 from django.test import TestCase
+from django.utils import timezone
+
+from . import signals
+from .management.commands import reconcile_stats
+from .middleware import ApiCallMeter
+from .models import (
+    ApiCallStats,
+    DashboardHourlyStats,
+    DashboardStats,
+    SocialAccount,
+    StatCounter,
+    User,
+)
+from .utils import oauth_client
+from .utils.oauth_client import OAuthProviderClient, ProviderMetadata
+from .utils.stat_buffer import StatBuffer
+
+
+class FakeGoogleHandler(BaseHTTPRequestHandler):
+    """
+    가짜 구글 OAuth 서버
+    - discovery 는 실제 구글처럼 token / OIDC userinfo(sub 반환) 엔드포인트를 알려줌
+    - v2 userinfo 는 id 반환
+    """
+
+    discovery_status = 200
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        base = f"http://127.0.0.1:{self.server.server_port}"
+        if self.path == "/.well-known/openid-configuration":
+            if self.discovery_status != 200:
+                self._send(self.discovery_status, {})
+                return
+            self._send(
+                200,
+                {
+                    "token_endpoint": f"{base}/discovered/token",
+                    "userinfo_endpoint": f"{base}/v1/userinfo",
+                },
+            )
+        elif self.path == "/v1/userinfo":
+            self._send(200, {"sub": "google-123", "email": "fake@example.com"})
+        elif self.path == "/oauth2/v2/userinfo":
+            self._send(200, {"id": "google-123", "email": "fake@example.com"})
+        else:
+            self._send(404, {})
+
+    def do_POST(self):
+        self.server.paths.append(self.path)
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path in ("/token", "/discovered/token"):
+            self._send(200, {"access_token": "fake-access-token"})
+        else:
+            self._send(404, {})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class GoogleLoginFakeServerTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGoogleHandler)
+        cls.server.paths = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.paths.clear()
+        FakeGoogleHandler.discovery_status = 200
+        metadata = ProviderMetadata(
+            token_endpoint=f"{self.base}/token",
+            userinfo_endpoint=f"{self.base}/oauth2/v2/userinfo",
+            discovery_url=f"{self.base}/.well-known/openid-configuration",
+        )
+        patches = [
+            mock.patch.dict(
+                oauth_client._clients,
+                {"google": OAuthProviderClient("google", metadata)},
+            ),
+            mock.patch.dict(
+                "os.environ",
+                {"GOOGLE_CLIENT_ID": "client", "GOOGLE_CLIENT_SECRET": "secret"},
+            ),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def login(self):
+        return self.client.post(
+            "/api/users/login/google/",
+            {"code": "code", "state": "state"},
+            content_type="application/json",
+        )
+
+    def test_discovery_path(self):
+        res = self.login()
+
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertIn("/discovered/token", self.server.paths)
+        # userinfo 는 discovery 의 OIDC 엔드포인트가 아니라 설정된 v2 엔드포인트 사용
+        self.assertIn("/oauth2/v2/userinfo", self.server.paths)
+        self.assertTrue(
+            SocialAccount.objects.filter(
+                provider="google", provider_user_id="google-123"
+            ).exists()
+        )
+
+    def test_static_metadata_path(self):
+        FakeGoogleHandler.discovery_status = 500
+
+        res = self.login()
+
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertIn("/token", self.server.paths)
+        self.assertNotIn("/discovered/token", self.server.paths)
+        self.assertTrue(
+            SocialAccount.objects.filter(
+                provider="google", provider_user_id="google-123"
+            ).exists()
+        )
+
+
+class StatBufferTests(TestCase):
+    def setUp(self):
+        # 백그라운드 반영 스레드가 테스트 도중 돌지 않도록 긴 주기의 버퍼로 교체
+        self.buffer = StatBuffer(interval=3600)
+        patches = [
+            mock.patch.object(signals, "stat_buffer", self.buffer),
+            # 테스트 트랜잭션 안에서 flush 하므로 연결을 닫지 않음
+            mock.patch("apps.users.utils.stat_buffer.close_old_connections"),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def counter(self):
+        counter = StatCounter.objects.filter(name=StatCounter.USERS).first()
+        return counter.value if counter else 0
+
+    def test_counts_are_buffered_until_flush(self):
+        before = self.counter()
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create(email="a@example.com", password="x")
+            User.objects.create(email="b@example.com", password="x")
+
+        # 커밋 시점에는 카운터 행을 건드리지 않음
+        self.assertEqual(self.counter(), before)
+
+        self.buffer.flush()
+
+        self.assertEqual(self.counter(), before + 2)
+        hourly = DashboardHourlyStats.objects.get(
+            stat_hour=DashboardHourlyStats.current_hour()
+        )
+        self.assertEqual(hourly.new_users, 2)
+
+    def test_rolled_back_changes_are_not_counted(self):
+        before = self.counter()
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    User.objects.create(email="a@example.com", password="x")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.buffer.flush()
+
+        self.assertEqual(self.counter(), before)
+
+
+class FakeClock:
+    """time.time / time.sleep 대체 - sleep 은 시각만 앞당김 (on_sleep 에 등록된 길이면 콜백 1회 실행)"""
+
+    def __init__(self, now):
+        self.now = now
+        self.on_sleep = {}
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        callback = self.on_sleep.pop(seconds, None)
+        if callback:
+            callback()
+
+
+class ReconcileStatsTests(TestCase):
+    def setUp(self):
+        self.buffer = StatBuffer(interval=3600)
+        self.clock = FakeClock(1_000_000.5)
+        patches = [
+            mock.patch.object(signals, "stat_buffer", self.buffer),
+            mock.patch("apps.users.utils.stat_buffer.close_old_connections"),
+            # 이벤트 시각만 가짜 시계로 (백그라운드 스레드의 sleep 은 실제 시간)
+            mock.patch(
+                "apps.users.utils.stat_buffer.time",
+                mock.Mock(time=self.clock.time, sleep=time.sleep),
+            ),
+            mock.patch.object(reconcile_stats, "time", self.clock),
+            mock.patch.dict(
+                reconcile_stats.COUNTER_SOURCES,
+                {StatCounter.USERS: reconcile_stats.COUNTER_SOURCES["users"]},
+                clear=True,
+            ),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_user(self, email):
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create(email=email, password="x")
+
+    def counter(self):
+        return StatCounter.objects.get(name=StatCounter.USERS)
+
+    def reconcile(self, **options):
+        call_command("reconcile_stats", stdout=io.StringIO(), **options)
+
+    def test_flush_landing_mid_scan_is_not_double_counted(self):
+        self.create_user("a@example.com")
+        self.buffer.flush()
+        StatCounter.objects.filter(name=StatCounter.USERS).update(value=F("value") + 5)
+        # 커밋됐지만 증감값은 아직 버퍼에 있는 행
+        self.create_user("b@example.com")
+
+        def flush_mid_scan():
+            # 기준 시각 이후에 생긴 행과, 기준 시각 이전 행의 증감값이 집계 도중 함께 반영됨
+            self.create_user("c@example.com")
+            self.buffer.flush()
+
+        # 첫 배치 사이 대기에서 flush 발생
+        self.clock.on_sleep[0.01] = flush_mid_scan
+        self.reconcile(batch_size=1, sleep=0.01)
+
+        counter = self.counter()
+        self.assertEqual(counter.value, User.objects.filter(deleted_at=None).count())
+        self.assertIsNone(counter.watermark)
+
+    def test_events_after_watermark_survive_correction(self):
+        self.create_user("a@example.com")
+        self.buffer.flush()
+        StatCounter.objects.filter(name=StatCounter.USERS).update(value=F("value") - 3)
+
+        self.reconcile()
+        self.create_user("b@example.com")
+        self.buffer.flush()
+
+        self.assertEqual(
+            self.counter().value, User.objects.filter(deleted_at=None).count()
+        )
+
+
+class ApiCallMeterTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch("apps.users.utils.stat_buffer.close_old_connections")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_calls_are_bucketed_by_call_time(self):
+        meter = ApiCallMeter(interval=3600)
+        before_midnight = timezone.make_aware(datetime(2025, 1, 1, 23, 59, 59))
+        with mock.patch("django.utils.timezone.now", return_value=before_midnight):
+            meter.record("api/diary/", "2xx", "user")
+        meter.record("api/diary/", "2xx", "user")
+
+        # 자정이 지난 뒤 반영해도 호출 시점의 날짜 / 시간에 집계
+        meter.flush()
 
-# Create your tests here.
+        previous_day = date(2025, 1, 1)
+        previous_hour = before_midnight.replace(minute=0, second=0)
+        self.assertEqual(
+            ApiCallStats.objects.get(stat_date=previous_day, route="api/diary/").calls,
+            1,
+        )
+        self.assertEqual(
+            DashboardStats.objects.get(stat_date=previous_day).api_calls, 1
+        )
+        self.assertEqual(
+            DashboardHourlyStats.objects.get(stat_hour=previous_hour).api_calls, 1
+        )
+        self.assertEqual(
+            DashboardStats.objects.get(stat_date=timezone.localdate()).api_calls, 1
+        )
@@ -4,13 +4,17 @@ from .views import (
     AdminActionListView,
     AdminUserListView,
     AdminUserStatusUpdateView,
+    CacheStatsView,
     ConfirmEmailView,
     CustomTokenRefreshView,
+    DashboardHourlyStatsListView,
     DashboardStatsListView,
+    DatabasePoolStatsView,
     GoogleLoginView,
     LoginView,
     LogoutView,
     NaverLoginView,
+    OAuthProviderStatsView,
     RequestEmailVerificationView,
     SignUpView,
     SystemSettingsDetailView,
@@ -60,6 +64,26 @@ urlpatterns = [
         DashboardStatsListView.as_view(),
         name="dashboard_stats_list",
     ),
+    path(
+        "admin/dashboard-stats/hourly/",
+        DashboardHourlyStatsListView.as_view(),
+        name="dashboard_hourly_stats_list",
+    ),
+    path(
+        "admin/oauth-stats/",
+        OAuthProviderStatsView.as_view(),
+        name="oauth_provider_stats",
+    ),
+    path(
+        "admin/db-pool-stats/",
+        DatabasePoolStatsView.as_view(),
+        name="db_pool_stats",
+    ),
+    path(
+        "admin/cache-stats/",
+        CacheStatsView.as_view(),
+        name="cache_stats",
+    ),
     path(
         "admin/system-settings/",
         SystemSettingsListView.as_view(),
@@ -0,0 +1,223 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, replace
+
+import httpx
+
+from apps.core.aio import loop_local
+from apps.core.metrics import LatencyHistogram
+
+# 소셜 로그인 요청 타임아웃 (connect, read) - 로그인 화면이 오래 멈추지 않도록 짧게 유지
+OAUTH_CONNECT_TIMEOUT = float(os.getenv("OAUTH_CONNECT_TIMEOUT", "2"))
+OAUTH_READ_TIMEOUT = float(os.getenv("OAUTH_READ_TIMEOUT", "5"))
+
+# 커넥션 풀 크기 (gunicorn 워커 1개 기준)
+OAUTH_POOL_MAXSIZE = int(os.getenv("OAUTH_POOL_MAXSIZE", "10"))
+
+# 서킷 브레이커: 연속 실패 N회 → 일정 시간 동안 요청 차단
+OAUTH_BREAKER_THRESHOLD = int(os.getenv("OAUTH_BREAKER_THRESHOLD", "5"))
+OAUTH_BREAKER_RESET_SECONDS = float(os.getenv("OAUTH_BREAKER_RESET_SECONDS", "30"))
+
+# 제공자 메타데이터(discovery) 캐시 유지 시간
+OAUTH_METADATA_TTL = float(os.getenv("OAUTH_METADATA_TTL", "86400"))
+
+
+class ProviderUnavailable(Exception):
+    """서킷이 열려 있어 제공자 호출을 건너뛴 경우"""
+
+
+@dataclass(frozen=True)
+class ProviderMetadata:
+    token_endpoint: str
+    userinfo_endpoint: str
+    token_method: str = "POST"
+    discovery_url: str | None = None
+
+
+PROVIDER_METADATA = {
+    "naver": ProviderMetadata(
+        token_endpoint="https://nid.naver.com/oauth2.0/token",
+        userinfo_endpoint="https://openapi.naver.com/v1/nid/me",
+        token_method="GET",
+    ),
+    "google": ProviderMetadata(
+        token_endpoint="https://oauth2.googleapis.com/token",
+        userinfo_endpoint="https://www.googleapis.com/oauth2/v2/userinfo",
+        discovery_url="https://accounts.google.com/.well-known/openid-configuration",
+    ),
+}
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커
+    - closed: 정상 호출
+    - open: reset_seconds 동안 호출 차단
+    - half-open: 차단 시간이 지나면 요청 1건만 시험 삼아 통과
+    """
+
+    def __init__(self, threshold, reset_seconds):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+    @property
+    def state(self):
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_seconds:
+            return "open"
+        return "half-open"
+
+
+@loop_local
+def _async_http_client():
+    """keep-alive 커넥션 풀 (연결 실패만 재시도, 제공자 공용)"""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(OAUTH_READ_TIMEOUT, connect=OAUTH_CONNECT_TIMEOUT),
+        limits=httpx.Limits(max_keepalive_connections=OAUTH_POOL_MAXSIZE),
+        transport=httpx.AsyncHTTPTransport(retries=2),
+    )
+
+
+class OAuthProviderClient:
+    """
+    소셜 로그인 제공자별 공용 HTTP 클라이언트
+    - 세션 재사용으로 매 로그인마다 TLS 핸드셰이크를 반복하지 않음
+    - 제공자별 서킷 브레이커 / 지연시간 히스토그램 기록
+    - async 뷰에서 호출 (응답 대기 중 워커가 다른 요청 처리)
+    """
+
+    def __init__(self, provider, metadata):
+        self.provider = provider
+        self._static_metadata = metadata
+        self._metadata = metadata
+        self._metadata_loaded_at = None
+        self.breaker = CircuitBreaker(
+            OAUTH_BREAKER_THRESHOLD, OAUTH_BREAKER_RESET_SECONDS
+        )
+        self.latency = {
+            "token": LatencyHistogram(),
+            "userinfo": LatencyHistogram(),
+        }
+
+    async def ametadata(self):
+        """
+        discovery 문서가 있는 제공자는 token 엔드포인트를 TTL 동안 캐시
+        userinfo 는 설정값 고정 - discovery 의 OIDC userinfo 는 응답 형식(sub / id)이 달라
+        뷰의 프로필 파싱이 깨질 수 있음
+        """
+        discovery_url = self._static_metadata.discovery_url
+        if not discovery_url:
+            return self._metadata
+        if (
+            self._metadata_loaded_at is not None
+            and time.monotonic() - self._metadata_loaded_at < OAUTH_METADATA_TTL
+        ):
+            return self._metadata
+
+        try:
+            res = await _async_http_client().get(discovery_url)
+            res.raise_for_status()
+            doc = res.json()
+            self._metadata = replace(
+                self._static_metadata,
+                token_endpoint=doc.get(
+                    "token_endpoint", self._static_metadata.token_endpoint
+                ),
+            )
+        except (httpx.HTTPError, ValueError):
+            # discovery 실패 시 기본 엔드포인트 사용, 다음 TTL 주기에 재시도
+            self._metadata = self._static_metadata
+        self._metadata_loaded_at = time.monotonic()
+        return self._metadata
+
+    async def _arequest(self, operation, method, url, **kwargs):
+        if not self.breaker.allow():
+            raise ProviderUnavailable(self.provider)
+
+        started = time.perf_counter()
+        try:
+            res = await _async_http_client().request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.breaker.record_failure()
+            raise
+        finally:
+            self.latency[operation].observe(time.perf_counter() - started)
+
+        # 4xx 는 잘못된 code 등 클라이언트 문제이므로 서킷 실패로 세지 않음
+        if res.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        res.raise_for_status()
+        return res.json()
+
+    async def afetch_token(self, params):
+        meta = await self.ametadata()
+        if meta.token_method == "GET":
+            return await self._arequest(
+                "token", "GET", meta.token_endpoint, params=params
+            )
+        return await self._arequest("token", "POST", meta.token_endpoint, data=params)
+
+    async def afetch_profile(self, access_token):
+        meta = await self.ametadata()
+        headers = {"Authorization": f"Bearer {access_token}"}
+        return await self._arequest(
+            "userinfo", "GET", meta.userinfo_endpoint, headers=headers
+        )
+
+    def stats(self):
+        return {
+            "circuit": self.breaker.state,
+            "latency": {op: h.snapshot() for op, h in self.latency.items()},
+        }
+
+
+_clients: dict[str, OAuthProviderClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_provider_client(provider):
+    """프로세스당 제공자별 클라이언트 1개를 공유"""
+    client = _clients.get(provider)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(provider)
+            if client is None:
+                client = OAuthProviderClient(provider, PROVIDER_METADATA[provider])
+                _clients[provider] = client
+    return client
+
+
+def get_provider_stats():
+    return {provider: client.stats() for provider, client in _clients.items()}
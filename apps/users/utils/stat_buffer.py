@@ -0,0 +1,135 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# 대시보드 카운터 증감값을 DB 로 내보내는 주기 (초)
+STAT_BUFFER_FLUSH_SECONDS = float(os.getenv("STAT_BUFFER_FLUSH_SECONDS", "5"))
+
+
+class BufferedCounter:
+    """
+    키별 증감값을 프로세스 메모리에 모았다가 주기적으로 한 번에 DB 반영
+    - add(): dict 카운트 증가만 수행 (호출당 수 마이크로초, DB 락 없음)
+    - flush(): 서브클래스의 write(counts) 를 한 트랜잭션으로 실행, 실패 시 다음 주기에 재시도
+    """
+
+    thread_name = "buffered-counter"
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, key, n=1):
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + n
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        # gunicorn fork 이후 첫 기록 시 워커별로 한 번만 시작
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name=self.thread_name, daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("%s 집계 반영 실패", self.thread_name)
+
+    def _drain(self):
+        with self._lock:
+            counts, self._counts = self._counts, {}
+        return counts
+
+    def _restore(self, counts):
+        # DB 반영 실패 시 다음 주기에 다시 시도하도록 되돌림
+        with self._lock:
+            for key, n in counts.items():
+                self._counts[key] = self._counts.get(key, 0) + n
+
+    def flush(self):
+        counts = self._drain()
+        if not counts:
+            return
+
+        close_old_connections()
+        try:
+            # 일부 키만 반영된 채 실패하면 재시도 시 중복 집계되므로 한 트랜잭션으로 처리
+            with transaction.atomic():
+                self.write(counts)
+        except Exception:
+            self._restore(counts)
+            raise
+
+    def write(self, counts):
+        raise NotImplementedError
+
+
+class StatBuffer(BufferedCounter):
+    """
+    StatCounter / DashboardHourlyStats 증감값 버퍼
+    - 생성 / 삭제 signal 마다 카운터 행을 UPDATE 하면 같은 행에 쓰기가 몰려
+      호출한 쪽 트랜잭션이 커밋될 때까지 다른 요청이 행 락을 기다림
+    - 메모리에 모아 주기마다 카운터당 UPDATE 한 번으로 반영
+    """
+
+    thread_name = "stat-buffer"
+
+    def counter(self, name, delta):
+        if delta:
+            # reconcile_stats 가 기준 시각 전후의 증감분을 나눌 수 있도록 이벤트 시각(초)을 키에 포함
+            self.add(("counter", name, int(time.time())), delta)
+
+    def hourly(self, field, n=1, stat_hour=None):
+        from ..models import DashboardHourlyStats
+
+        # 이벤트가 발생한 시간 버킷에 반영 (반영 시점이 다음 시간으로 넘어가도 유지)
+        stat_hour = stat_hour or DashboardHourlyStats.current_hour()
+        self.add(("hourly", stat_hour, field), n)
+
+    def write(self, counts):
+        from ..models import DashboardHourlyStats, StatCounter
+
+        counters = defaultdict(dict)
+        hourly = defaultdict(dict)
+        for key, n in counts.items():
+            if not n:
+                continue
+            if key[0] == "counter":
+                _, name, second = key
+                counters[name][second] = n
+            else:
+                _, stat_hour, field = key
+                hourly[stat_hour][field] = n
+
+        watermarks = StatCounter.watermarks(counters) if counters else {}
+        for name, deltas in counters.items():
+            watermark = watermarks.get(name)
+            since = sum(
+                n
+                for second, n in deltas.items()
+                if watermark is not None and second >= watermark
+            )
+            StatCounter.add(name, sum(deltas.values()), since)
+        for stat_hour, deltas in hourly.items():
+            DashboardHourlyStats.add(stat_hour, **deltas)
+
+
+stat_buffer = StatBuffer(STAT_BUFFER_FLUSH_SECONDS)
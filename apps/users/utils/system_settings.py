@@ -0,0 +1,113 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from apps.core.cache import namespace
+
+SETTINGS_VERSION_KEY = "version"
+settings_cache = namespace("system_settings")
+
+# 버전 확인 주기 (초) - 이 사이의 조회는 DB / 캐시 접근 없이 dict 조회만 수행
+SETTINGS_CHECK_INTERVAL = float(os.getenv("SETTINGS_CHECK_INTERVAL", "2"))
+# 버전 변경을 놓치더라도(프로세스별 캐시 등) 이 시간이 지나면 강제로 다시 로드
+SETTINGS_MAX_STALENESS = float(os.getenv("SETTINGS_MAX_STALENESS", "60"))
+
+_TRUE_VALUES = {"1", "true", "yes", "on", "y"}
+_FALSE_VALUES = {"0", "false", "no", "off", "n", ""}
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    version: int
+    values: MappingProxyType
+    loaded_at: float
+
+
+_snapshot: SettingsSnapshot | None = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _current_version():
+    return settings_cache.get(SETTINGS_VERSION_KEY, 0)
+
+
+def _load(version):
+    from ..models import SystemSettings
+
+    values = dict(SystemSettings.objects.values_list("key", "value"))
+    return SettingsSnapshot(
+        version=version, values=MappingProxyType(values), loaded_at=time.monotonic()
+    )
+
+
+def get_snapshot():
+    """
+    SystemSettings 전체를 담은 불변 스냅샷
+    - SETTINGS_CHECK_INTERVAL 마다 전역 버전 번호만 확인
+    - 버전이 바뀌었을 때만 전체 행을 다시 읽음
+    """
+    global _snapshot, _checked_at
+
+    now = time.monotonic()
+    snap = _snapshot
+    if snap is not None and now - _checked_at < SETTINGS_CHECK_INTERVAL:
+        return snap
+
+    with _lock:
+        snap = _snapshot
+        if snap is not None and now - _checked_at < SETTINGS_CHECK_INTERVAL:
+            return snap
+
+        version = _current_version()
+        if (
+            snap is None
+            or snap.version != version
+            or now - snap.loaded_at >= SETTINGS_MAX_STALENESS
+        ):
+            snap = _load(version)
+            _snapshot = snap
+        _checked_at = now
+        return snap
+
+
+def bump_version():
+    """설정 변경 시 호출 - 모든 프로세스가 다음 확인 시점에 다시 로드"""
+    global _snapshot
+
+    settings_cache.bump(SETTINGS_VERSION_KEY)
+    # 현재 프로세스는 즉시 반영
+    with _lock:
+        _snapshot = None
+
+
+def get_setting(key, default=None):
+    return get_snapshot().values.get(key, default)
+
+
+def get_int(key, default=0):
+    try:
+        return int(get_snapshot().values[key])
+    except (KeyError, ValueError):
+        return default
+
+
+def get_float(key, default=0.0):
+    try:
+        return float(get_snapshot().values[key])
+    except (KeyError, ValueError):
+        return default
+
+
+def get_bool(key, default=False):
+    value = get_snapshot().values.get(key)
+    if value is None:
+        return default
+    value = value.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    return default
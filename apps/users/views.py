@@ -1,7 +1,9 @@
 import os
 from datetime import timedelta
 
-import requests
+import httpx
+from adrf import generics as async_generics
+from asgiref.sync import sync_to_async
 from django.contrib.auth.hashers import check_password, make_password
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -12,8 +14,14 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken, TokenError
 from rest_framework_simplejwt.views import TokenRefreshView
 
+from apps.core.cache import cache_stats
+from apps.core.metrics import database_pool_stats
+from apps.core.views import EagerLoadingViewMixin, ReplicaReadMixin
+
+from .filters import AdminUserFilter
 from .models import (
     AdminAction,
+    DashboardHourlyStats,
     DashboardStats,
     EmailVerification,
     SocialAccount,
@@ -21,10 +29,12 @@ from .models import (
     Token,
     User,
 )
+from .pagination import CreatedAtKeysetPagination
 from .serializers import (
     AdminActionSerializer,
     AdminUserSerializer,
     ConfirmEmailSerializer,
+    DashboardHourlyStatsSerializer,
     DashboardStatsSerializer,
     EmailVerificationRequestSerializer,
     LogoutSerializer,
@@ -35,6 +45,11 @@ from .serializers import (
     UserSerializer,
 )
 from .utils.email_token import confirm_email_token, generate_email_token
+from .utils.oauth_client import (
+    ProviderUnavailable,
+    get_provider_client,
+    get_provider_stats,
+)
 from .utils.send_email import send_verification_email
 
 NAVER_CLIENT_ID = os.getenv('NAVER_CLIENT_ID')
@@ -283,13 +298,39 @@ class TokenRevokeView(generics.GenericAPIView):
             return Response({"error": "토큰 없음"}, 404)
 
 
+def _provider_unavailable_response():
+    return Response(
+        {"error": "소셜 로그인 일시 중단", "error_status": "provider_unavailable"},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+def _issue_login_tokens(user):
+    """소셜 로그인 성공 시 JWT 발급 + Token 기록 (응답 본문 반환)"""
+    refresh = RefreshToken.for_user(user)
+    Token.objects.create(
+        user=user,
+        access_jwt=str(refresh.access_token),
+        refresh_jwt=str(refresh),
+        access_expires_at=timezone.now() + timedelta(minutes=5),
+        refresh_expires_at=timezone.now() + timedelta(days=7),
+    )
+    return {
+        "access": str(refresh.access_token),
+        "refresh": str(refresh),
+        "email": user.email,
+        "nickname": user.nickname,
+    }
+
+
 # 네이버 로그인
 # 추후 구글,카카오 구현 할 것
-class NaverLoginView(generics.GenericAPIView):
+# 소셜 로그인은 제공자 응답 대기가 대부분이라 async 로 처리 (ASGI 모드에서 워커를 점유하지 않음)
+class NaverLoginView(async_generics.GenericAPIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = SocialAccountSerializer
 
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         code = request.data.get("code")
         state = request.data.get("state")
         if not code or not state:
@@ -301,7 +342,7 @@ class NaverLoginView(generics.GenericAPIView):
         if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
             return Response({"error": "서버 환경변수 미설정"}, 500)
 
-        token_url = "https://nid.naver.com/oauth2.0/token"
+        client = get_provider_client("naver")
         token_params = {
             "grant_type": "authorization_code",
             "client_id": NAVER_CLIENT_ID,
@@ -311,24 +352,21 @@ class NaverLoginView(generics.GenericAPIView):
         }
 
         try:
-            token_res = requests.get(token_url, params=token_params, timeout=5)
-            token_res.raise_for_status()
-            token_data = token_res.json()
-        except requests.RequestException as e:
+            token_data = await client.afetch_token(token_params)
+        except ProviderUnavailable:
+            return _provider_unavailable_response()
+        except (httpx.HTTPError, ValueError) as e:
             return Response({"error": "토큰 요청 실패", "detail": str(e)}, 400)
 
         access_token = token_data.get("access_token")
         if not access_token:
             return Response({"error": "토큰 요청 실패", "detail": token_data}, 400)
 
-        profile_url = "https://openapi.naver.com/v1/nid/me"
-        headers = {"Authorization": f"Bearer {access_token}"}
-
         try:
-            profile_res = requests.get(profile_url, headers=headers, timeout=5)
-            profile_res.raise_for_status()
-            profile_data = profile_res.json()
-        except requests.RequestException as e:
+            profile_data = await client.afetch_profile(access_token)
+        except ProviderUnavailable:
+            return _provider_unavailable_response()
+        except (httpx.HTTPError, ValueError) as e:
             return Response({"error": "프로필 요청 실패", "detail": str(e)}, 400)
 
         if profile_data.get("resultcode") != "00":
@@ -341,39 +379,22 @@ class NaverLoginView(generics.GenericAPIView):
         nickname = naver_user.get("nickname")
         provider_user_id = naver_user.get("id")
 
-        user, _ = User.objects.get_or_create(
+        user, _ = await User.objects.aget_or_create(
             email=email,
             defaults={"nickname": nickname, "email_verified": True, "password": "!"},
         )
-        SocialAccount.objects.get_or_create(
+        await SocialAccount.objects.aget_or_create(
             user=user, provider="naver", provider_user_id=provider_user_id
         )
 
-        refresh = RefreshToken.for_user(user)
-        Token.objects.create(
-            user=user,
-            access_jwt=str(refresh.access_token),
-            refresh_jwt=str(refresh),
-            access_expires_at=timezone.now() + timedelta(minutes=5),
-            refresh_expires_at=timezone.now() + timedelta(days=7),
-        )
-
-        return Response(
-            {
-                "access": str(refresh.access_token),
-                "refresh": str(refresh),
-                "email": user.email,
-                "nickname": user.nickname,
-            },
-            200,
-        )
+        return Response(await sync_to_async(_issue_login_tokens)(user), 200)
 
 
-class GoogleLoginView(generics.GenericAPIView):
+class GoogleLoginView(async_generics.GenericAPIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = SocialAccountSerializer
 
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         code = request.data.get("code")
         state = request.data.get("state")
         if not code or not state:
@@ -384,20 +405,21 @@ class GoogleLoginView(generics.GenericAPIView):
 
         if not google_client_id or not google_client_secret:
             return Response({"error": "서버 환경변수 미설정"}, 500)
-        token_url = "https://oauth2.googleapis.com/token"
+
+        client = get_provider_client("google")
         token_data = {
             "code": code,
-            "client_id": GOOGLE_CLIENT_ID,
-            "client_secret": GOOGLE_CLIENT_SECRET,
+            "client_id": google_client_id,
+            "client_secret": google_client_secret,
             "redirect_uri": "http://localhost:8000/login/google/callback",
             "grant_type": "authorization_code",
         }
 
         try:
-            token_res = requests.post(token_url, data=token_data, timeout=5)
-            token_res.raise_for_status()
-            token_json = token_res.json()
-        except requests.RequestException as e:
+            token_json = await client.afetch_token(token_data)
+        except ProviderUnavailable:
+            return _provider_unavailable_response()
+        except (httpx.HTTPError, ValueError) as e:
             return Response({"error": "토큰 요청 실패", "detail": str(e)}, 400)
 
         access_token = token_json.get("access_token")
@@ -405,58 +427,46 @@ class GoogleLoginView(generics.GenericAPIView):
             return Response({"error": "토큰 요청 실패", "detail": token_json}, 400)
 
         # 2. access token으로 사용자 정보 조회
-        user_info_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-        headers = {"Authorization": f"Bearer {access_token}"}
-
         try:
-            profile_res = requests.get(user_info_url, headers=headers, timeout=5)
-            profile_res.raise_for_status()
-            profile_data = profile_res.json()
-        except requests.RequestException as e:
+            profile_data = await client.afetch_profile(access_token)
+        except ProviderUnavailable:
+            return _provider_unavailable_response()
+        except (httpx.HTTPError, ValueError) as e:
             return Response({"error": "프로필 요청 실패", "detail": str(e)}, 400)
 
         # 3. 사용자 정보 DB에 저장
         email = profile_data.get("email")
         name = profile_data.get("name")
-        provider_user_id = profile_data.get("id")
+        # v2 userinfo 는 id, OIDC userinfo 는 sub (같은 구글 계정 ID)
+        provider_user_id = profile_data.get("sub") or profile_data.get("id")
 
         if not email or not provider_user_id:
             return Response({"error": "이메일/ID 정보 없음"}, 400)
 
-        user, _ = User.objects.get_or_create(
+        user, _ = await User.objects.aget_or_create(
             email=email,
             defaults={"nickname": name, "email_verified": True, "password": "!"},
         )
-        SocialAccount.objects.get_or_create(
+        await SocialAccount.objects.aget_or_create(
             user=user, provider="google", provider_user_id=provider_user_id
         )
 
         # 4. JWT 생성 및 DB 저장
-        refresh = RefreshToken.for_user(user)
-        Token.objects.create(
-            user=user,
-            access_jwt=str(refresh.access_token),
-            refresh_jwt=str(refresh),
-            access_expires_at=timezone.now() + timedelta(minutes=5),
-            refresh_expires_at=timezone.now() + timedelta(days=7),
-        )
-
-        return Response(
-            {
-                "access": str(refresh.access_token),
-                "refresh": str(refresh),
-                "email": user.email,
-                "nickname": user.nickname,
-            },
-            200,
-        )
+        return Response(await sync_to_async(_issue_login_tokens)(user), 200)
 
 
 # 어드민 기능
-class AdminUserListView(generics.ListAPIView):
+class AdminUserListView(ReplicaReadMixin, generics.ListAPIView):
+    """
+    GET /api/users/admin/users/
+    ?verified=&deleted=&staff=&joined_from=&joined_to=&q=&cursor=&page_size=
+    """
+
     serializer_class = AdminUserSerializer
     permission_classes = [permissions.IsAdminUser]
-    queryset = User.objects.all().order_by("-created_at")
+    queryset = User.objects.all()
+    filterset_class = AdminUserFilter
+    pagination_class = CreatedAtKeysetPagination
 
 
 class AdminUserStatusUpdateView(generics.UpdateAPIView):
@@ -534,7 +544,9 @@ class AdminActionCreateView(generics.CreateAPIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class AdminActionListView(generics.ListAPIView):
+class AdminActionListView(
+    ReplicaReadMixin, EagerLoadingViewMixin, generics.ListAPIView
+):
     serializer_class = AdminActionSerializer
     permission_classes = [IsAdminUser]
 
@@ -560,17 +572,52 @@ class DashboardStatsListView(generics.ListAPIView):
 
     @staticmethod
     def update_daily_stats():
-        today = timezone.localdate()
-        total_users = User.objects.filter(deleted_at__isnull=True).count()
-        # total_diaries와 api_calls는 실제 모델이나 API 호출 기록 필요
-        total_diaries = 0
-        api_calls = 0
-
-        stat, created = DashboardStats.objects.get_or_create(stat_date=today)
-        stat.total_users = total_users
-        stat.total_diaries = total_diaries
-        stat.api_calls = api_calls
-        stat.save()
+        DashboardStats.update_daily_status()
+
+
+class DashboardHourlyStatsListView(generics.ListAPIView):
+    """
+    GET /api/users/admin/dashboard-stats/hourly/?hours=48
+    최근 N시간의 시간대별 통계 (기본 48시간, 최대 30일)
+    """
+
+    serializer_class = DashboardHourlyStatsSerializer
+    permission_classes = [permissions.IsAdminUser]
+
+    def get_queryset(self):
+        try:
+            hours = int(self.request.query_params.get("hours", 48))
+        except ValueError:
+            hours = 48
+        hours = max(1, min(hours, 24 * 30))
+        since = DashboardHourlyStats.current_hour() - timedelta(hours=hours - 1)
+        return DashboardHourlyStats.objects.filter(stat_hour__gte=since).order_by(
+            "stat_hour"
+        )
+
+
+# 소셜 로그인 제공자 상태 (서킷 / 지연시간 히스토그램)
+class OAuthProviderStatsView(generics.GenericAPIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_provider_stats())
+
+
+# DB 커넥션 풀 상태 (워커별 - 고갈 / 대기 시간 확인)
+class DatabasePoolStatsView(generics.GenericAPIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(database_pool_stats())
+
+
+# 캐시 네임스페이스별 hit / miss / 지연시간 (워커별)
+class CacheStatsView(generics.GenericAPIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(cache_stats())
 
 
 # 시스템 설정
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.weather.models import PayloadDictionary, WeatherPayload
+from apps.weather.payloads import (
+    build_dictionary,
+    canonical_bytes,
+    compress,
+    get_dictionary,
+    load_payload,
+)
+
+
+class Command(BaseCommand):
+    help = "최근 날씨 API 응답으로 zlib 프리셋 사전을 만들고 (선택) 기존 payload 재압축"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--samples", type=int, default=500)
+        parser.add_argument(
+            "--recompress",
+            action="store_true",
+            help="기존 payload 도 새 사전으로 재압축",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        samples = [
+            load_payload(p)
+            for p in WeatherPayload.objects.order_by("-created_at")[
+                : options["samples"]
+            ]
+        ]
+        if not samples:
+            self.stdout.write("샘플 payload 없음")
+            return
+
+        dictionary = PayloadDictionary.objects.create(
+            data=build_dictionary(samples), sample_count=len(samples)
+        )
+        zdict = get_dictionary(dictionary.id)
+        self.stdout.write(
+            self.style.SUCCESS(f"사전 #{dictionary.id} 생성 ({len(zdict)} bytes)")
+        )
+        if not options["recompress"]:
+            return
+
+        before = after = 0
+        last_digest = ""
+        while True:
+            batch = list(
+                WeatherPayload.objects.filter(digest__gt=last_digest)
+                .exclude(dictionary=dictionary)
+                .order_by("digest")[: options["batch_size"]]
+            )
+            if not batch:
+                break
+            with transaction.atomic():
+                for payload in batch:
+                    before += len(payload.data)
+                    payload.data = compress(
+                        canonical_bytes(load_payload(payload)), zdict
+                    )
+                    payload.dictionary = dictionary
+                    after += len(payload.data)
+                WeatherPayload.objects.bulk_update(batch, ["data", "dictionary"])
+            last_digest = batch[-1].digest
+        self.stdout.write(self.style.SUCCESS(f"재압축: {before} → {after} bytes"))
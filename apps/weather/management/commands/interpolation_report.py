@@ -0,0 +1,41 @@
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from apps.weather.services.interpolation_service import (
+    IDW_NEIGHBORS,
+    IDW_POWER,
+    build_snapshot,
+    leave_one_out_error,
+)
+
+
+class Command(BaseCommand):
+    help = "현재 스냅샷으로 IDW 보간 정확도(leave-one-out) / 지연시간 측정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--k", type=int, default=IDW_NEIGHBORS)
+        parser.add_argument("--power", type=float, default=IDW_POWER)
+        parser.add_argument("--queries", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        snapshot = build_snapshot()
+        if snapshot is None or len(snapshot) < 2:
+            self.stdout.write("보간할 현재 날씨 데이터 부족")
+            return
+
+        errors = leave_one_out_error(snapshot, options["k"], options["power"])
+        self.stdout.write(f"위치 {len(snapshot)}개, 평균 절대 오차: {errors}")
+
+        # 스냅샷 범위 안의 임의 좌표로 지연시간 측정
+        lat = np.degrees(np.arcsin(snapshot.points[:, 2]))
+        lon = np.degrees(np.arctan2(snapshot.points[:, 1], snapshot.points[:, 0]))
+        rng = np.random.default_rng(0)
+        lats = rng.uniform(lat.min(), lat.max(), options["queries"])
+        lons = rng.uniform(lon.min(), lon.max(), options["queries"])
+        started = time.perf_counter()
+        for la, lo in zip(lats, lons):
+            snapshot.interpolate([la], [lo], k=options["k"], power=options["power"])
+        per_query = (time.perf_counter() - started) / options["queries"] * 1000
+        self.stdout.write(self.style.SUCCESS(f"단건 보간 평균 {per_query:.3f} ms"))
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0002_soft_delete_partial_indexes'),
+        ('weather', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(
+                condition=models.Q(('deleted_at__isnull', True)),
+                fields=['location', '-valid_time'],
+                name='weather_live_loc_time_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.weather.payloads import canonical_bytes, compress, payload_digest
+
+BATCH_SIZE = 1000
+
+
+def move_raw_payloads(apps, schema_editor):
+    """기존 raw_payload JSON 을 해시 기준으로 중복 제거해 payload 테이블로 이동"""
+    WeatherData = apps.get_model('weather', 'WeatherData')
+    WeatherPayload = apps.get_model('weather', 'WeatherPayload')
+
+    rows = (
+        WeatherData._base_manager.filter(raw_payload__isnull=False)
+        .order_by('id')
+        .values_list('id', 'raw_payload')
+    )
+    last_id = 0
+    while True:
+        batch = list(rows.filter(id__gt=last_id)[:BATCH_SIZE])
+        if not batch:
+            break
+        payloads, digests = {}, {}
+        for row_id, payload in batch:
+            raw = canonical_bytes(payload)
+            digest = payload_digest(raw)
+            digests[row_id] = digest
+            if digest not in payloads:
+                payloads[digest] = WeatherPayload(
+                    digest=digest, data=compress(raw), raw_size=len(raw)
+                )
+        WeatherPayload.objects.bulk_create(payloads.values(), ignore_conflicts=True)
+        for row_id, digest in digests.items():
+            WeatherData._base_manager.filter(id=row_id).update(payload_id=digest)
+        last_id = batch[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0002_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayloadDictionary',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('data', models.BinaryField()),
+                ('sample_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'weather_payload_dictionary',
+            },
+        ),
+        migrations.CreateModel(
+            name='WeatherPayload',
+            fields=[
+                (
+                    'digest',
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ('data', models.BinaryField()),
+                ('raw_size', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                (
+                    'dictionary',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to='weather.payloaddictionary',
+                    ),
+                ),
+            ],
+            options={
+                'db_table': 'weather_payloads',
+            },
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='payload',
+            field=models.ForeignKey(
+                blank=True,
+                db_column='payload_digest',
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='weather.weatherpayload',
+            ),
+        ),
+        migrations.RunPython(move_raw_payloads, migrations.RunPython.noop),
+    ]
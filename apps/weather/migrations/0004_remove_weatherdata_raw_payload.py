@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # 0003 의 데이터 이동(FK 갱신)과 같은 트랜잭션에서 ALTER TABLE 하면
+    # PostgreSQL 이 "pending trigger events" 오류를 내므로 별도 마이그레이션으로 분리
+
+    dependencies = [
+        ('weather', '0003_weather_payload_store'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='weatherdata',
+            name='raw_payload',
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:41
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 대용량 테이블 - 쓰기를 막지 않도록 CONCURRENTLY 로 생성 / 삭제
+    atomic = False
+
+    dependencies = [
+        ('locations', '0002_soft_delete_partial_indexes'),
+        ('weather', '0004_remove_weatherdata_raw_payload'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='weatherdata',
+            name='weather_dat_weather_d4a7b1_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='weatherdata',
+            name='weather_live_loc_time_idx',
+        ),
+        AddIndexConcurrently(
+            model_name='weatherdata',
+            index=models.Index(
+                condition=models.Q(('deleted_at__isnull', True)),
+                fields=['location', 'weather_type', '-valid_time'],
+                name='weather_live_loc_type_time_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='weatherdata',
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=['created_at'], name='weather_created_brin_idx'
+            ),
+        ),
+    ]
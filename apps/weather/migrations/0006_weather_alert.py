@@ -0,0 +1,60 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0003_favorite_location_alert_index'),
+        ('weather', '0005_composite_and_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeatherAlert',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'alert_type',
+                    models.CharField(
+                        choices=[
+                            ('rain_start', 'Rain Start'),
+                            ('temperature_drop', 'Temperature Drop'),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ('valid_time', models.DateTimeField()),
+                ('message', models.CharField(max_length=200)),
+                ('details', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                (
+                    'location',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='weather_alerts',
+                        to='locations.location',
+                    ),
+                ),
+            ],
+            options={
+                'db_table': 'weather_alerts',
+                'indexes': [
+                    models.Index(
+                        fields=['location', '-created_at'],
+                        name='weather_alert_loc_time_idx',
+                    )
+                ],
+            },
+        ),
+    ]
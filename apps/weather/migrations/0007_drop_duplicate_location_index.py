@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:52
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # 대용량 테이블 - 쓰기를 막지 않도록 CONCURRENTLY 로 삭제
+    atomic = False
+
+    dependencies = [
+        ('weather', '0006_weather_alert'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='weatherdata',
+            name='weather_dat_locatio_7c8b74_idx',
+        ),
+    ]
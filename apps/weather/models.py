@@ -1,29 +1,15 @@
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
-from django.utils import timezone
 
+from apps.core.models import SoftDeleteModel
 from apps.locations.models import Location
 
+from .payloads import load_payload, store_payload
 
-class SoftDeleteMixin(models.Model):
-    """Soft Delete Mixin — 실제 삭제 대신 deleted_at 기록"""
+_UNSET = object()
 
-    deleted_at = models.DateTimeField(blank=True, null=True)  # 삭제 시각
 
-    class Meta:
-        abstract = True  # 독립 테이블로 생성되지 않음
-
-    def delete(self, using=None, keep_parents=False):
-        """Soft delete 동작"""
-        self.deleted_at = timezone.now()
-        self.save(update_fields=["deleted_at"])
-
-    def restore(self):
-        """삭제 복구"""
-        self.deleted_at = None
-        self.save(update_fields=["deleted_at"])
-
-
-class WeatherData(SoftDeleteMixin):
+class WeatherData(SoftDeleteModel):
     """
     지역별 날씨 데이터 저장 테이블
     - OpenWeather API 사용
@@ -64,7 +50,15 @@ class WeatherData(SoftDeleteMixin):
     icon = models.CharField(max_length=10, blank=True, null=True)  # 날씨 아이콘 코드
     condition = models.CharField(max_length=100)  # 날씨 상태 (예: 맑음, 비, 눈)
 
-    raw_payload = models.JSONField(blank=True, null=True)  # 원본 API 응답 JSON (백업용)
+    # 원본 API 응답 JSON (백업용) - 내용 해시로 중복 제거 / 압축 저장, raw_payload 로 접근
+    payload = models.ForeignKey(
+        "WeatherPayload",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+        db_column="payload_digest",
+    )
     created_at = models.DateTimeField(auto_now_add=True)  # 데이터 생성 시각
 
     class Meta:
@@ -78,18 +72,48 @@ class WeatherData(SoftDeleteMixin):
                 name="uq_location_provider_type_validtime",
             ),
         ]
+        # location 단독 조회는 ForeignKey 가 만드는 인덱스가 처리
         indexes = [
-            models.Index(fields=["location"]),
             models.Index(fields=["valid_time"]),
-            models.Index(fields=["weather_type"]),
+            # "위치 X, 유형 T, valid_time 구간" 조회를 인덱스 하나로 처리 (삭제된 행 제외)
+            models.Index(
+                fields=["location", "weather_type", "-valid_time"],
+                name="weather_live_loc_type_time_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 집계 / 아카이브용 생성 시각 범위 스캔 (추가 순서 = created_at 순서라 BRIN 이 작고 효율적)
+            BrinIndex(fields=["created_at"], name="weather_created_brin_idx"),
         ]
 
     def __str__(self):
         """예시: '서울특별시 강남구 - Cloudy (18.3°C)'"""
         return f"{self.location.city} {self.location.district} - {self.condition} ({self.temperature}°C)"
 
-
-class WeatherDailySummary(SoftDeleteMixin):
+    @property
+    def raw_payload(self):
+        """원본 API 응답 - 실제로 접근할 때만 payload 를 읽어 압축 해제"""
+        value = self.__dict__.get("_raw_payload", _UNSET)
+        if value is _UNSET:
+            value = load_payload(self.payload) if self.payload_id else None
+            self.__dict__["_raw_payload"] = value
+        return value
+
+    @raw_payload.setter
+    def raw_payload(self, value):
+        self.__dict__["_raw_payload"] = value
+        self.__dict__["_raw_payload_changed"] = True
+
+    def save(self, *args, **kwargs):
+        if self.__dict__.pop("_raw_payload_changed", False):
+            value = self.__dict__["_raw_payload"]
+            self.payload_id = store_payload(value) if value is not None else None
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "payload"}
+        super().save(*args, **kwargs)
+
+
+class WeatherDailySummary(SoftDeleteModel):
     """
     일별 날씨 요약 데이터
     - 특정 날짜에 대한 최저/최고 온도, 습도, 주요 상태 기록
@@ -139,3 +163,72 @@ class WeatherDailySummary(SoftDeleteMixin):
     def __str__(self):
         """예시: '서울특별시 강남구 (2025-10-29)'"""
         return f"{self.location.city} {self.location.district} ({self.date})"
+
+
+class PayloadDictionary(models.Model):
+    """raw payload 압축용 zlib 프리셋 사전 (build_payload_dictionary 명령으로 생성)"""
+
+    data = models.BinaryField()
+    sample_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "weather_payload_dictionary"
+
+    def __str__(self):
+        return f"Dictionary #{self.id} ({len(self.data)} bytes)"
+
+
+class WeatherPayload(models.Model):
+    """
+    날씨 API 원본 응답 저장소 (내용 주소 기반)
+    - digest: 정렬된 JSON 의 SHA-256, 같은 응답은 한 번만 저장
+    - data: zlib 압축 (dictionary 가 있으면 프리셋 사전 사용)
+    """
+
+    digest = models.CharField(max_length=64, primary_key=True)
+    dictionary = models.ForeignKey(
+        PayloadDictionary, on_delete=models.PROTECT, null=True, blank=True
+    )
+    data = models.BinaryField()
+    raw_size = models.PositiveIntegerField()  # 압축 전 크기 (bytes)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "weather_payloads"
+
+    def __str__(self):
+        return f"{self.digest[:12]} ({self.raw_size} → {len(self.data)} bytes)"
+
+
+class WeatherAlert(models.Model):
+    """
+    위치별 날씨 알림 이벤트 (수집 직후 alert_service 가 생성)
+    - 위치당 한 번만 저장되고, 사용자에게는 즐겨찾기(FavoriteLocation) 기준으로 전달
+    """
+
+    ALERT_TYPES = [
+        ("rain_start", "Rain Start"),  # 곧 비 시작
+        ("temperature_drop", "Temperature Drop"),  # 기온 급강하
+    ]
+
+    location = models.ForeignKey(
+        Location, on_delete=models.CASCADE, related_name="weather_alerts"
+    )
+    alert_type = models.CharField(max_length=20, choices=ALERT_TYPES)
+    valid_time = models.DateTimeField()  # 이벤트 예상 시각 (비 시작 / 최저 기온)
+    message = models.CharField(max_length=200)
+    details = models.JSONField(default=dict)  # 판정에 사용한 수치
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "weather_alerts"
+        indexes = [
+            # 위치별 최근 알림 (중복 발송 확인 / 사용자 알림 목록)
+            models.Index(
+                fields=["location", "-created_at"], name="weather_alert_loc_time_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.location_id} {self.alert_type} @ {self.valid_time}"
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import Counter
+
+# zlib 압축 레벨 (저장은 수집 시 1회, 읽기는 드묾 → 최대 압축)
+PAYLOAD_COMPRESSION_LEVEL = int(os.getenv("PAYLOAD_COMPRESSION_LEVEL", "9"))
+# zlib 프리셋 사전 최대 크기 (zlib 윈도우 32KB 를 넘는 부분은 쓰이지 않음)
+PAYLOAD_DICTIONARY_SIZE = 32 * 1024
+
+
+def canonical_bytes(payload):
+    """키 정렬 / 공백 제거 JSON - 같은 내용이면 항상 같은 바이트 (해시 기준)"""
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def payload_digest(raw):
+    return hashlib.sha256(raw).hexdigest()
+
+
+def compress(raw, zdict=None):
+    if zdict:
+        compressor = zlib.compressobj(PAYLOAD_COMPRESSION_LEVEL, zdict=zdict)
+    else:
+        compressor = zlib.compressobj(PAYLOAD_COMPRESSION_LEVEL)
+    return compressor.compress(raw) + compressor.flush()
+
+
+def decompress(data, zdict=None):
+    decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+def _fragments(value):
+    # 사전 후보: "키":값 조각 (값이 객체 / 배열이면 하위 조각으로 분해)
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if isinstance(child, (dict, list)):
+                yield json.dumps(key, ensure_ascii=False) + ":"
+                yield from _fragments(child)
+            else:
+                yield json.dumps(
+                    {key: child}, separators=(",", ":"), ensure_ascii=False
+                )[1:-1]
+    elif isinstance(value, list):
+        for child in value:
+            yield from _fragments(child)
+
+
+def build_dictionary(samples, size=PAYLOAD_DICTIONARY_SIZE):
+    """
+    샘플 payload 들에서 자주 나오는 조각으로 zlib 프리셋 사전 생성
+    - 여러 샘플에 반복되는 조각일수록 뒤쪽에 배치 (zlib 은 사전 끝부분을 가장 싸게 참조)
+    """
+    counts = Counter()
+    for sample in samples:
+        counts.update(set(_fragments(sample)))
+
+    chosen, used = [], 0
+    for fragment, n in counts.most_common():
+        if n < 2:
+            break
+        encoded = fragment.encode()
+        if used + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        used += len(encoded)
+    return b"".join(reversed(chosen))
+
+
+# 사전은 만든 뒤 바뀌지 않으므로 프로세스 내에서 id 별로 캐시
+_dictionaries = {}
+_dictionaries_lock = threading.Lock()
+
+
+def get_dictionary(dictionary_id):
+    if dictionary_id is None:
+        return None
+    data = _dictionaries.get(dictionary_id)
+    if data is None:
+        from .models import PayloadDictionary
+
+        data = bytes(PayloadDictionary.objects.get(id=dictionary_id).data)
+        with _dictionaries_lock:
+            _dictionaries[dictionary_id] = data
+    return data
+
+
+def store_payload(payload):
+    """
+    payload 를 내용 해시 기준으로 한 번만 저장 (최신 사전으로 압축)
+    반환: digest (WeatherData.payload_id)
+    """
+    from .models import PayloadDictionary, WeatherPayload
+
+    raw = canonical_bytes(payload)
+    digest = payload_digest(raw)
+    if WeatherPayload.objects.filter(digest=digest).exists():
+        return digest
+
+    dictionary_id = (
+        PayloadDictionary.objects.order_by("-id").values_list("id", flat=True).first()
+    )
+    WeatherPayload.objects.bulk_create(
+        [
+            WeatherPayload(
+                digest=digest,
+                dictionary_id=dictionary_id,
+                data=compress(raw, get_dictionary(dictionary_id)),
+                raw_size=len(raw),
+            )
+        ],
+        ignore_conflicts=True,  # 동시에 같은 payload 를 저장한 경우
+    )
+    return digest
+
+
+def load_payload(payload):
+    """WeatherPayload → 원본 JSON"""
+    raw = decompress(bytes(payload.data), get_dictionary(payload.dictionary_id))
+    return json.loads(raw)
@@ -1,11 +1,15 @@
 from rest_framework import serializers
 
-from .models import WeatherDailySummary, WeatherData
+from apps.core.serializers import EagerLoadingMixin
 
+from .models import WeatherAlert, WeatherDailySummary, WeatherData
 
-class WeatherDataSerializer(serializers.ModelSerializer):
+
+class WeatherDataSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """현재 날씨 / 예보 데이터를 직렬화"""
 
+    select_related_fields = ("location",)  # get_location_name 에서 사용
+
     location_name = serializers.SerializerMethodField()  # 도시, 구 이름을 문자열로 반환
 
     class Meta:
@@ -31,9 +35,11 @@ class WeatherDataSerializer(serializers.ModelSerializer):
         return f"{obj.location.city} {obj.location.district}"
 
 
-class WeatherDailySummarySerializer(serializers.ModelSerializer):
+class WeatherDailySummarySerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """일별 요약 데이터를 직렬화"""
 
+    select_related_fields = ("location",)  # get_location_name 에서 사용
+
     location_name = serializers.SerializerMethodField()
 
     class Meta:
@@ -52,3 +58,27 @@ class WeatherDailySummarySerializer(serializers.ModelSerializer):
 
     def get_location_name(self, obj):
         return f"{obj.location.city} {obj.location.district}"
+
+
+class WeatherAlertSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    """날씨 알림 직렬화"""
+
+    select_related_fields = ("location",)
+
+    location_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = WeatherAlert
+        fields = [
+            "id",
+            "location",
+            "location_name",
+            "alert_type",
+            "valid_time",
+            "message",
+            "details",
+            "created_at",
+        ]
+
+    def get_location_name(self, obj):
+        return f"{obj.location.city} {obj.location.district}"
@@ -0,0 +1,207 @@
+import hashlib
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from apps.locations.models import FavoriteLocation, Location
+
+from ..models import WeatherAlert, WeatherData
+from ..signals import weather_alert_raised
+
+# 비 시작 알림: 이 시간 안에 비가 예보되면 알림
+RAIN_ALERT_LEAD = timedelta(hours=int(os.getenv("RAIN_ALERT_LEAD_HOURS", "2")))
+# 강수확률(%) 이 이 값 이상이거나 강수량이 있으면 비로 판정
+RAIN_ALERT_PROBABILITY = float(os.getenv("RAIN_ALERT_PROBABILITY", "60"))
+RAIN_CONDITIONS = {"rain", "drizzle", "thunderstorm", "비"}
+
+# 기온 급강하 알림: 현재 기온 대비 이 시간 안에 이만큼 이상 떨어지면 알림
+TEMPERATURE_DROP_WINDOW = timedelta(
+    hours=int(os.getenv("TEMPERATURE_DROP_WINDOW_HOURS", "24"))
+)
+TEMPERATURE_DROP_THRESHOLD = float(os.getenv("TEMPERATURE_DROP_THRESHOLD", "10"))
+
+# 프로세스 재시작 등으로 메모리 상태가 없을 때 같은 종류의 알림을 다시 만들지 않는 기간
+ALERT_COOLDOWN = timedelta(hours=int(os.getenv("WEATHER_ALERT_COOLDOWN_HOURS", "6")))
+
+
+@dataclass(frozen=True)
+class LocationState:
+    """위치별 직전 판정 결과 (예보 지문 + 활성 알림 종류)"""
+
+    fingerprint: str
+    active: frozenset
+
+
+# 위치 id → LocationState (수집이 실행되는 프로세스의 메모리에만 유지)
+_states = {}
+_states_lock = threading.Lock()
+
+
+def _is_rainy(condition, rain_probability, rain_volume):
+    return (
+        condition.lower() in RAIN_CONDITIONS
+        or rain_probability >= RAIN_ALERT_PROBABILITY
+        or rain_volume > 0
+    )
+
+
+def _load_rows(location_ids, now):
+    """변경된 위치들의 최신 현재 날씨 + 예보 구간을 쿼리 2번으로 조회"""
+    fields = (
+        "location_id",
+        "valid_time",
+        "temperature",
+        "rain_probability",
+        "rain_volume",
+        "condition",
+    )
+    # 위치마다 (location, weather_type, -valid_time) 인덱스에서 1행만 읽음
+    # (DISTINCT ON 은 위치별 현재 날씨 이력 전체를 훑은 뒤 첫 행을 고름)
+    latest = (
+        WeatherData.objects.filter(location=OuterRef("pk"), weather_type="current")
+        .order_by("-valid_time")
+        .values("pk")[:1]
+    )
+    current = {
+        row[0]: row
+        for row in WeatherData.objects.filter(
+            pk__in=Location.objects.filter(pk__in=location_ids).values(
+                latest=Subquery(latest)
+            )
+        ).values_list(*fields)
+    }
+    forecasts = defaultdict(list)
+    for row in (
+        WeatherData.objects.filter(
+            location_id__in=location_ids,
+            weather_type="forecast",
+            valid_time__gt=now,
+            valid_time__lte=now + max(RAIN_ALERT_LEAD, TEMPERATURE_DROP_WINDOW),
+        )
+        .order_by("location_id", "valid_time")
+        .values_list(*fields)
+    ):
+        forecasts[row[0]].append(row)
+    return current, forecasts
+
+
+def _fingerprint(current, forecast):
+    digest = hashlib.sha1(repr((current, forecast)).encode())
+    return digest.hexdigest()
+
+
+def detect(current, forecast, now):
+    """
+    위치 1곳의 알림 판정
+    current: 최신 현재 날씨 행, forecast: now 이후 예보 행 (valid_time 순)
+    반환: {alert_type: (valid_time, message, details)}
+    """
+    if current is None:
+        return {}
+    _, _, temperature, rain_probability, rain_volume, condition = current
+    temperature = float(temperature)
+    alerts = {}
+
+    if not _is_rainy(condition, float(rain_probability), float(rain_volume)):
+        for _, valid_time, _, pop, volume, cond in forecast:
+            if valid_time > now + RAIN_ALERT_LEAD:
+                break
+            if _is_rainy(cond, float(pop), float(volume)):
+                minutes = int((valid_time - now).total_seconds() // 60)
+                alerts["rain_start"] = (
+                    valid_time,
+                    f"{minutes}분 뒤 비 소식이 있어요. 우산을 챙기세요!",
+                    {"condition": cond, "rain_probability": float(pop)},
+                )
+                break
+
+    window = [row for row in forecast if row[1] <= now + TEMPERATURE_DROP_WINDOW]
+    if window:
+        _, valid_time, lowest, *_ = min(window, key=lambda row: row[2])
+        drop = temperature - float(lowest)
+        if drop >= TEMPERATURE_DROP_THRESHOLD:
+            alerts["temperature_drop"] = (
+                valid_time,
+                f"기온이 {drop:.0f}°C 떨어질 예정이에요. 따뜻하게 입으세요!",
+                {"temperature": temperature, "lowest": float(lowest)},
+            )
+    return alerts
+
+
+def detect_alerts(location_ids, now=None):
+    """
+    weather_ingested 수신 시 호출 - 이번 주기에 바뀐 위치만 판정
+    - 예보 지문이 직전 상태와 같으면 판정 생략
+    - 직전 판정에 없던 알림 종류만 새로 생성 (같은 상황에서 반복 발송 방지)
+    - 사용자 전달은 위치별 즐겨찾기 조회 1번으로 처리 (사용자 수와 무관하게 위치 수에 비례)
+    반환: 생성된 WeatherAlert 목록
+    """
+    now = now or timezone.now()
+    current, forecasts = _load_rows(location_ids, now)
+
+    candidates = {}
+    with _states_lock:
+        for location_id in location_ids:
+            row, forecast = current.get(location_id), forecasts.get(location_id, [])
+            fingerprint = _fingerprint(row, forecast)
+            previous = _states.get(location_id)
+            if previous is not None and previous.fingerprint == fingerprint:
+                continue
+            found = detect(row, forecast, now)
+            _states[location_id] = LocationState(fingerprint, frozenset(found))
+            new = {
+                alert_type: value
+                for alert_type, value in found.items()
+                if previous is None or alert_type not in previous.active
+            }
+            if new:
+                candidates[location_id] = new
+
+    if not candidates:
+        return []
+
+    # 메모리 상태가 없던 위치(재시작 직후)는 최근 알림과 중복되지 않도록 확인
+    recent = set(
+        WeatherAlert.objects.filter(
+            location_id__in=candidates, created_at__gte=now - ALERT_COOLDOWN
+        ).values_list("location_id", "alert_type")
+    )
+    alerts = WeatherAlert.objects.bulk_create(
+        [
+            WeatherAlert(
+                location_id=location_id,
+                alert_type=alert_type,
+                valid_time=valid_time,
+                message=message,
+                details=details,
+            )
+            for location_id, found in candidates.items()
+            for alert_type, (valid_time, message, details) in found.items()
+            if (location_id, alert_type) not in recent
+        ]
+    )
+    if alerts:
+        fan_out(alerts)
+    return alerts
+
+
+def fan_out(alerts):
+    """알림 위치를 즐겨찾기한 사용자에게 전달 (fav_location_live_loc_user_idx 사용)"""
+    subscribers = defaultdict(list)
+    for location_id, user_id in FavoriteLocation.objects.filter(
+        location_id__in={alert.location_id for alert in alerts}
+    ).values_list("location_id", "user_id"):
+        subscribers[location_id].append(user_id)
+
+    for alert in alerts:
+        user_ids = subscribers.get(alert.location_id)
+        if user_ids:
+            # 전달 채널 하나의 실패가 다른 채널 / 알림을 막지 않도록 (에러는 django.dispatch 로 로깅)
+            weather_alert_raised.send_robust(
+                sender=WeatherAlert, alert=alert, user_ids=user_ids
+            )
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+from datetime import timedelta
+from functools import partial
+
+import numpy as np
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from apps.core.cache import namespace
+
+from ..models import WeatherData
+
+# 구간 크기 (초)
+RESOLUTIONS = {"1h": 3600, "3h": 3 * 3600, "6h": 6 * 3600, "1d": 24 * 3600}
+MAX_FORECAST_HOURS = 7 * 24
+
+# 수집 직후 미리 계산해 두는 조합 (시간 범위, 구간)
+FORECAST_PRESETS = [(48, "1h"), (MAX_FORECAST_HOURS, "3h")]
+
+# 다음 수집 주기(3시간)까지 유지되면 충분
+FORECAST_CACHE_SECONDS = int(os.getenv("FORECAST_CACHE_SECONDS", str(4 * 3600)))
+
+forecast_cache = namespace("weather.forecast", timeout=FORECAST_CACHE_SECONDS)
+
+
+def _version_key(location_id):
+    return f"version:{location_id}"
+
+
+def _cache_key(location_id, version, hours, resolution, start):
+    # 수집될 때마다 위치별 버전이 바뀌므로 미리 계산하지 않은 조합도 새 데이터로 다시 계산됨
+    return f"{location_id}:{version}:{hours}:{resolution}:{int(start.timestamp())}"
+
+
+def current_hour():
+    return timezone.now().replace(minute=0, second=0, microsecond=0)
+
+
+def _dominant(bucket_idx, labels, n_buckets):
+    """구간별 최빈값 (동률이면 사전순으로 앞선 값)"""
+    names, codes = np.unique(labels, return_inverse=True)
+    counts = np.bincount(
+        bucket_idx * len(names) + codes, minlength=n_buckets * len(names)
+    ).reshape(n_buckets, len(names))
+    return names[counts.argmax(axis=1)]
+
+
+def downsample(rows, start, step):
+    """
+    (valid_time, temperature, feels_like, humidity, rain_probability, rain_volume,
+     wind_speed, condition, icon) 행을 step 초 구간으로 묶어 집계
+    - 데이터가 있는 구간만 반환
+    """
+    if not rows:
+        return []
+    times, temp, feels, humidity, pop, rain, wind, condition, icon = zip(*rows)
+    seconds = np.array([t.timestamp() for t in times])
+    raw_bucket = ((seconds - start.timestamp()) // step).astype(np.int64)
+    buckets, bucket_idx = np.unique(raw_bucket, return_inverse=True)
+    n = len(buckets)
+    counts = np.bincount(bucket_idx, minlength=n)
+
+    def column(values):
+        return np.array(values, dtype=float)
+
+    def mean(values):
+        return np.bincount(bucket_idx, weights=column(values), minlength=n) / counts
+
+    def extreme(values, ufunc, initial):
+        out = np.full(n, initial)
+        ufunc.at(out, bucket_idx, column(values))
+        return out
+
+    temp_min = extreme(temp, np.minimum, np.inf)
+    temp_max = extreme(temp, np.maximum, -np.inf)
+    temp_mean = mean(temp)
+    feels_mean = mean(feels)
+    humidity_mean = mean(humidity)
+    pop_max = extreme(pop, np.maximum, -np.inf)
+    rain_sum = np.bincount(bucket_idx, weights=column(rain), minlength=n)
+    wind_max = extreme(wind, np.maximum, -np.inf)
+    conditions = _dominant(bucket_idx, np.array(condition, dtype=str), n)
+    icons = _dominant(bucket_idx, np.array([i or "" for i in icon], dtype=str), n)
+
+    return [
+        {
+            "time": start + timedelta(seconds=int(buckets[i]) * step),
+            "temperature_min": round(float(temp_min[i]), 2),
+            "temperature_max": round(float(temp_max[i]), 2),
+            "temperature_mean": round(float(temp_mean[i]), 2),
+            "feels_like_mean": round(float(feels_mean[i]), 2),
+            "humidity_mean": round(float(humidity_mean[i]), 1),
+            "rain_probability_max": round(float(pop_max[i]), 2),
+            "rain_volume_sum": round(float(rain_sum[i]), 2),
+            "wind_speed_max": round(float(wind_max[i]), 2),
+            "condition": str(conditions[i]),
+            "icon": str(icons[i]) or None,
+            "samples": int(counts[i]),
+        }
+        for i in range(n)
+    ]
+
+
+def build_forecast(location_id, hours, resolution, start=None):
+    start = start or current_hour()
+    rows = list(
+        WeatherData.objects.filter(
+            location_id=location_id,
+            weather_type="forecast",
+            valid_time__gte=start,
+            valid_time__lt=start + timedelta(hours=hours),
+        )
+        .order_by("valid_time")
+        .values_list(
+            "valid_time",
+            "temperature",
+            "feels_like",
+            "humidity",
+            "rain_probability",
+            "rain_volume",
+            "wind_speed",
+            "condition",
+            "icon",
+        )
+    )
+    return {
+        "location": location_id,
+        "start": start,
+        "hours": hours,
+        "resolution": resolution,
+        "points": downsample(rows, start, RESOLUTIONS[resolution]),
+    }
+
+
+def _build_entry(location_id, hours, resolution, start):
+    body = json.dumps(
+        build_forecast(location_id, hours, resolution, start),
+        cls=DjangoJSONEncoder,
+        ensure_ascii=False,
+    )
+    return {"etag": f'"{hashlib.sha1(body.encode()).hexdigest()}"', "body": body}
+
+
+def get_forecast(location_id, hours, resolution):
+    """
+    캐시된 예보 시계열 (JSON 문자열 + ETag)
+    - 수집 직후 precompute_forecasts 가 채워 두고, 없으면 계산 후 저장 (동시 요청은 1번만 계산)
+    """
+    start = current_hour()
+    version = forecast_cache.get(_version_key(location_id), 0)
+    return forecast_cache.get_or_set(
+        _cache_key(location_id, version, hours, resolution, start),
+        partial(_build_entry, location_id, hours, resolution, start),
+    )
+
+
+async def aget_forecast(location_id, hours, resolution):
+    """get_forecast 의 async 버전 (async 뷰용)"""
+    start = current_hour()
+    version = await forecast_cache.aget(_version_key(location_id), 0)
+    return await forecast_cache.aget_or_set(
+        _cache_key(location_id, version, hours, resolution, start),
+        partial(_build_entry, location_id, hours, resolution, start),
+    )
+
+
+def precompute_forecasts(location_ids):
+    """weather_ingested 수신 시 기본 조합을 미리 계산 (이전 캐시는 덮어씀)"""
+    start = current_hour()
+    for location_id in location_ids:
+        version = forecast_cache.bump(_version_key(location_id))
+        for hours, resolution in FORECAST_PRESETS:
+            forecast_cache.refresh(
+                _cache_key(location_id, version, hours, resolution, start),
+                partial(_build_entry, location_id, hours, resolution, start),
+            )
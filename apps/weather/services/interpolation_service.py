@@ -0,0 +1,203 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from functools import partial
+
+import numpy as np
+from django.utils import timezone
+
+from apps.core.cache import namespace
+
+from ..models import WeatherData
+
+EARTH_RADIUS_KM = 6371.0
+
+# 보간에 사용할 이웃 수 / 거리 가중 지수
+IDW_NEIGHBORS = int(os.getenv("IDW_NEIGHBORS", "4"))
+IDW_POWER = float(os.getenv("IDW_POWER", "2"))
+# 이 거리 안에 관측 지점이 있으면 보간 없이 그 값을 사용 (km)
+IDW_EXACT_KM = 0.05
+# 이보다 오래된 현재 날씨는 스냅샷에서 제외
+SNAPSHOT_MAX_AGE = timedelta(
+    hours=int(os.getenv("WEATHER_SNAPSHOT_MAX_AGE_HOURS", "6"))
+)
+# 다른 프로세스의 스냅샷 갱신 여부 확인 주기 (초)
+SNAPSHOT_CHECK_INTERVAL = float(os.getenv("WEATHER_SNAPSHOT_CHECK_INTERVAL", "10"))
+
+SNAPSHOT_VERSION_KEY = "version"
+NUMERIC_FIELDS = ("temperature", "humidity", "rain_probability", "rain_volume")
+
+
+def _unit_vectors(latitudes, longitudes):
+    lat = np.radians(np.asarray(latitudes, dtype=float))
+    lon = np.radians(np.asarray(longitudes, dtype=float))
+    return np.column_stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+    )
+
+
+@dataclass(frozen=True)
+class WeatherSnapshot:
+    """
+    수집 주기별 위치 스냅샷 (위치마다 최신 현재 날씨 1건)
+    - points: 단위 구 위의 3차원 좌표 (N, 3) - 현 거리로 최근접 탐색
+    - values: NUMERIC_FIELDS 순서의 관측값 (N, 4)
+    - built_at: 생성 시각 (time.time() - 캐시를 통해 다른 프로세스와 공유되므로 벽시계 기준)
+    """
+
+    version: int
+    location_ids: np.ndarray
+    points: np.ndarray
+    values: np.ndarray
+    conditions: np.ndarray
+    built_at: float
+
+    def __len__(self):
+        return len(self.location_ids)
+
+    def age(self):
+        return time.time() - self.built_at
+
+    def nearest(self, latitudes, longitudes, k):
+        """
+        질의 지점별 가까운 k 개 위치 (인덱스, 거리 km)
+        위치 수가 수백 개 수준이라 트리 대신 행렬 한 번으로 계산
+        """
+        queries = _unit_vectors(latitudes, longitudes)
+        k = min(k, len(self))
+        chord = np.linalg.norm(queries[:, None, :] - self.points[None, :, :], axis=2)
+        idx = np.argpartition(chord, k - 1, axis=1)[:, :k]
+        chord_k = np.take_along_axis(chord, idx, axis=1)
+        order = np.argsort(chord_k, axis=1)
+        idx = np.take_along_axis(idx, order, axis=1)
+        chord_k = np.take_along_axis(chord_k, order, axis=1)
+        distance = 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord_k / 2, 0, 1))
+        return idx, distance
+
+    def interpolate(self, latitudes, longitudes, k=IDW_NEIGHBORS, power=IDW_POWER):
+        """
+        역거리 가중(IDW) 보간 - 여러 지점을 한 번에 계산
+        반환: (values (M, 4), 최근접 인덱스 (M,), 최근접 거리 km (M,))
+        """
+        idx, distance = self.nearest(latitudes, longitudes, k)
+        exact = distance[:, 0] < IDW_EXACT_KM
+        weights = 1.0 / np.maximum(distance, IDW_EXACT_KM) ** power
+        weights[exact] = 0.0
+        weights[exact, 0] = 1.0
+        weights /= weights.sum(axis=1, keepdims=True)
+        values = np.einsum("mk,mkf->mf", weights, self.values[idx])
+        return values, idx[:, 0], distance[:, 0]
+
+
+def build_snapshot(version=0):
+    rows = list(
+        WeatherData.objects.filter(
+            weather_type="current", valid_time__gte=timezone.now() - SNAPSHOT_MAX_AGE
+        )
+        .order_by("location_id", "-valid_time")
+        .distinct("location_id")
+        .values_list(
+            "location_id",
+            "location__latitude",
+            "location__longitude",
+            *NUMERIC_FIELDS,
+            "condition",
+        )
+    )
+    if not rows:
+        return None
+    location_ids, lats, lons, *numeric, conditions = zip(*rows)
+    return WeatherSnapshot(
+        version=version,
+        location_ids=np.array(location_ids),
+        points=_unit_vectors(lats, lons),
+        values=np.column_stack([np.array(col, dtype=float) for col in numeric]),
+        conditions=np.array(conditions, dtype=str),
+        built_at=time.time(),
+    )
+
+
+# 오래된 관측은 스냅샷에서 빠지므로 같은 버전도 SNAPSHOT_MAX_AGE 가 지나면 다시 만듦
+snapshot_cache = namespace(
+    "weather.snapshot", timeout=int(SNAPSHOT_MAX_AGE.total_seconds())
+)
+
+_snapshot = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def get_snapshot():
+    """
+    현재 스냅샷 - 수집 주기마다 한 번만 DB 에서 만들고 캐시를 통해 프로세스 간 공유
+    """
+    global _snapshot, _checked_at
+
+    now = time.monotonic()
+    if _snapshot is not None and now - _checked_at < SNAPSHOT_CHECK_INTERVAL:
+        return _snapshot
+
+    with _lock:
+        version = snapshot_cache.get(SNAPSHOT_VERSION_KEY, 0)
+        # 수집이 멈춰 버전이 그대로여도 캐시 만료 시간이 지난 로컬 사본은 다시 읽음
+        # (그 사이 SNAPSHOT_MAX_AGE 를 넘긴 관측이 빠지도록)
+        if (
+            _snapshot is None
+            or _snapshot.version != version
+            or _snapshot.age() >= snapshot_cache.timeout
+        ):
+            _snapshot = snapshot_cache.get_or_set(
+                version, partial(build_snapshot, version)
+            )
+        _checked_at = now
+        return _snapshot
+
+
+def rebuild_snapshot():
+    """weather_ingested 수신 시 호출 - 새 버전의 스냅샷을 만들어 캐시에 저장"""
+    global _snapshot
+    version = snapshot_cache.bump(SNAPSHOT_VERSION_KEY)
+    snapshot = snapshot_cache.refresh(version, partial(build_snapshot, version))
+    with _lock:
+        _snapshot = snapshot
+    return snapshot
+
+
+def estimate_weather(latitude, longitude):
+    """
+    임의 좌표의 날씨 추정 (기온 / 습도 / 강수확률 / 강수량은 IDW, 날씨 상태는 최근접 위치)
+    스냅샷이 없으면 None
+    """
+    snapshot = get_snapshot()
+    if snapshot is None:
+        return None
+    values, nearest, distance = snapshot.interpolate([latitude], [longitude])
+    result = {field: round(float(v), 2) for field, v in zip(NUMERIC_FIELDS, values[0])}
+    result["condition"] = str(snapshot.conditions[nearest[0]])
+    result["nearest_location_id"] = int(snapshot.location_ids[nearest[0]])
+    result["nearest_distance_km"] = round(float(distance[0]), 2)
+    return result
+
+
+def leave_one_out_error(snapshot, k=IDW_NEIGHBORS, power=IDW_POWER):
+    """
+    각 위치를 빼고 나머지로 보간했을 때의 평균 절대 오차 (NUMERIC_FIELDS 별)
+    """
+    errors = []
+    for i in range(len(snapshot)):
+        keep = np.arange(len(snapshot)) != i
+        held_out = replace(
+            snapshot,
+            location_ids=snapshot.location_ids[keep],
+            points=snapshot.points[keep],
+            values=snapshot.values[keep],
+            conditions=snapshot.conditions[keep],
+        )
+        point = snapshot.points[i]
+        lat = np.degrees(np.arcsin(point[2]))
+        lon = np.degrees(np.arctan2(point[1], point[0]))
+        values, _, _ = held_out.interpolate([lat], [lon], k=k, power=power)
+        errors.append(np.abs(values[0] - snapshot.values[i]))
+    return dict(zip(NUMERIC_FIELDS, np.mean(errors, axis=0).round(3).tolist()))
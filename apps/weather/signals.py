@@ -0,0 +1,54 @@
+from django.db import transaction
+from django.dispatch import Signal
+
+# 날씨 수집 주기 1회가 끝난 뒤 발생
+# - location_ids: 이번 주기에 WeatherData 가 추가 / 갱신된 위치 id 목록
+weather_ingested = Signal()
+
+# 날씨 알림 생성 후 발생 - 푸시 등 전달 채널이 연결하는 확장 지점
+# - alert: WeatherAlert, user_ids: 해당 위치를 즐겨찾기한 사용자 id 목록
+weather_alert_raised = Signal()
+
+
+def send_weather_ingested(location_ids):
+    """수집 코드에서 호출 - 커밋된 이후에 후처리(예보 캐시 등)가 새 데이터를 읽도록 함"""
+    location_ids = sorted(set(location_ids))
+    if not location_ids:
+        return
+    transaction.on_commit(
+        lambda: weather_ingested.send(sender=None, location_ids=location_ids)
+    )
+
+
+def _precompute_forecasts(sender, location_ids, **kwargs):
+    from .services.forecast_service import precompute_forecasts
+
+    precompute_forecasts(location_ids)
+
+
+def _rebuild_snapshot(sender, **kwargs):
+    from .services.interpolation_service import rebuild_snapshot
+
+    rebuild_snapshot()
+
+
+def _detect_alerts(sender, location_ids, **kwargs):
+    from .services.alert_service import detect_alerts
+
+    detect_alerts(location_ids)
+
+
+def _touch_alerts(sender, **kwargs):
+    from apps.core.conditional import touch
+
+    # 알림 목록 조건부 GET 워터마크 - 알림 생성(bulk_create 라 모델 signal 없음) 이후에 실행되도록 마지막에 연결
+    touch("weather_alerts")
+
+
+def connect():
+    weather_ingested.connect(
+        _precompute_forecasts, dispatch_uid="weather_precompute_forecasts"
+    )
+    weather_ingested.connect(_rebuild_snapshot, dispatch_uid="weather_rebuild_snapshot")
+    weather_ingested.connect(_detect_alerts, dispatch_uid="weather_detect_alerts")
+    weather_ingested.connect(_touch_alerts, dispatch_uid="weather_touch_alerts")
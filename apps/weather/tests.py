@@ -1,3 +1,207 @@
-from django.test import TestCase
+from dataclasses import replace
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.core.archive import archive_batch, restore_rows
+from apps.core.testing import assert_max_queries
+from apps.locations.models import Location
+
+from .models import WeatherData, WeatherPayload
+from .serializers import WeatherDataSerializer
+from .services import interpolation_service
+from .services.interpolation_service import (
+    NUMERIC_FIELDS,
+    WeatherSnapshot,
+    _unit_vectors,
+    get_snapshot,
+    leave_one_out_error,
+    snapshot_cache,
+)
+
+
+class WeatherDataSerializerQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        for i in range(5):
+            location = Location.objects.create(
+                city="서울특별시", district=f"구{i}", latitude=37 + i, longitude=127
+            )
+            WeatherData.objects.create(
+                location=location,
+                base_time=now,
+                valid_time=now,
+                temperature=20,
+                feels_like=19,
+                humidity=50,
+                wind_speed=2,
+                condition="맑음",
+            )
+
+    def test_list_is_one_query(self):
+        # location_name 이 지역마다 추가 쿼리를 만들지 않아야 함
+        with assert_max_queries(1):
+            queryset = WeatherDataSerializer.setup_eager_loading(
+                WeatherData.objects.all()
+            )
+            data = WeatherDataSerializer(queryset, many=True).data
+
+        self.assertEqual(len(data), 5)
+        self.assertEqual(data[0]["location_name"][:5], "서울특별시")
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class SnapshotExpiryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        location = Location.objects.create(
+            city="서울특별시", district="강남구", latitude=37.5, longitude=127
+        )
+        WeatherData.objects.create(
+            location=location,
+            base_time=now,
+            valid_time=now,
+            temperature=20,
+            feels_like=19,
+            humidity=50,
+            wind_speed=2,
+            condition="맑음",
+        )
+
+    def setUp(self):
+        patcher = mock.patch.multiple(
+            interpolation_service, _snapshot=None, _checked_at=0.0
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def use_local_copy(self, age):
+        # 다음 get_snapshot 이 버전 확인을 건너뛰지 않도록 _checked_at 도 초기화
+        snapshot = get_snapshot()
+        interpolation_service._snapshot = replace(
+            snapshot, built_at=snapshot.built_at - age
+        )
+        interpolation_service._checked_at = 0.0
+        return interpolation_service._snapshot
+
+    def test_local_copy_is_kept_while_version_is_unchanged(self):
+        local = self.use_local_copy(age=snapshot_cache.timeout / 2)
+
+        self.assertIs(get_snapshot(), local)
+
+    def test_local_copy_expires_by_age(self):
+        local = self.use_local_copy(age=snapshot_cache.timeout)
+
+        snapshot = get_snapshot()
+
+        self.assertIsNot(snapshot, local)
+        self.assertLess(snapshot.age(), snapshot_cache.timeout)
+
+
+class LeaveOneOutErrorTests(TestCase):
+    def test_error_per_field(self):
+        # 경도 방향으로 같은 간격의 위치 3곳 - 가운데 위치만 양옆의 평균과 정확히 일치
+        lats, lons = [37.0, 37.0, 37.0], [127.0, 127.1, 127.2]
+        values = np.array([[10, 50, 0, 0], [20, 60, 10, 1], [30, 70, 20, 2]], float)
+        snapshot = WeatherSnapshot(
+            version=1,
+            location_ids=np.array([1, 2, 3]),
+            points=_unit_vectors(lats, lons),
+            values=values,
+            conditions=np.array(["맑음", "비", "흐림"]),
+            built_at=0.0,
+        )
+
+        errors = leave_one_out_error(snapshot, k=2)
+
+        # 양끝: 거리 d, 2d 인 두 곳을 가중치 0.8 / 0.2 로 보간 → 값 차이의 1.2 배 오차
+        # 가운데: 오차 0 → 평균은 값 간격의 0.8 배
+        self.assertEqual(list(errors), list(NUMERIC_FIELDS))
+        for field, step in zip(NUMERIC_FIELDS, values[1] - values[0]):
+            self.assertAlmostEqual(errors[field], 0.8 * step, places=2)
+
+
+class WeatherArchivePayloadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        location = Location.objects.create(
+            city="서울특별시", district="강남구", latitude=37.5, longitude=127
+        )
+        old = timezone.now() - timedelta(days=365)
+        cls.rows = []
+        for hours in range(2):
+            row = WeatherData(
+                location=location,
+                base_time=old,
+                valid_time=old + timedelta(hours=hours),
+                temperature=20,
+                feels_like=19,
+                humidity=50,
+                wind_speed=2,
+                condition="맑음",
+            )
+            # 두 행이 같은 원본 응답을 공유
+            row.raw_payload = {"weather": [{"main": "Clear"}], "temp": 20}
+            row.save()
+            cls.rows.append(row)
+        cls.digest = cls.rows[0].payload_id
+
+    def test_payload_is_deleted_with_its_last_reference(self):
+        archive_batch("weather.WeatherData", batch_size=1)
+        # 아직 참조하는 행이 남아 있으면 유지
+        self.assertTrue(WeatherPayload.objects.filter(digest=self.digest).exists())
+
+        archive_batch("weather.WeatherData")
+
+        self.assertFalse(WeatherPayload.objects.filter(digest=self.digest).exists())
+
+    def test_restore_recreates_payload(self):
+        archive_batch("weather.WeatherData")
+
+        restore_rows("weather.WeatherData", [row.pk for row in self.rows])
+
+        restored = WeatherData.all_objects.get(pk=self.rows[0].pk)
+        self.assertEqual(restored.payload_id, self.digest)
+        self.assertEqual(restored.raw_payload["temp"], 20)
+        self.assertEqual(WeatherPayload.objects.filter(digest=self.digest).count(), 1)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class WeatherForecastConditionalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.create(
+            city="서울특별시", district="강남구", latitude=37.5, longitude=127
+        )
+        cls.user = get_user_model().objects.create_user("forecast", password="x")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get(self, **headers):
+        return self.client.get(
+            "/api/weather/forecast/", {"location": self.location.id}, headers=headers
+        )
+
+    def test_if_none_match_variants(self):
+        etag = self.get()["ETag"]
+
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            with self.subTest(if_none_match=if_none_match):
+                res = self.get(if_none_match=if_none_match)
+                self.assertEqual(res.status_code, 304)
+                self.assertEqual(res["ETag"], etag)
+
+        self.assertEqual(self.get(if_none_match='"other"').status_code, 200)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import WeatherAlertListView, WeatherForecastView
+
+app_name = "weather"
+urlpatterns = [
+    path("forecast/", WeatherForecastView.as_view(), name="forecast"),
+    path("alerts/", WeatherAlertListView.as_view(), name="alerts"),
+]
@@ -1,3 +1,93 @@
-from django.shortcuts import render
+from datetime import timedelta
 
-# Create your views here.
+from adrf.views import APIView
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.core.conditional import etag_matches
+from apps.core.views import (
+    ConditionalGetMixin,
+    EagerLoadingViewMixin,
+    ReplicaReadMixin,
+)
+from apps.locations.models import FavoriteLocation, Location
+
+from .models import WeatherAlert
+from .serializers import WeatherAlertSerializer
+from .services.forecast_service import MAX_FORECAST_HOURS, RESOLUTIONS, aget_forecast
+
+# 알림 목록 조회 기간 (시간)
+ALERT_LIST_MAX_HOURS = 72
+
+
+class WeatherForecastView(ReplicaReadMixin, APIView):
+    """
+    GET /api/weather/forecast/?location=<id>&hours=48&resolution=1h
+    위치별 예보 시계열 (구간별 최저 / 최고 / 평균 기온, 최빈 날씨 상태 등)
+    - 수집 직후 미리 계산된 캐시에서 응답, ETag 가 같으면 304
+    - async 뷰 (캐시 / DB 대기 중 워커가 다른 요청 처리)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        try:
+            location_id = int(request.query_params.get("location"))
+            hours = int(request.query_params.get("hours", 48))
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "location/hours 오류", "error_status": "invalid_params"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        resolution = request.query_params.get("resolution", "1h")
+        if not 1 <= hours <= MAX_FORECAST_HOURS or resolution not in RESOLUTIONS:
+            return Response(
+                {"error": "hours/resolution 오류", "error_status": "invalid_params"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not await Location.objects.filter(id=location_id).aexists():
+            return Response(
+                {"error": "존재하지 않는 위치", "error_status": "not_found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        entry = await aget_forecast(location_id, hours, resolution)
+        if etag_matches(request, entry["etag"]):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = HttpResponse(entry["body"], content_type="application/json")
+        response["ETag"] = entry["etag"]
+        response["Cache-Control"] = "private, max-age=0, must-revalidate"
+        return response
+
+
+class WeatherAlertListView(
+    ConditionalGetMixin, ReplicaReadMixin, EagerLoadingViewMixin, generics.ListAPIView
+):
+    """
+    GET /api/weather/alerts/?hours=24
+    즐겨찾기한 위치들의 최근 날씨 알림 (비 시작 / 기온 급강하)
+    """
+
+    serializer_class = WeatherAlertSerializer
+    permission_classes = [IsAuthenticated]
+    # 즐겨찾기 / 새 알림이 없으면 304, 기간 밖으로 밀려나는 알림을 위해 10분마다 ETag 변경
+    conditional_user_scopes = ("favorites",)
+    conditional_global_scopes = ("weather_alerts",)
+    conditional_period = 600
+
+    def get_queryset(self):
+        try:
+            hours = int(self.request.query_params.get("hours", 24))
+        except ValueError:
+            hours = 24
+        hours = min(max(hours, 1), ALERT_LIST_MAX_HOURS)
+        return WeatherAlert.objects.filter(
+            location__in=FavoriteLocation.objects.filter(user=self.request.user).values(
+                "location"
+            ),
+            created_at__gte=timezone.now() - timedelta(hours=hours),
+        ).order_by("-created_at")
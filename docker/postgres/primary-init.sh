@@ -0,0 +1,9 @@
+#!/bin/sh
+# primary 최초 초기화 시 1회 실행 - 스트리밍 복제용 계정 / 접속 허용 추가
+set -e
+
+psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-SQL
+    CREATE ROLE replicator WITH REPLICATION LOGIN PASSWORD '${POSTGRES_REPLICATION_PASSWORD:-replicator}';
+SQL
+
+echo "host replication replicator all scram-sha-256" >> "$PGDATA/pg_hba.conf"
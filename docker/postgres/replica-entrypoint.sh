@@ -0,0 +1,14 @@
+#!/bin/sh
+# 읽기 전용 replica - 데이터 디렉터리가 비어 있으면 primary 에서 베이스 백업 후 standby 로 기동
+set -e
+
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_isready -h "$PRIMARY_HOST" -p 5432; do
+        sleep 1
+    done
+    export PGPASSWORD="${POSTGRES_REPLICATION_PASSWORD:-replicator}"
+    pg_basebackup -h "$PRIMARY_HOST" -p 5432 -U replicator -D "$PGDATA" -R -X stream
+    chmod 0700 "$PGDATA"
+fi
+
+exec postgres -c hot_standby=on
@@ -0,0 +1,21 @@
+"""
+gunicorn 설정 - SERVER_MODE 로 실행 방식 선택
+- asgi (기본): uvicorn 워커, async 뷰(채팅 / 소셜 로그인 / 추천 / 예보)가 외부 응답을 기다리는 동안 같은 워커가 다른 요청 처리
+- wsgi: 기존 sync 워커 (async 뷰는 요청마다 이벤트 루프를 만들어 실행)
+(gunicorn.conf.py 이름이면 gunicorn 이 현재 디렉터리에서 자동으로 읽어 CLI 로 지정한 WSGI 앱에도
+ uvicorn 워커가 적용되므로, --config 로 명시할 때만 쓰이도록 다른 이름 사용)
+"""
+
+import os
+
+SERVER_MODE = os.getenv("SERVER_MODE", "asgi")
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "3"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+
+if SERVER_MODE == "wsgi":
+    wsgi_app = "apps.wsgi:application"
+else:
+    wsgi_app = "apps.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"